@@ -1,24 +1,101 @@
+import asyncio
 import logging
+from pathlib import Path
+
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 import homeassistant.helpers.device_registry as dr
 
 from .comfoclime_api import ComfoClimeAPI
 from .coordinator import (
     ComfoClimeDashboardCoordinator,
+    ComfoClimePropertyCoordinator,
+    ComfoClimeTelemetryCoordinator,
     ComfoClimeThermalprofileCoordinator,
 )
+from .history import ValueHistory, parse_windows
+from .request_scheduler import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    THROTTLE_REQUEST_INTERVAL,
+    DomainScheduler,
+)
+from .scanner import (
+    DEFAULT_MAX_PROPERTY,
+    DEFAULT_PROPERTY_SUBUNITS,
+    DEFAULT_PROPERTY_UNITS,
+    DEFAULT_SCAN_CONCURRENCY,
+    DEFAULT_TELEMETRY_RANGES,
+    async_scan_devices,
+    known_registers,
+    parse_ranges,
+    property_candidates,
+    render_definitions,
+    telemetry_candidates,
+)
+from .topology import TopologyCache, find_main_device, topology_signature
 
 DOMAIN = "comfoclime"
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# Schlüssel des DomainSchedulers in hass.data[DOMAIN], neben den Entry-IDs
+DOMAIN_SCHEDULER = "domain_scheduler"
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _telemetry_ranges(value: str) -> list[tuple[int, int]]:
+    try:
+        ranges = parse_ranges(value)
+    except ValueError:
+        ranges = None
+    if not ranges or any(start < 0 or start > end for start, end in ranges):
+        raise vol.Invalid(f"Ungültige Telemetrie-Bereiche: {value}")
+    return ranges
+
+
+def _units(value: str) -> list[int]:
+    try:
+        units = [int(unit) for unit in value.split(",") if unit.strip()]
+    except ValueError:
+        units = None
+    if not units or any(not 0 <= unit <= 255 for unit in units):
+        raise vol.Invalid(f"Ungültige RMI-Units: {value}")
+    return units
+
+
+# Wie in services.yaml, Bereiche und Units werden schon hier geparst
+SCAN_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("device_id"): cv.string,
+        vol.Optional("telemetry_ranges"): vol.All(cv.string, _telemetry_ranges),
+        vol.Optional("units"): vol.All(cv.string, _units),
+        vol.Optional("max_property", default=DEFAULT_MAX_PROPERTY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=255)
+        ),
+        vol.Optional("concurrency", default=DEFAULT_SCAN_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=8)
+        ),
+        vol.Optional("include_known", default=False): cv.boolean,
+    }
+)
+
+# Wartezeit zwischen Versuchen, die gespeicherte Topologie zu prüfen
+TOPOLOGY_RETRY_DELAY = 30
+TOPOLOGY_RETRY_MAX_DELAY = 600
+
+
 async def async_setup(hass: HomeAssistant, config: dict):
     return True  # wir nutzen keine YAML-Konfiguration mehr
 
@@ -26,27 +103,123 @@ async def async_setup(hass: HomeAssistant, config: dict):
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = entry.data
+    domain_scheduler = hass.data[DOMAIN].setdefault(
+        DOMAIN_SCHEDULER, DomainScheduler()
+    )
     host = entry.data["host"]
-    api = ComfoClimeAPI(f"http://{host}", hass=hass, entry=entry)
+    api = ComfoClimeAPI(
+        f"http://{host}",
+        hass=hass,
+        entry=entry,
+        session=async_create_clientsession(hass),
+        max_concurrent_requests=entry.options.get(
+            "max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS
+        ),
+        request_interval=(
+            THROTTLE_REQUEST_INTERVAL
+            if entry.options.get("throttle_comfonet", False)
+            else 0.0
+        ),
+        budget=domain_scheduler.budget,
+    )
     # Dashboard-Coordinator erstellen
-    dashboard_coordinator = ComfoClimeDashboardCoordinator(hass, api)
-    await dashboard_coordinator.async_config_entry_first_refresh()
-    thermalprofile_coordinator = ComfoClimeThermalprofileCoordinator(hass, api)
-    await thermalprofile_coordinator.async_config_entry_first_refresh()
-    devices = await api.async_get_connected_devices(hass)
+    frequent_updates = entry.options.get("enable_frequent_updates", False)
+    dashboard_coordinator = ComfoClimeDashboardCoordinator(
+        hass, api, frequent_updates
+    )
+    thermalprofile_coordinator = ComfoClimeThermalprofileCoordinator(
+        hass, api, frequent_updates
+    )
+    # Telemetrie-Werte und Property-Pfade werden von den Plattformen registriert
+    # und gesammelt abgefragt
+    telemetry_coordinator = ComfoClimeTelemetryCoordinator(hass, api)
+    property_coordinator = ComfoClimePropertyCoordinator(hass, api)
+    # Kurzzeitverlauf für die Trend-Attribute, nur im Speicher
+    history_windows = parse_windows(entry.options.get("history_windows"))
+    dashboard_coordinator.history = ValueHistory(history_windows)
+    telemetry_coordinator.history = ValueHistory(history_windows)
+    coordinators = (
+        dashboard_coordinator,
+        thermalprofile_coordinator,
+        telemetry_coordinator,
+        property_coordinator,
+    )
+    # Jeder Coordinator, auch über mehrere Geräte hinweg, fragt mit eigener
+    # Phase ab statt alle im selben Moment
+    phases = domain_scheduler.register(entry.entry_id, len(coordinators))
+    for coordinator, phase in zip(coordinators, phases):
+        coordinator.phase = phase
+    topology_cache = TopologyCache(hass, entry.entry_id)
+    topology = await topology_cache.async_load()
+    try:
+        if topology:
+            # Entities aus der gespeicherten Topologie anlegen, ein langsames
+            # oder neu startendes Gerät hält das Setup nicht auf
+            api.uuid = topology["uuid"]
+            devices = topology["devices"]
+        else:
+            # Bootstrap: die UUID wird für alle /system-Pfade gebraucht, danach
+            # Dashboard, Thermalprofil und Geräteliste parallel laden
+            await api.async_get_uuid()
+            devices, _, _ = await asyncio.gather(
+                api.async_get_connected_devices(),
+                dashboard_coordinator.async_config_entry_first_refresh(),
+                thermalprofile_coordinator.async_config_entry_first_refresh(),
+            )
+            await topology_cache.async_save(api.uuid, devices)
+    except Exception:
+        # Session nicht offen lassen, HA versucht das Setup erneut
+        domain_scheduler.unregister(entry.entry_id)
+        await api.async_close()
+        raise
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "coordinator": dashboard_coordinator,
         "tpcoordinator": thermalprofile_coordinator,
+        "telemetry_coordinator": telemetry_coordinator,
+        "property_coordinator": property_coordinator,
         "devices": devices,
-        "main_device": next((d for d in devices if d.get("modelTypeId") == 20), None),
+        "main_device": find_main_device(devices),
     }
 
+    @callback
+    def _async_circuit_changed(is_open: bool):
+        for coordinator in coordinators:
+            if is_open:
+                # Alle Entitäten sofort unavailable, nicht erst beim nächsten Poll;
+                # ohne Daten (Start offline) sind sie es schon
+                coordinator.last_update_success = False
+                if coordinator.data is not None:
+                    coordinator.async_update_listeners()
+            elif not coordinator.last_update_success:
+                hass.async_create_task(coordinator.async_request_refresh())
+
+    entry.async_on_unload(api.circuit.add_listener(_async_circuit_changed))
+
     await hass.config_entries.async_forward_entry_setups(
         entry, ["sensor", "switch", "number", "select", "fan", "climate"]
     )
+    if topology:
+        # Erste Abfragen im Hintergrund, ein hängendes Gerät verzögert das
+        # Setup nicht; bis dahin haben die Entitäten noch keine Daten
+        entry.async_create_background_task(
+            hass,
+            _async_first_refresh(coordinators),
+            "comfoclime first refresh",
+        )
+        entry.async_create_background_task(
+            hass,
+            _async_revalidate_topology(hass, entry, api, topology_cache, topology),
+            "comfoclime topology revalidation",
+        )
+    else:
+        # Erst jetzt sind alle Telemetrie-IDs und Property-Pfade registriert
+        await asyncio.gather(
+            telemetry_coordinator.async_refresh(),
+            property_coordinator.async_refresh(),
+        )
 
     async def handle_set_property_service(call: ServiceCall):
         device_id = call.data["device_id"]
@@ -65,11 +238,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             _LOGGER.error(f"Gerät gehört nicht zur Integration {DOMAIN}")
             return
         try:
-            await api.async_set_property_for_device(
-                hass,
-                device_uuid=device_uuid,
-                property_path=path,
-                value=value,
+            await property_coordinator.async_set_property(
+                device_uuid,
+                path,
+                value,
                 byte_count=byte_count,
                 signed=signed,
                 faktor=faktor,
@@ -81,14 +253,70 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     async def handle_reset_system_service(call: ServiceCall):
         try:
-            await api.async_reset_system(hass)
+            await api.async_reset_system()
             _LOGGER.info("ComfoClime Neustart ausgelöst")
         except Exception as e:
             _LOGGER.error(f"Fehler beim Neustart des Geräts: {e}")
             raise HomeAssistantError(f"Fehler beim Neustart des Geräts: {e}")
 
+    async def handle_scan_service(call: ServiceCall) -> ServiceResponse:
+        devices = hass.data[DOMAIN][entry.entry_id]["devices"]
+        if device_id := call.data.get("device_id"):
+            device = dr.async_get(hass).async_get(device_id)
+            if device is None:
+                raise HomeAssistantError(f"Gerät {device_id} nicht gefunden")
+            uuids = {uuid for domain, uuid in device.identifiers if domain == DOMAIN}
+            devices = [d for d in devices if d.get("uuid") in uuids]
+            if not devices:
+                raise HomeAssistantError(
+                    f"Gerät {device_id} gehört nicht zu diesem ComfoClime"
+                )
+
+        telemetry_ids = telemetry_candidates(
+            call.data.get("telemetry_ranges", DEFAULT_TELEMETRY_RANGES)
+        )
+        property_paths = property_candidates(
+            call.data.get("units", DEFAULT_PROPERTY_UNITS),
+            DEFAULT_PROPERTY_SUBUNITS,
+            call.data["max_property"],
+        )
+        try:
+            scans = await async_scan_devices(
+                api,
+                devices,
+                telemetry_ids,
+                property_paths,
+                concurrency=call.data["concurrency"],
+            )
+        except Exception as e:
+            raise HomeAssistantError(f"Scan abgebrochen: {e}")
+
+        known = None if call.data["include_known"] else known_registers()
+        path = hass.config.path(f"comfoclime_scan_{entry.entry_id}.py")
+        await hass.async_add_executor_job(
+            Path(path).write_text, render_definitions(scans, known)
+        )
+        _LOGGER.info(f"Scan-Ergebnis gespeichert in {path}")
+        return {
+            "file": path,
+            "models": {
+                str(model_id): {
+                    "telemetry": sorted(scan["telemetry"]),
+                    "properties": sorted(scan["properties"]),
+                }
+                for model_id, scan in scans.items()
+            },
+        }
+
     hass.services.async_register(DOMAIN, "set_property", handle_set_property_service)
     hass.services.async_register(DOMAIN, "reset_system", handle_reset_system_service)
+    hass.services.async_register(
+        DOMAIN,
+        "scan",
+        handle_scan_service,
+        schema=SCAN_SERVICE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     return True
 
 
@@ -99,10 +327,48 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     await hass.config_entries.async_forward_entry_unload(entry, "select")
     await hass.config_entries.async_forward_entry_unload(entry, "fan")
     await hass.config_entries.async_forward_entry_unload(entry, "climate")
-    hass.data[DOMAIN].pop(entry.entry_id)
+    data = hass.data[DOMAIN].pop(entry.entry_id)
+    domain_scheduler = hass.data[DOMAIN][DOMAIN_SCHEDULER]
+    domain_scheduler.unregister(entry.entry_id)
+    if not domain_scheduler:
+        hass.data[DOMAIN].pop(DOMAIN_SCHEDULER)
+    await data["api"].async_close()
     return True
 
 
+async def _async_first_refresh(coordinators):
+    """Run the first refresh of all coordinators after a setup from the cache."""
+    await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+
+async def _async_revalidate_topology(hass, entry, api, topology_cache, topology):
+    """Compare the cached topology with the device and reload if it changed."""
+    delay = TOPOLOGY_RETRY_DELAY
+    while True:
+        try:
+            uuid = await api.async_get_uuid()
+            devices = await api.async_get_connected_devices()
+            break
+        except Exception as e:
+            _LOGGER.debug(
+                f"Topologie konnte nicht geprüft werden, neuer Versuch in {delay}s: {e}"
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, TOPOLOGY_RETRY_MAX_DELAY)
+
+    if topology_signature(uuid, devices) == topology_signature(
+        topology["uuid"], topology["devices"]
+    ):
+        return
+    _LOGGER.info("Geräte-Topologie hat sich geändert, Integration wird neu geladen")
+    await topology_cache.async_save(uuid, devices)
+    hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    await TopologyCache(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass, entry):
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
@@ -0,0 +1,119 @@
+"""Shared health state of the connection to a ComfoClime device."""
+
+import logging
+import time
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+# Aufeinanderfolgende Verbindungsfehler, nach denen der Circuit öffnet
+DEFAULT_FAILURE_THRESHOLD = 3
+# Wartezeit bis zum ersten Ping bei offenem Circuit, verdoppelt sich je Fehlschlag
+DEFAULT_PROBE_INTERVAL = 10.0
+DEFAULT_MAX_PROBE_INTERVAL = 300.0
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """Raised instead of sending a request while the device is unreachable."""
+
+
+class CircuitBreaker:
+    """Track consecutive connection failures and block requests when open.
+
+    The circuit opens after ``failure_threshold`` consecutive failures. While
+    open, requests fail immediately with CircuitOpenError; a single probe is
+    allowed once ``probe_due`` is true. Every failed probe doubles the wait up
+    to ``max_probe_interval``, the first success closes the circuit again.
+    Listeners are called with ``True`` on opening and ``False`` on closing.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        probe_interval: float = DEFAULT_PROBE_INTERVAL,
+        max_probe_interval: float = DEFAULT_MAX_PROBE_INTERVAL,
+        clock=time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.max_probe_interval = max_probe_interval
+        self._clock = clock
+        self.failures = 0
+        self.is_open = False
+        self.opened_at = None
+        self.probes = 0
+        self._backoff = probe_interval
+        self._next_probe = 0.0
+        self._listeners = []
+
+    @property
+    def probe_due(self) -> bool:
+        return self.is_open and self._clock() >= self._next_probe
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe, 0 while closed."""
+        if not self.is_open:
+            return 0.0
+        return max(0.0, self._next_probe - self._clock())
+
+    def add_listener(self, listener):
+        """Register ``listener(is_open)`` and return a callable removing it."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def record_success(self):
+        self.failures = 0
+        if not self.is_open:
+            return
+        _LOGGER.info(
+            f"ComfoClime wieder erreichbar nach {self._clock() - self.opened_at:.0f}s"
+        )
+        self.is_open = False
+        self.opened_at = None
+        self.probes = 0
+        self._backoff = self.probe_interval
+        self._notify()
+
+    def record_failure(self, probe: bool = False):
+        """Count a connection failure; ``probe`` marks the ping of an open circuit."""
+        self.failures += 1
+        if self.is_open:
+            if not probe:
+                # Nachzügler, die vor dem Öffnen gesendet wurden
+                return
+            # Fehlgeschlagener Ping: länger warten bis zum nächsten Versuch
+            self.probes += 1
+            self._backoff = min(self._backoff * 2, self.max_probe_interval)
+            self._next_probe = self._clock() + self._backoff
+            _LOGGER.debug(
+                f"ComfoClime weiterhin nicht erreichbar, Ping in {self._backoff:.0f}s"
+            )
+            return
+        if self.failures < self.failure_threshold:
+            return
+        _LOGGER.warning(
+            f"ComfoClime nach {self.failures} Fehlern nicht erreichbar, "
+            f"Abfragen pausiert bis zur nächsten Antwort auf /monitoring/ping"
+        )
+        self.is_open = True
+        self.opened_at = self._clock()
+        self._backoff = self.probe_interval
+        self._next_probe = self.opened_at + self._backoff
+        self._notify()
+
+    def _notify(self):
+        for listener in list(self._listeners):
+            try:
+                listener(self.is_open)
+            except Exception:
+                _LOGGER.exception("Fehler in Circuit-Listener")
+
+    def as_dict(self) -> dict:
+        return {
+            "open": self.is_open,
+            "failures": self.failures,
+            "probes": self.probes,
+            "retry_in": self.retry_in,
+        }
@@ -363,20 +363,6 @@ class ComfoClimeClimate(
                 return season
         return 0
 
-    async def _async_refresh_coordinators(self) -> None:
-        """Refresh both dashboard and thermal profile coordinators.
-
-        Schedules non-blocking refresh of both coordinators to prevent blocking
-        user interactions. The coordinators will update in the background and
-        trigger entity updates via their listeners when ready.
-        """
-        # Schedule non-blocking refresh for both coordinators
-        # This prevents the UI from becoming unresponsive while waiting for updates
-        self.hass.async_create_task(self.coordinator.async_request_refresh())
-        self.hass.async_create_task(
-            self._thermalprofile_coordinator.async_request_refresh()
-        )
-
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature via dashboard API in manual mode.
 
@@ -400,9 +386,12 @@ class ComfoClimeClimate(
                 set_point_temperature=temperature,
                 status=0,
             )
-
-            # Schedule non-blocking refresh of coordinators
-            await self._async_refresh_coordinators()
+            # target_temperature kommt aus dem Thermalprofil, das der Dashboard-
+            # Sollwert am Gerät mit ändert; ohne Write-through bliebe die Anzeige
+            # bis zur nächsten (seltenen) Thermalprofil-Abfrage alt
+            self._thermalprofile_coordinator.async_write_through(
+                {"temperature": {"status": 0, "manualTemperature": temperature}}
+            )
 
         except Exception:
             _LOGGER.exception(f"Failed to set temperature to {temperature}")
@@ -410,15 +399,16 @@ class ComfoClimeClimate(
     async def async_update_dashboard(self, **kwargs) -> None:
         """Update dashboard settings via API.
 
-        Wrapper method that delegates to the API's update_dashboard method.
-        This ensures all dashboard updates go through the centralized API method.
+        Wrapper method that delegates to the dashboard coordinator, which writes
+        through the centralized API method and applies the written fields to
+        its cached data, so the entity updates without waiting for a refresh.
 
         Args:
             **kwargs: Dashboard fields to update (set_point_temperature, fan_speed,
                      season, hp_standby, schedule, temperature_profile,
                      season_profile, status)
         """
-        await self._api.async_update_dashboard(self.hass, **kwargs)
+        await self.coordinator.async_update_dashboard(**kwargs)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode by updating season via thermal profile API.
@@ -448,12 +438,14 @@ class ComfoClimeClimate(
                     f"Setting HVAC mode to {hvac_mode} - "
                     f"atomically setting season={season_value} and hpStandby=False"
                 )
-                await self._api.async_set_hvac_season(
-                    self.hass, season=season_value, hp_standby=False
+                # Like ComfoClimeAPI.async_set_hvac_season, but through the
+                # coordinators so both caches reflect the change immediately
+                await self.async_update_dashboard(hp_standby=False)
+                await self._thermalprofile_coordinator.async_update_thermal_profile(
+                    {"season": {"season": season_value}}
                 )
-
-            # Schedule non-blocking refresh of coordinators
-            await self._async_refresh_coordinators()
+                # Die effektive Saison im Dashboard folgt dem Thermalprofil
+                self.coordinator.async_write_through({"season": season_value})
 
         except Exception:
             _LOGGER.exception(f"Failed to set HVAC mode {hvac_mode}")
@@ -475,9 +467,6 @@ class ComfoClimeClimate(
                 # Set status=0 to activate manual mode
                 # setPointTemperature should be set separately via async_set_temperature
                 await self.async_update_dashboard(status=0)
-
-                # Schedule non-blocking refresh of coordinators
-                await self._async_refresh_coordinators()
                 return
 
             # Automatic mode with preset profile
@@ -502,9 +491,6 @@ class ComfoClimeClimate(
                 status=1,
             )
 
-            # Schedule non-blocking refresh of coordinators
-            await self._async_refresh_coordinators()
-
         except Exception:
             _LOGGER.exception(f"Failed to set preset mode {preset_mode}")
 
@@ -528,9 +514,6 @@ class ComfoClimeClimate(
             # Update fan speed via dashboard API
             await self.async_update_dashboard(fan_speed=fan_speed)
 
-            # Schedule non-blocking refresh of coordinators
-            await self._async_refresh_coordinators()
-
         except Exception:
             _LOGGER.exception(f"Failed to set fan mode {fan_mode}")
 
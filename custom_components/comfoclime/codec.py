@@ -0,0 +1,144 @@
+"""Precompiled decoders for ComfoNet telemetry (PDO) and property (RMI) values.
+
+A Codec is built once per value definition and caches its ``struct.Struct``,
+so a read only unpacks bytes and applies the factor.
+"""
+
+import functools
+import struct
+
+# PDO-Datentypen laut ComfoClimeAPI.md
+CN_BOOL = "BOOL"
+CN_UINT8 = "UINT8"
+CN_UINT16 = "UINT16"
+CN_UINT32 = "UINT32"
+CN_INT8 = "INT8"
+CN_INT16 = "INT16"
+CN_INT64 = "INT64"
+CN_STRING = "STRING"
+
+PDO_TYPE_IDS = {
+    0: CN_BOOL,
+    1: CN_UINT8,
+    2: CN_UINT16,
+    3: CN_UINT32,
+    5: CN_INT8,
+    6: CN_INT16,
+    8: CN_INT64,
+    9: CN_STRING,
+}
+
+_FORMATS = {
+    CN_BOOL: "<?",
+    CN_UINT8: "<B",
+    CN_UINT16: "<H",
+    CN_UINT32: "<I",
+    CN_INT8: "<b",
+    CN_INT16: "<h",
+    CN_INT64: "<q",
+}
+
+# (byte_count, signed) -> Typ, für Definitionen ohne "type"; längere Werte
+# sind wie bisher Strings, Zahlen nur mit explizitem "type"
+_INTEGER_TYPES = {
+    (1, False): CN_UINT8,
+    (1, True): CN_INT8,
+    (2, False): CN_UINT16,
+    (2, True): CN_INT16,
+}
+
+
+class Codec:
+    """Decode and encode the raw bytes of one value type with a factor."""
+
+    __slots__ = ("value_type", "faktor", "size", "_struct", "_unpack", "_scaled")
+
+    def __init__(self, value_type: str, faktor: float = 1.0):
+        if value_type != CN_STRING and value_type not in _FORMATS:
+            raise ValueError(f"Unbekannter Datentyp: {value_type}")
+        self.value_type = value_type
+        self.faktor = faktor
+        self._struct = (
+            struct.Struct(_FORMATS[value_type]) if value_type in _FORMATS else None
+        )
+        self.size = self._struct.size if self._struct else None
+        self._unpack = self._struct.unpack_from if self._struct else None
+        self._scaled = value_type not in (CN_BOOL, CN_STRING)
+
+    def __repr__(self):
+        return f"Codec({self.value_type}, faktor={self.faktor})"
+
+    def decode_raw(self, data: list):
+        """Return the unscaled value of ``data`` (list of bytes, little endian).
+
+        Raises:
+            ValueError: If ``data`` is shorter than the type
+        """
+        if self._unpack is None:
+            return bytes(data).replace(b"\0", b"").decode("latin-1")
+        try:
+            return self._unpack(bytes(data))[0]
+        except (struct.error, TypeError, ValueError) as e:
+            raise ValueError(f"Ungültige Daten für {self.value_type}: {data}") from e
+
+    def decode(self, data: list):
+        """Return the value of ``data`` multiplied by the factor."""
+        if self._scaled:
+            try:
+                return self._unpack(bytes(data))[0] * self.faktor
+            except (struct.error, TypeError, ValueError):
+                pass
+        return self.decode_raw(data)
+
+    def encode_raw(self, value) -> list:
+        """Return the bytes of an unscaled value."""
+        if self._struct is None:
+            return list(str(value).encode("latin-1"))
+        return list(self._struct.pack(value))
+
+    def encode(self, value) -> list:
+        """Return the bytes to write for ``value`` (divided by the factor)."""
+        if not self._scaled:
+            return self.encode_raw(value)
+        return self.encode_raw(int(round(value / self.faktor)))
+
+
+def get_codec(value_type: str, faktor: float = 1.0) -> Codec:
+    """Return the shared codec for a PDO type name (e.g. "INT16") or type id."""
+    if isinstance(value_type, int):
+        value_type = PDO_TYPE_IDS[value_type]
+    # 1 und 1.0 sind im Cache derselbe Schlüssel, daher immer float: sonst
+    # entschiede der erste Aufruf, ob die Werte int oder float sind
+    return _get_codec(value_type, float(faktor))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_codec(value_type: str, faktor: float) -> Codec:
+    return Codec(value_type, faktor)
+
+
+def codec_for(
+    byte_count: int, signed: bool = True, faktor: float = 1.0, value_type=None
+) -> Codec:
+    """Return the codec for a value definition.
+
+    An explicit ``value_type`` wins, otherwise the type follows from
+    ``byte_count`` and ``signed``. Other lengths (more than two bytes) are
+    strings, as in ``read_property_for_device``.
+    """
+    return _codec_for(byte_count, bool(signed), float(faktor), value_type)
+
+
+@functools.lru_cache(maxsize=None)
+def _codec_for(byte_count, signed: bool, faktor: float, value_type) -> Codec:
+    if value_type is not None:
+        return get_codec(value_type, faktor)
+    return get_codec(_INTEGER_TYPES.get((byte_count, signed), CN_STRING), faktor)
+
+
+def fix_signed_temperature(api_value: float) -> float:
+    """Interpret a dashboard temperature as signed 16-bit value (scaled by 10)."""
+    raw_value = int(api_value * 10) & 0xFFFF
+    if raw_value >= 0x8000:
+        raw_value -= 0x10000
+    return raw_value / 10.0
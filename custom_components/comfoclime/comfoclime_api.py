@@ -1,22 +1,207 @@
 # comfoclime_api.py
 import asyncio
+import contextlib
+import json
 import logging
+import struct
 import time
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-import requests
+import aiohttp
+
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .codec import codec_for, fix_signed_temperature
+from .request_scheduler import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    PRIORITY_CONTROL,
+    PRIORITY_READ,
+    PRIORITY_WRITE,
+    AimdTuner,
+    RequestScheduler,
+)
+from .request_stats import RequestStats, endpoint_name
+from .stream import async_stream
 
 _LOGGER = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=5)
+# Zeitfenster, in dem Teil-Updates zu einem PUT zusammengefasst werden
+WRITE_COALESCE_WINDOW = 0.3
+
+
+def deep_merge(target: dict, updates: dict) -> dict:
+    """Merge nested ``updates`` into ``target``; None means "unchanged"."""
+    for key, value in updates.items():
+        if isinstance(value, dict):
+            section = target.get(key)
+            if not isinstance(section, dict):
+                section = target[key] = {}
+            deep_merge(section, value)
+        elif value is not None:
+            target[key] = value
+    return target
+
+
+# Modus-Felder, deren Reihenfolge zählt: ein anderer Wert für ein solches
+# Feld im offenen Fenster wird als eigener Write gesendet statt überschrieben
+DASHBOARD_INTENT_FIELDS = frozenset(
+    {
+        ("status",),
+        ("season",),
+        ("temperature_profile",),
+        ("season_profile",),
+        ("hp_standby",),
+    }
+)
+THERMAL_PROFILE_INTENT_FIELDS = frozenset(
+    {
+        ("season", "status"),
+        ("season", "season"),
+        ("temperature", "status"),
+        ("temperatureProfile",),
+    }
+)
+
+
+def conflicts(target: dict, updates: dict, fields, path: tuple = ()) -> bool:
+    """Return True if ``updates`` would change one of ``fields`` already set in ``target``.
+
+    ``fields`` holds key paths into the nested dicts; all other values are
+    simply overwritten by the latest update.
+    """
+    for key, value in updates.items():
+        if key not in target or value is None:
+            continue
+        key_path = (*path, key)
+        if isinstance(value, dict) and isinstance(target[key], dict):
+            if conflicts(target[key], value, fields, key_path):
+                return True
+        elif key_path in fields and target[key] != value:
+            return True
+    return False
+
+
+class _WriteCoalescer:
+    """Merge partial updates that arrive within a short window into one write.
+
+    The first update opens the window. All updates submitted until it closes
+    are deep-merged, sent with a single call to ``send`` and every caller
+    receives the result (or exception) of that call. For most fields the
+    latest value wins, so a slider or step burst becomes one write. An update
+    that would change a pending field listed in ``intent_fields`` (e.g.
+    ``status`` automatic vs. manual) closes the window early and opens a new
+    one, so no write mixes two intents; the writes are sent in submission
+    order.
+    """
+
+    def __init__(
+        self, send, intent_fields=frozenset(), window: float = WRITE_COALESCE_WINDOW
+    ):
+        self._send = send
+        self._intent_fields = intent_fields
+        self._window = window
+        self._pending = None
+        self._future = None
+        self._flush_now = None
+        self._flush_task = None
+
+    async def async_submit(self, updates: dict):
+        if self._pending is not None and conflicts(
+            self._pending, updates, self._intent_fields
+        ):
+            self._flush_now.set()
+            self._detach(self._future)
+        if self._pending is None:
+            loop = asyncio.get_running_loop()
+            self._pending = {}
+            self._future = loop.create_future()
+            # Exception als abgerufen markieren, falls kein Aufrufer mehr wartet
+            self._future.add_done_callback(
+                lambda future: future.cancelled() or future.exception()
+            )
+            self._flush_now = asyncio.Event()
+            self._flush_task = loop.create_task(
+                self._async_flush(
+                    self._pending, self._future, self._flush_now, self._flush_task
+                )
+            )
+        deep_merge(self._pending, updates)
+        return await asyncio.shield(self._future)
+
+    def _detach(self, future):
+        """Close the window of ``future`` for new updates."""
+        if self._future is future:
+            self._pending = self._future = self._flush_now = None
+
+    async def _async_flush(self, pending, future, flush_now, previous):
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(flush_now.wait(), self._window)
+            self._detach(future)
+            if previous is not None:
+                # Vorheriger Write zuerst, damit die Reihenfolge erhalten bleibt
+                await asyncio.wait((previous,))
+            result = await self._send(pending)
+        except Exception as err:
+            future.set_exception(err)
+        except BaseException as err:
+            # Abbruch (z. B. beim Entladen): wartende Aufrufer nicht hängen lassen
+            self._detach(future)
+            if not future.done():
+                if isinstance(err, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+
 
 class ComfoClimeAPI:
-    def __init__(self, base_url, hass=None, entry=None):
+    def __init__(
+        self,
+        base_url,
+        hass=None,
+        entry=None,
+        session=None,
+        max_concurrent_requests=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        request_interval=0.0,
+        budget: RequestScheduler | None = None,
+        time_zone: str | None = None,
+    ):
         self.hass = hass
+        # Zeitzone für den Zeitstempel von Dashboard-Updates, ohne Angabe die
+        # von Home Assistant bzw. ohne hass die lokale
+        self.time_zone = time_zone
         self.base_url = base_url.rstrip("/")
         self.uuid = None
-        self._request_lock = asyncio.Lock()
+        # Begrenzt parallele Requests, Schreibzugriffe haben Vorrang vor Polls
+        self._scheduler = RequestScheduler(max_concurrent_requests, request_interval)
+        # Passt Parallelität und Abstand an Antwortzeiten und Fehler an, die
+        # Optionen bilden Ober- bzw. Untergrenze
+        self.tuner = AimdTuner(
+            self._scheduler, max_concurrent_requests, request_interval
+        )
+        # Budget aller Config-Entries, siehe DomainScheduler
+        self._budget = budget
+        self.stats = RequestStats()
+        # Gemeinsamer Verbindungszustand aller Coordinatoren und Entitäten
+        self.circuit = CircuitBreaker()
+        self._probe_lock = asyncio.Lock()
+        # Laufende GET-Requests nach Pfad, gleichzeitige Aufrufer teilen sich das Ergebnis
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._dashboard_writes = _WriteCoalescer(
+            lambda updates: self._async_send_dashboard_update(**updates),
+            DASHBOARD_INTENT_FIELDS,
+        )
+        self._thermal_profile_writes = _WriteCoalescer(
+            self._async_send_thermal_profile_update, THERMAL_PROFILE_INTENT_FIELDS
+        )
         self.entry = entry
+        # Eine Keep-Alive-Session pro Config-Entry, von allen Plattformen geteilt
+        self._session: aiohttp.ClientSession | None = session
+        self._closed = False
 
     @staticmethod
     def bytes_to_signed_int(
@@ -43,7 +228,7 @@ class ComfoClimeAPI:
         if byte_count not in (1, 2):
             raise ValueError(f"Unsupported byte count: {byte_count}")
 
-        return int.from_bytes(data[:byte_count], byteorder="little", signed=signed)
+        return codec_for(byte_count, signed).decode_raw(data)
 
     @staticmethod
     def signed_int_to_bytes(
@@ -64,7 +249,10 @@ class ComfoClimeAPI:
         if byte_count not in (1, 2):
             raise ValueError(f"Unsupported byte count: {byte_count}")
 
-        return list(data.to_bytes(byte_count, byteorder="little", signed=signed))
+        try:
+            return codec_for(byte_count, signed).encode_raw(data)
+        except struct.error as e:
+            raise OverflowError(str(e)) from e
 
     @staticmethod
     def fix_signed_temperature(api_value: float) -> float:
@@ -79,170 +267,284 @@ class ComfoClimeAPI:
         Returns:
             Corrected temperature value
         """
-        raw_value = int(api_value * 10)
-        # Convert to signed 16-bit using Python's built-in byte conversion
-        unsigned_value = raw_value & 0xFFFF
-        bytes_data = ComfoClimeAPI.signed_int_to_bytes(unsigned_value, 2)
-        signed_value = ComfoClimeAPI.bytes_to_signed_int(bytes_data)
-        return signed_value / 10.0
-
-    async def async_get_uuid(self, hass):
-        async with self._request_lock:
-            return await hass.async_add_executor_job(self.get_uuid)
-
-    def get_uuid(self):
-        response = requests.get(f"{self.base_url}/monitoring/ping", timeout=5)
-        response.raise_for_status()
-        data = response.json()
-        self.uuid = data.get("uuid")
-        return self.uuid
+        return fix_signed_temperature(api_value)
+
+    async def _async_get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use.
+
+        After ``async_close`` or once an injected session was closed, requests
+        fail instead of opening a new, never closed session.
+        """
+        if self._closed or (self._session is not None and self._session.closed):
+            raise aiohttp.ClientConnectionError("ComfoClime-API bereits geschlossen")
+        if self._session is None:
+            self._session = aiohttp.ClientSession(timeout=REQUEST_TIMEOUT)
+        return self._session
+
+    async def async_close(self):
+        """Close the shared session and release its pooled connections."""
+        self._closed = True
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _async_request(
+        self, method: str, path: str, priority: int | None = None, **kwargs
+    ) -> str:
+        """Send a request over the shared session and return the response body.
+
+        The request waits for a scheduler slot first. Without an explicit
+        priority class, GET requests are queued as reads and all others as
+        writes. A GET that joins an identical request in flight keeps the
+        priority of the first caller.
+        Latency, slot wait, size and outcome are recorded in ``stats``.
+
+        Raises:
+            CircuitOpenError: If the device is considered unreachable
+            aiohttp.ClientError: If the request fails or returns an error status
+            TimeoutError: If the device does not answer within REQUEST_TIMEOUT
 
-    async def async_get_dashboard_data(self, hass):
-        async with self._request_lock:
-            return await hass.async_add_executor_job(self.get_dashboard_data)
+        Identical GET requests issued while one is still in flight do not
+        reach the device again; they wait for and share its response body.
+        """
+        if method != "GET" or kwargs:
+            return await self._async_request_once(method, path, priority, **kwargs)
 
-    def get_dashboard_data(self):
+        task = self._inflight.get(path)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._async_request_once(method, path, priority)
+            )
+            self._inflight[path] = task
+            task.add_done_callback(lambda done: self._request_done(path, done))
+        else:
+            self.stats.record_shared(method, path)
+        # Abbruch eines Aufrufers bricht den geteilten Request nicht ab
+        return await asyncio.shield(task)
+
+    def _request_done(self, path: str, task: asyncio.Task):
+        if self._inflight.get(path) is task:
+            del self._inflight[path]
+        # Exception abrufen, falls alle Aufrufer abgebrochen wurden
+        if not task.cancelled():
+            task.exception()
+
+    async def _async_request_once(
+        self, method: str, path: str, priority: int | None = None, **kwargs
+    ) -> str:
+        if self.circuit.is_open:
+            await self._async_probe()
+        return await self._async_send(method, path, priority, **kwargs)
+
+    async def _async_probe(self):
+        """Ping the device once the probe is due; raise while it stays offline."""
+        async with self._probe_lock:
+            if not self.circuit.is_open:
+                return
+            if not self.circuit.probe_due:
+                raise CircuitOpenError(
+                    f"ComfoClime nicht erreichbar, nächster Versuch in "
+                    f"{self.circuit.retry_in:.0f}s"
+                )
+            try:
+                await self._async_send(
+                    "GET", "/monitoring/ping", PRIORITY_WRITE, probe=True
+                )
+            except (TimeoutError, aiohttp.ClientError) as e:
+                raise CircuitOpenError(f"ComfoClime nicht erreichbar: {e}") from e
+
+    @contextlib.asynccontextmanager
+    async def _async_slot(self, priority: int):
+        # Erst der Slot des Geräts, damit wartende Polls eines Geräts keine
+        # Slots des gemeinsamen Budgets blockieren
+        async with self._scheduler.slot(priority):
+            if self._budget is None:
+                yield
+                return
+            async with self._budget.slot(priority):
+                yield
+
+    async def _async_send(
+        self,
+        method: str,
+        path: str,
+        priority: int | None = None,
+        *,
+        probe: bool = False,
+        **kwargs,
+    ) -> str:
+        if priority is None:
+            priority = PRIORITY_READ if method == "GET" else PRIORITY_WRITE
+        session = await self._async_get_session()
+        queued = time.monotonic()
+        async with self._async_slot(priority):
+            if self.circuit.is_open and not probe:
+                # Während des Wartens auf den Slot geöffnet: nicht mehr senden
+                raise CircuitOpenError("ComfoClime nicht erreichbar")
+            start = time.monotonic()
+            wait = start - queued
+            try:
+                async with session.request(
+                    method, f"{self.base_url}{path}", timeout=REQUEST_TIMEOUT, **kwargs
+                ) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+            except TimeoutError:
+                latency = time.monotonic() - start
+                self.stats.record(method, path, latency, wait=wait, timeout=True)
+                self.circuit.record_failure(probe)
+                if not probe:
+                    self.tuner.record(latency, ok=False)
+                raise
+            except aiohttp.ClientError as e:
+                latency = time.monotonic() - start
+                self.stats.record(method, path, latency, wait=wait, error=True)
+                # Eine Fehlerantwort kommt immerhin vom Gerät
+                if isinstance(e, aiohttp.ClientResponseError):
+                    self.circuit.record_success()
+                    # Nur 5xx deutet auf einen überlasteten Bus, 404 etc. nicht
+                    self.tuner.record(
+                        latency, e.status < 500, endpoint_name(method, path)
+                    )
+                else:
+                    # Nicht erreichbar statt überlastet: Sache des Circuit Breakers
+                    self.circuit.record_failure(probe)
+                raise
+            latency = time.monotonic() - start
+            self.stats.record(method, path, latency, wait=wait, size=len(body))
+            self.circuit.record_success()
+            self.tuner.record(latency, endpoint=endpoint_name(method, path))
+            return body.decode(response.get_encoding())
+
+    async def _async_get_json(self, path: str, priority: int | None = None):
+        return json.loads(await self._async_request("GET", path, priority))
+
+    async def _async_ensure_uuid(self):
         if not self.uuid:
-            self.get_uuid()
-        response = requests.get(
-            f"{self.base_url}/system/{self.uuid}/dashboard", timeout=5
+            await self.async_get_uuid()
+        return self.uuid
+
+    async def async_get_uuid(self):
+        data = await self._async_get_json("/monitoring/ping")
+        self.uuid = data.get("uuid")
+        return self.uuid
+
+    async def async_get_dashboard_data(self):
+        await self._async_ensure_uuid()
+        data = await self._async_get_json(
+            f"/system/{self.uuid}/dashboard", PRIORITY_CONTROL
         )
-        response.raise_for_status()
-        data = response.json()
 
         for key, val in data.items():
             if "Temperature" in key:
                 data[key] = self.fix_signed_temperature(data[key])
         return data
 
-    async def async_get_connected_devices(self, hass):
-        async with self._request_lock:
-            return await hass.async_add_executor_job(self.get_connected_devices)
-
-    def get_connected_devices(self):
-        if not self.uuid:
-            self.get_uuid()
-        url = f"{self.base_url}/system/{self.uuid}/devices"
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        return response.json().get("devices", [])
-
-    async def async_read_telemetry_for_device(
-        self, hass, device_uuid, telemetry_id, faktor=1.0, signed=True, byte_count=None
-    ):
-        async with self._request_lock:
-            return await hass.async_add_executor_job(
-                self.read_telemetry_for_device,
-                device_uuid,
-                telemetry_id,
-                faktor,
-                signed,
-                byte_count,
-            )
+    async def async_get_connected_devices(self):
+        await self._async_ensure_uuid()
+        data = await self._async_get_json(f"/system/{self.uuid}/devices")
+        return data.get("devices", [])
 
-    def read_telemetry_for_device(
-        self, device_uuid, telemetry_id, faktor=1.0, signed=True, byte_count=None
-    ):
-        url = f"{self.base_url}/device/{device_uuid}/telemetry/{telemetry_id}"
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        payload = response.json()
+    async def async_read_telemetry_raw(
+        self, device_uuid, telemetry_id, priority: int | None = None
+    ) -> list:
+        payload = await self._async_get_json(
+            f"/device/{device_uuid}/telemetry/{telemetry_id}", priority
+        )
 
         data = payload.get("data")
         if not isinstance(data, list) or len(data) == 0:
             raise ValueError("Unerwartetes Telemetrie-Format")
+        return data
 
-        value = self.bytes_to_signed_int(data, byte_count, signed)
-
-        if self.entry.options.get("throttle_comfonet", False):
-            time.sleep(0.01)
-        return value * faktor
-
-    async def async_read_property_for_device(
+    async def async_read_telemetry_for_device(
         self,
-        hass,
-        device_uuid: str,
-        property_path: str,
-        faktor: float = 1.0,
-        signed: bool = True,
-        byte_count: int | None = None,
+        device_uuid,
+        telemetry_id,
+        faktor=1.0,
+        signed=True,
+        byte_count=None,
+        value_type=None,
     ):
-        async with self._request_lock:
-            return await hass.async_add_executor_job(
-                self.read_property_for_device,
-                device_uuid,
-                property_path,
-                faktor,
-                signed,
-                byte_count,
-            )
+        data = await self.async_read_telemetry_raw(device_uuid, telemetry_id)
 
-    def read_property_for_device_raw(
-        self, device_uuid: str, property_path: str
-    ) -> None | list:
-        url = f"{self.base_url}/device/{device_uuid}/property/{property_path}"
-        try:
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            payload = response.json()
-        except Exception:
-            _LOGGER.exception(f"Fehler beim Abrufen der Property {property_path}")
-            return None
+        if value_type is None:
+            if byte_count is None:
+                byte_count = len(data)
+            if byte_count not in (1, 2):
+                raise ValueError(f"Unsupported byte count: {byte_count}")
+        return codec_for(byte_count, signed, faktor, value_type).decode(data)
+
+    async def async_read_property_data(
+        self, device_uuid: str, property_path: str, priority: int | None = None
+    ) -> list:
+        """Return the raw bytes of a property, raising on any error."""
+        payload = await self._async_get_json(
+            f"/device/{device_uuid}/property/{property_path}", priority
+        )
 
         data = payload.get("data")
         if not isinstance(data, list) or not data:
             raise ValueError("Unerwartetes Property-Format")
-        if self.entry.options.get("throttle_comfonet", False):
-            time.sleep(0.01)
         return data
 
-    def read_property_for_device(
+    async def async_read_property_for_device_raw(
+        self, device_uuid: str, property_path: str, priority: int | None = None
+    ) -> None | list:
+        try:
+            return await self.async_read_property_data(
+                device_uuid, property_path, priority
+            )
+        except (CircuitOpenError, ValueError):
+            raise
+        except Exception:
+            _LOGGER.exception(f"Fehler beim Abrufen der Property {property_path}")
+            return None
+
+    async def async_read_property_for_device(
         self,
         device_uuid: str,
         property_path: str,
         faktor: float = 1.0,
         signed: bool = True,
         byte_count: int | None = None,
+        value_type: str | None = None,
     ) -> None | str | float:
-        data = self.read_property_for_device_raw(device_uuid, property_path)
+        data = await self.async_read_property_for_device_raw(device_uuid, property_path)
 
         # Wenn data leer/None ist, können wir nicht fortfahren
         if not data:
             return None
 
-        if byte_count in (1, 2):
-            value = self.bytes_to_signed_int(data, byte_count, signed)
-        elif byte_count > 2:
+        if value_type is None and byte_count not in (1, 2):
+            if not byte_count or byte_count < 1:
+                raise ValueError(f"Nicht unterstützte Byte-Anzahl: {byte_count}")
             if len(data) != byte_count:
                 raise ValueError(
                     f"Unerwartete Byte-Anzahl: erwartet {byte_count}, erhalten {len(data)}"
                 )
-            if all(0 <= byte < 256 for byte in data):
-                return "".join(chr(byte) for byte in data if byte != 0)
-        else:
-            raise ValueError(f"Nicht unterstützte Byte-Anzahl: {byte_count}")
+        return codec_for(byte_count, signed, faktor, value_type).decode(data)
+
+    async def async_get_thermal_profile(self):
+        await self._async_ensure_uuid()
+        return await self._async_get_json(
+            f"/system/{self.uuid}/thermalprofile", PRIORITY_CONTROL
+        )
 
-        return value * faktor
+    async def async_update_thermal_profile(self, updates: dict):
+        """Queue a partial thermal profile update.
 
-    async def async_get_thermal_profile(self, hass):
-        async with self._request_lock:
-            return await hass.async_add_executor_job(self.get_thermal_profile)
+        Updates arriving within WRITE_COALESCE_WINDOW are deep-merged and sent
+        as a single PUT, the latest value wins. None values leave a field
+        unchanged. A different value for a mode field (season status/season,
+        temperature status, temperatureProfile) is sent as a separate PUT
+        after the pending one.
+        """
+        return await self._thermal_profile_writes.async_submit(updates)
 
-    def get_thermal_profile(self):
-        if not self.uuid:
-            self.get_uuid()
-        url = f"{self.base_url}/system/{self.uuid}/thermalprofile"
-        try:
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            _LOGGER.warning(f"Fehler beim Abrufen von thermal_profile: {e}")
-            return {}  # leer zurückgeben statt crashen
-
-    def update_thermal_profile(self, updates: dict):
+    async def _async_send_thermal_profile_update(self, updates: dict):
         """
-        updates: dict mit Teilwerten, z. B. {"heatingThermalProfileSeasonData": {"comfortTemperature": 20.0}}
+        updates: dict mit Teilwerten, z. B. {"heatingThermalProfileSeasonData": {"comfortTemperature": 20.0}}
 
         Diese Methode füllt alle anderen Felder mit None (null), wie von der API gefordert.
         """
@@ -275,17 +577,15 @@ class ComfoClimeAPI:
             if section in full_payload and isinstance(values, dict):
                 full_payload[section].update(values)
             else:
-                full_payload[section] = values  # z. B. "temperatureProfile": 1
+                full_payload[section] = values  # z. B. "temperatureProfile": 1
 
-        if not self.uuid:
-            self.get_uuid()
-
-        url = f"{self.base_url}/system/{self.uuid}/thermalprofile"
-        response = requests.put(url, json=full_payload, timeout=5)
-        response.raise_for_status()
-        return response.status_code == 200
+        await self._async_ensure_uuid()
+        await self._async_request(
+            "PUT", f"/system/{self.uuid}/thermalprofile", json=full_payload
+        )
+        return True
 
-    def update_dashboard(
+    async def async_update_dashboard(
         self,
         set_point_temperature: float | None = None,
         fan_speed: int | None = None,
@@ -299,7 +599,11 @@ class ComfoClimeAPI:
         """Update dashboard settings via API.
 
         Modern method for dashboard updates. Only fields that are provided
-        (not None) will be included in the update payload.
+        (not None) will be included in the update payload. Updates arriving
+        within WRITE_COALESCE_WINDOW are merged into a single PUT; for fields
+        set more than once, the latest value wins. A different value for a
+        mode field (status, season, temperature_profile, season_profile,
+        hp_standby) is sent as a separate PUT after the pending one.
 
         # Android app export from @msfuture
         payload = {
@@ -337,10 +641,41 @@ class ComfoClimeAPI:
             Response JSON from the API
 
         Raises:
-            requests.RequestException: If the API request fails
+            aiohttp.ClientError: If the API request fails
         """
-        if not self.uuid:
-            self.get_uuid()
+        updates = {
+            "set_point_temperature": set_point_temperature,
+            "fan_speed": fan_speed,
+            "season": season,
+            "hp_standby": hp_standby,
+            "schedule": schedule,
+            "temperature_profile": temperature_profile,
+            "season_profile": season_profile,
+            "status": status,
+        }
+        return await self._dashboard_writes.async_submit(
+            {key: value for key, value in updates.items() if value is not None}
+        )
+
+    def _tzinfo(self):
+        name = self.time_zone or (self.hass.config.time_zone if self.hass else None)
+        if name:
+            return ZoneInfo(name)
+        return datetime.now().astimezone().tzinfo
+
+    async def _async_send_dashboard_update(
+        self,
+        set_point_temperature: float | None = None,
+        fan_speed: int | None = None,
+        season: int | None = None,
+        hp_standby: bool | None = None,
+        schedule: int | None = None,
+        temperature_profile: int | None = None,
+        season_profile: int | None = None,
+        status: int | None = None,
+    ) -> dict:
+        """Send one dashboard PUT with the given fields."""
+        await self._async_ensure_uuid()
 
         # Dynamically build payload; only include keys explicitly provided.
         # payload: dict = {}
@@ -384,84 +719,43 @@ class ComfoClimeAPI:
             return {}
 
         # Add timestamp to payload
-        tz = ZoneInfo(self.hass.config.time_zone)
-        payload["timestamp"] = datetime.now(tz).isoformat()
+        payload["timestamp"] = datetime.now(self._tzinfo()).isoformat()
 
         headers = {"content-type": "application/json; charset=utf-8"}
-        url = f"{self.base_url}/system/{self.uuid}/dashboard"
         try:
-            response = requests.put(url, json=payload, timeout=5, headers=headers)
-            response.raise_for_status()
+            text = await self._async_request(
+                "PUT",
+                f"/system/{self.uuid}/dashboard",
+                json=payload,
+                headers=headers,
+            )
             try:
-                resp_json = response.json()
-            except Exception:
-                resp_json = {"text": response.text}
+                resp_json = json.loads(text)
+            except ValueError:
+                resp_json = {"text": text}
             _LOGGER.debug(f"Dashboard update OK payload={payload} response={resp_json}")
         except Exception:
             _LOGGER.exception(f"Error updating dashboard (payload={payload})")
             raise
         return resp_json
 
-    async def async_update_dashboard(self, hass, **kwargs):
-        """Async wrapper for update_dashboard method."""
-        async with self._request_lock:
-            return await hass.async_add_executor_job(
-                lambda: self.update_dashboard(**kwargs)
-            )
-
-    async def async_update_thermal_profile(self, hass, updates: dict):
-        """Async wrapper for update_thermal_profile method."""
-        async with self._request_lock:
-            return await hass.async_add_executor_job(
-                lambda: self.update_thermal_profile(updates)
-            )
-
-    async def async_set_hvac_season(self, hass, season: int, hp_standby: bool = False):
-        """Set HVAC season and standby state in a single atomic operation.
+    async def async_set_hvac_season(self, season: int, hp_standby: bool = False):
+        """Set HVAC season and standby state in one call.
 
-        This method updates both the season (via thermal profile) and hpStandby
-        (via dashboard) in a single lock to prevent race conditions.
+        This method updates hpStandby (via dashboard) first and then the season
+        (via thermal profile), so the device is active before the season changes.
 
         Args:
-            hass: Home Assistant instance
             season: Season value (0=transition, 1=heating, 2=cooling)
             hp_standby: Heat pump standby state (False=active, True=standby/off)
         """
-        async with self._request_lock:
-
-            def _update():
-                # First update dashboard to set hpStandby
-                self.update_dashboard(hp_standby=hp_standby)
-                # Then update thermal profile to set season
-                if not hp_standby:  # Only set season if device is active
-                    self.update_thermal_profile({"season": {"season": season}})
-
-            return await hass.async_add_executor_job(_update)
+        # First update dashboard to set hpStandby
+        await self.async_update_dashboard(hp_standby=hp_standby)
+        # Then update thermal profile to set season
+        if not hp_standby:  # Only set season if device is active
+            await self.async_update_thermal_profile({"season": {"season": season}})
 
     async def async_set_property_for_device(
-        self,
-        hass,
-        device_uuid: str,
-        property_path: str,
-        value: float,
-        *,
-        byte_count: int,
-        signed: bool = True,
-        faktor: float = 1.0,
-    ):
-        async with self._request_lock:
-            return await hass.async_add_executor_job(
-                lambda: self.set_property_for_device(
-                    device_uuid,
-                    property_path,
-                    value,
-                    byte_count=byte_count,
-                    signed=signed,
-                    faktor=faktor,
-                )
-            )
-
-    def set_property_for_device(
         self,
         device_uuid: str,
         property_path: str,
@@ -474,29 +768,40 @@ class ComfoClimeAPI:
         if byte_count not in (1, 2):
             raise ValueError("Nur 1 oder 2 Byte unterstützt")
 
-        raw_value = int(round(value / faktor))
-        data = self.signed_int_to_bytes(raw_value, byte_count, signed)
+        data = self.signed_int_to_bytes(int(round(value / faktor)), byte_count, signed)
 
         x, y, z = map(int, property_path.split("/"))
-        url = f"{self.base_url}/device/{device_uuid}/method/{x}/{y}/3"
         payload = {"data": [z] + data}
 
         try:
-            response = requests.put(url, json=payload, timeout=5)
-            response.raise_for_status()
+            await self._async_request(
+                "PUT", f"/device/{device_uuid}/method/{x}/{y}/3", json=payload
+            )
         except Exception:
             _LOGGER.exception(
                 f"Fehler beim Schreiben von Property {property_path} mit Payload {payload}"
             )
             raise
 
-    async def async_reset_system(self, hass):
-        async with self._request_lock:
-            return await hass.async_add_executor_job(self.reset_system)
-
-    def reset_system(self):
+    async def async_reset_system(self):
         """Trigger a restart of the ComfoClime device."""
-        url = f"{self.base_url}/system/reset"
-        response = requests.put(url, timeout=5)
-        response.raise_for_status()
-        return response.status_code == 200
+        await self._async_request("PUT", "/system/reset")
+        return True
+
+    def stream(
+        self,
+        interval: float,
+        dashboard=False,
+        telemetry=(),
+        properties=(),
+        priority: int = PRIORITY_READ,
+        count: int | None = None,
+    ):
+        """Sample the selected values every ``interval`` seconds.
+
+        ``async for snapshot in api.stream(1.0, telemetry=[4193, 4201])``,
+        see ``stream.async_stream`` for the arguments.
+        """
+        return async_stream(
+            self, interval, dashboard, telemetry, properties, priority, count
+        )
@@ -5,6 +5,9 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 
+from .history import DEFAULT_HISTORY_WINDOWS
+from .request_scheduler import DEFAULT_MAX_CONCURRENT_REQUESTS
+
 DOMAIN = "comfoclime"
 
 
@@ -80,6 +83,19 @@ class ComfoClimeOptionsFlow(OptionsFlow):
                         "throttle_comfonet",
                         default=self.entry.options.get("throttle_comfonet", False),
                     ): bool,
+                    vol.Optional(
+                        "max_concurrent_requests",
+                        default=self.entry.options.get(
+                            "max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=4)),
+                    vol.Optional(
+                        "history_windows",
+                        default=self.entry.options.get(
+                            "history_windows",
+                            ",".join(map(str, DEFAULT_HISTORY_WINDOWS)),
+                        ),
+                    ): str,
                 }
             ),
         )
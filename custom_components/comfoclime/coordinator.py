@@ -1,40 +1,521 @@
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.event import async_call_later
 from datetime import timedelta
+import asyncio
+import copy
 import logging
+import random
+import time
+
+from .circuit_breaker import CircuitOpenError
+from .codec import codec_for
+from .comfoclime_api import deep_merge
+from .history import ValueHistory
+from .request_scheduler import PRIORITY_DIAGNOSTIC, PRIORITY_PRIMARY
 
 _LOGGER = logging.getLogger(__name__)
 
+# Refresh-Tiers für Property-Pfade (Feld "refresh" in den Definitionen)
+PROPERTY_REFRESH_STATIC = "static"  # einmalig lesen, z. B. Seriennummer
+PROPERTY_REFRESH_SLOW = "slow"  # alle PROPERTY_SLOW_INTERVAL
+PROPERTY_REFRESH_FAST = "fast"  # bei jedem Update-Intervall
+PROPERTY_REFRESH_TIERS = (
+    PROPERTY_REFRESH_FAST,
+    PROPERTY_REFRESH_SLOW,
+    PROPERTY_REFRESH_STATIC,
+)
+PROPERTY_SLOW_INTERVAL = timedelta(minutes=10)
 
-class ComfoClimeDashboardCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass, api):
+# Zufälliger Versatz (Sekunden) jedes geplanten Refreshs zusätzlich zur Phase
+REFRESH_JITTER = 1.0
+
+# Adaptive Abfrageintervalle: schnell nach Änderungen, normal, maximal
+DASHBOARD_POLL_FAST = timedelta(seconds=10)
+DASHBOARD_POLL_BASE = timedelta(seconds=30)
+DASHBOARD_POLL_FREQUENT = timedelta(seconds=15)  # "enable_frequent_updates"
+DASHBOARD_POLL_MAX = timedelta(seconds=120)
+THERMALPROFILE_POLL_FAST = timedelta(seconds=15)
+THERMALPROFILE_POLL_BASE = timedelta(minutes=5)
+THERMALPROFILE_POLL_FREQUENT = timedelta(minutes=1)
+THERMALPROFILE_POLL_MAX = timedelta(minutes=10)
+# Dashboard-Werte, deren Änderung einen Zustandswechsel anzeigt
+DASHBOARD_TRANSITION_KEYS = ("heatPumpStatus", "season", "hpStandby", "status")
+
+# Parameter von ComfoClimeAPI.async_update_dashboard -> Schlüssel im Dashboard
+DASHBOARD_FIELDS = {
+    "set_point_temperature": "setPointTemperature",
+    "fan_speed": "fanSpeed",
+    "season": "season",
+    "hp_standby": "hpStandby",
+    "schedule": "schedule",
+    "temperature_profile": "temperatureProfile",
+    "season_profile": "seasonProfile",
+    "status": "status",
+}
+
+
+class AdaptivePollInterval:
+    """Poll interval that speeds up on activity and backs off when stable.
+
+    After a boost the next ``fast_cycles`` updates run at ``fast``. Without
+    changes the interval stays at ``base`` for ``stable_cycles`` updates and
+    then doubles with every further stable update up to ``maximum``.
+    """
+
+    def __init__(
+        self,
+        base: timedelta,
+        fast: timedelta,
+        maximum: timedelta,
+        fast_cycles: int = 3,
+        stable_cycles: int = 5,
+    ):
+        self.base = base
+        self.fast = fast
+        self.maximum = maximum
+        self.fast_cycles = fast_cycles
+        self.stable_cycles = stable_cycles
+        self._fast_left = 0
+        self._stable = 0
+
+    def boost(self) -> timedelta:
+        """Poll fast again, e.g. after a write, and return the new interval."""
+        self._fast_left = self.fast_cycles
+        self._stable = 0
+        return self.fast
+
+    def next_interval(self, changed: bool) -> timedelta:
+        """Return the interval until the next update after one was fetched."""
+        if changed:
+            self.boost()
+        if self._fast_left:
+            self._fast_left -= 1
+            return self.fast
+        self._stable += 1
+        if self._stable <= self.stable_cycles:
+            return self.base
+        return min(self.base * 2 ** (self._stable - self.stable_cycles), self.maximum)
+
+
+class ComfoClimeCoordinator(DataUpdateCoordinator):
+    """Coordinator base class with a write-through cache.
+
+    Subclasses may set ``_poll`` to an AdaptivePollInterval; the update
+    interval then follows the activity seen in ``_watched_values``.
+    """
+
+    _poll: AdaptivePollInterval | None = None
+    # Phase (Sekunden) im Abfrageraster, vom DomainScheduler je Coordinator
+    phase: float | None = None
+    # Verlauf der zuletzt abgefragten Zahlenwerte, falls gesetzt
+    history: ValueHistory | None = None
+
+    def _schedule_refresh(self) -> None:
+        if self.phase is None or self.update_interval is None:
+            super()._schedule_refresh()
+            return
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+        # Nächstes Vielfaches des Intervalls plus Phase, höchstens ein halbes
+        # Intervall früher oder später, dazu etwas Jitter gegen zufällig
+        # zusammenfallende Phasen. Abgebrochen wird wie bei HA über
+        # _unsub_refresh (Shutdown, keine Listener mehr, Neuplanung).
+        self._async_unsub_refresh()
+        interval = self.update_interval.total_seconds()
+        planned = self.hass.loop.time() + interval
+        offset = (self.phase - planned) % interval
+        if offset > interval / 2:
+            offset -= interval
+        self._unsub_refresh = async_call_later(
+            self.hass,
+            interval + offset + random.uniform(0, REFRESH_JITTER),
+            self._handle_refresh_interval,
+        )
+
+    def _watched_values(self, data):
+        """Return the part of ``data`` whose changes speed up polling."""
+        return data
+
+    def _adapt_update_interval(self, data):
+        if self._poll is None:
+            return
+        changed = self.data is not None and self._watched_values(
+            self.data
+        ) != self._watched_values(data)
+        interval = self._poll.next_interval(changed)
+        if interval != self.update_interval:
+            _LOGGER.debug(f"{self.name}: Abfrageintervall {interval}")
+        self.update_interval = interval
+
+    def async_write_through(self, updates: dict):
+        """Merge just written values into ``data`` and notify the entities.
+
+        ``async_set_updated_data`` also reschedules the next refresh, which
+        then confirms the written values. With adaptive polling that refresh
+        comes on the fast interval.
+        """
+        if self._poll is not None:
+            self.update_interval = self._poll.boost()
+        data = copy.deepcopy(self.data) if self.data else {}
+        self.async_set_updated_data(deep_merge(data, updates))
+
+
+class ComfoClimeDashboardCoordinator(ComfoClimeCoordinator):
+    def __init__(self, hass, api, frequent_updates=False):
+        self._poll = AdaptivePollInterval(
+            DASHBOARD_POLL_FREQUENT if frequent_updates else DASHBOARD_POLL_BASE,
+            DASHBOARD_POLL_FAST,
+            DASHBOARD_POLL_MAX,
+        )
         super().__init__(
             hass,
             _LOGGER,
             name="ComfoClime Dashboard",
-            update_interval=timedelta(seconds=30),
+            update_interval=self._poll.base,
         )
         self.api = api
 
+    def _watched_values(self, data):
+        return tuple(data.get(key) for key in DASHBOARD_TRANSITION_KEYS)
+
     async def _async_update_data(self):
         try:
-            return await self.api.async_get_dashboard_data(self.hass)
+            data = await self.api.async_get_dashboard_data()
+        except CircuitOpenError as e:
+            self.update_interval = self._poll.base
+            raise UpdateFailed(str(e)) from e
         except Exception as e:
             _LOGGER.warning(f"Fehler beim Abrufen der Dashboard-Daten: {e}")
+            self.update_interval = self._poll.base
             raise UpdateFailed(f"Fehler beim Abrufen der Dashboard-Daten: {e}")
+        self._adapt_update_interval(data)
+        if self.history is not None:
+            self.history.record(data)
+        return data
 
+    async def async_update_dashboard(self, **kwargs):
+        """Write dashboard fields and apply them to the cached data."""
+        await self.api.async_update_dashboard(**kwargs)
+        updates = {
+            DASHBOARD_FIELDS[key]: value
+            for key, value in kwargs.items()
+            if value is not None
+        }
+        if updates.get("status") == 1:
+            # Im Automatikmodus gilt kein manueller Sollwert mehr
+            updates.pop("setPointTemperature", None)
+            if self.data:
+                self.data.pop("setPointTemperature", None)
+        self.async_write_through(updates)
 
-class ComfoClimeThermalprofileCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass, api):
+
+class ComfoClimeThermalprofileCoordinator(ComfoClimeCoordinator):
+    def __init__(self, hass, api, frequent_updates=False):
+        self._poll = AdaptivePollInterval(
+            (
+                THERMALPROFILE_POLL_FREQUENT
+                if frequent_updates
+                else THERMALPROFILE_POLL_BASE
+            ),
+            THERMALPROFILE_POLL_FAST,
+            THERMALPROFILE_POLL_MAX,
+        )
         super().__init__(
             hass,
             _LOGGER,
             name="ComfoClime Thermalprofile",
-            update_interval=timedelta(seconds=30),
+            update_interval=self._poll.base,
         )
         self.api = api
 
     async def _async_update_data(self):
         try:
-            return await self.api.async_get_thermal_profile(self.hass)
+            data = await self.api.async_get_thermal_profile()
         except Exception as e:
+            self.update_interval = self._poll.base
             raise UpdateFailed(f"Fehler beim Abrufen der Thermalprofile-Daten: {e}")
+        self._adapt_update_interval(data)
+        return data
+
+    async def async_update_thermal_profile(self, updates: dict):
+        """Write thermal profile fields and apply them to the cached data."""
+        await self.api.async_update_thermal_profile(updates)
+        self.async_write_through(updates)
+
+
+def _compile_codec(byte_count, signed, faktor, value_type):
+    """Return the codec of a registered value, None if it follows from the data."""
+    if byte_count is None and value_type is None:
+        return None
+    return codec_for(byte_count, signed, faktor, value_type)
+
+
+def _decode(data, codec, faktor, signed):
+    # Ohne Byte-Anzahl in der Definition bestimmt die Antwortlänge den Typ
+    if codec is None:
+        if len(data) not in (1, 2):
+            raise ValueError(f"Unsupported byte count: {len(data)}")
+        codec = codec_for(len(data), signed, faktor)
+    return codec.decode(data)
+
+
+class ComfoClimeSweepCoordinator(ComfoClimeCoordinator):
+    """Coordinator base class reading many registered values per update.
+
+    Every key has a priority class. Diagnostic keys are read in a background
+    pass so they never hold up the update of the other values: a finished
+    pass is merged into the next update, and a new pass only starts once the
+    previous one finished. Under load diagnostics thus fall behind instead
+    of delaying the values the entities show.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._priorities = {}
+        self._diagnostic_pass: asyncio.Task | None = None
+
+    def _register_priority(self, key, priority):
+        # Wird ein Wert mehrfach registriert, gewinnt die dringendere Klasse
+        self._priorities[key] = min(priority, self._priorities.get(key, priority))
+
+    async def _async_read(self, key):
+        raise NotImplementedError
+
+    async def _async_read_keys(self, keys) -> dict:
+        results = await asyncio.gather(
+            *(self._async_read(key) for key in keys), return_exceptions=True
+        )
+        return dict(zip(keys, results))
+
+    async def _async_read_prioritized(self, keys) -> dict:
+        """Read ``keys`` and return the results, exceptions included.
+
+        Contains the results of the last finished diagnostic pass instead of
+        the diagnostic keys; only the first update waits for its pass.
+        """
+        primary = []
+        diagnostic = []
+        for key in keys:
+            if self._priorities.get(key, PRIORITY_PRIMARY) >= PRIORITY_DIAGNOSTIC:
+                diagnostic.append(key)
+            else:
+                primary.append(key)
+
+        results = {}
+        finished = self._diagnostic_pass
+        if finished is not None and finished.done():
+            self._diagnostic_pass = None
+            if not finished.cancelled():
+                results.update(finished.result())
+        if diagnostic and self._diagnostic_pass is None:
+            self._diagnostic_pass = self.hass.async_create_background_task(
+                self._async_read_keys(diagnostic), f"{self.name} diagnostics"
+            )
+        results.update(await self._async_read_keys(primary))
+        if self.data is None and self._diagnostic_pass is not None:
+            results.update(await self._diagnostic_pass)
+            self._diagnostic_pass = None
+        return results
+
+    async def async_shutdown(self) -> None:
+        await super().async_shutdown()
+        if self._diagnostic_pass is not None:
+            self._diagnostic_pass.cancel()
+            self._diagnostic_pass = None
+
+
+class ComfoClimeTelemetryCoordinator(ComfoClimeSweepCoordinator):
+    """Fetch all registered telemetry values in one sweep per interval."""
+
+    def __init__(self, hass, api):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="ComfoClime Telemetry",
+            update_interval=timedelta(seconds=30),
+        )
+        self.api = api
+        # (device_uuid, telemetry_id) -> (codec, faktor, signed)
+        self._telemetry = {}
+        self.last_sweep_duration = None
+
+    def register_telemetry(
+        self,
+        device_uuid,
+        telemetry_id,
+        faktor=1.0,
+        signed=True,
+        byte_count=None,
+        value_type=None,
+        priority=PRIORITY_PRIMARY,
+    ):
+        """Add a telemetry value to the sweep and return its key in ``data``."""
+        key = (device_uuid, telemetry_id)
+        self._telemetry[key] = (
+            _compile_codec(byte_count, signed, faktor, value_type),
+            faktor,
+            signed,
+        )
+        self._register_priority(key, priority)
+        return key
+
+    async def _async_read(self, key):
+        device_uuid, telemetry_id = key
+        codec, faktor, signed = self._telemetry[key]
+        data = await self.api.async_read_telemetry_raw(
+            device_uuid, telemetry_id, self._priorities[key]
+        )
+        return _decode(data, codec, faktor, signed)
+
+    async def _async_update_data(self):
+        keys = list(self._telemetry)
+        start = time.monotonic()
+        results = await self._async_read_prioritized(keys)
+        self.last_sweep_duration = time.monotonic() - start
+
+        # Diagnosewerte ohne neues Ergebnis behalten ihren letzten Wert
+        previous = self.data or {}
+        data = {key: previous.get(key) for key in keys}
+        errors = 0
+        for key, result in results.items():
+            if isinstance(result, Exception):
+                errors += 1
+                _LOGGER.debug(f"Fehler beim Abrufen von Telemetrie {key[1]}: {result}")
+                result = None
+            data[key] = result
+
+        if results and errors == len(results):
+            raise UpdateFailed("Keine Telemetrie-Werte abrufbar")
+        if self.history is not None:
+            # Nur neu gelesene Werte, übernommene Diagnosewerte nicht doppelt
+            self.history.record({key: data[key] for key in results})
+        _LOGGER.debug(
+            f"Telemetrie-Sweep: {len(results)} von {len(keys)} Werten, "
+            f"{errors} Fehler, {self.last_sweep_duration:.2f}s"
+        )
+        return data
+
+
+class ComfoClimePropertyCoordinator(ComfoClimeSweepCoordinator):
+    """Fetch all registered RMI property paths, each on its own refresh tier.
+
+    Static paths are read once, slow paths every PROPERTY_SLOW_INTERVAL and
+    fast paths on every update interval. Values of paths that are not due
+    are carried over from the previous update.
+    """
+
+    def __init__(self, hass, api):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="ComfoClime Properties",
+            update_interval=timedelta(seconds=30),
+        )
+        self.api = api
+        # (device_uuid, path) -> (codec, faktor, signed)
+        self._properties = {}
+        self._tiers = {}
+        self._last_read = {}
+
+    def register_property(
+        self,
+        device_uuid,
+        path,
+        faktor=1.0,
+        signed=True,
+        byte_count=None,
+        refresh=PROPERTY_REFRESH_FAST,
+        value_type=None,
+        priority=PRIORITY_PRIMARY,
+    ):
+        """Add a property path to the coordinator and return its key in ``data``."""
+        if refresh not in PROPERTY_REFRESH_TIERS:
+            raise ValueError(f"Unbekannter Refresh-Tier: {refresh}")
+        key = (device_uuid, path)
+        self._properties[key] = (
+            _compile_codec(byte_count, signed, faktor, value_type),
+            faktor,
+            signed,
+        )
+        # Wird ein Pfad mehrfach registriert, gewinnt der schnellere Tier
+        current = self._tiers.get(key)
+        if current is None or PROPERTY_REFRESH_TIERS.index(
+            refresh
+        ) < PROPERTY_REFRESH_TIERS.index(current):
+            self._tiers[key] = refresh
+        self._register_priority(key, priority)
+        return key
+
+    def invalidate_property(self, device_uuid, path):
+        """Read the path again on the next update, e.g. after it was written."""
+        self._last_read.pop((device_uuid, path), None)
+
+    async def async_set_property(
+        self, device_uuid, path, value, *, byte_count, signed=True, faktor=1.0
+    ):
+        """Write a property, show the value right away and confirm it later."""
+        await self.api.async_set_property_for_device(
+            device_uuid,
+            path,
+            value,
+            byte_count=byte_count,
+            signed=signed,
+            faktor=faktor,
+        )
+        key = (device_uuid, path)
+        if key not in self._properties:
+            return
+        # Auf dem nächsten regulären Update erneut lesen, unabhängig vom Tier
+        self.invalidate_property(device_uuid, path)
+        self.async_write_through({key: value})
+
+    def _is_due(self, key, now):
+        last_read = self._last_read.get(key)
+        if last_read is None:
+            return True
+        tier = self._tiers[key]
+        if tier == PROPERTY_REFRESH_STATIC:
+            return False
+        if tier == PROPERTY_REFRESH_SLOW:
+            return now - last_read >= PROPERTY_SLOW_INTERVAL.total_seconds()
+        return True
+
+    async def _async_read(self, key):
+        device_uuid, path = key
+        codec, faktor, signed = self._properties[key]
+        data = await self.api.async_read_property_for_device_raw(
+            device_uuid, path, self._priorities[key]
+        )
+        if not data:
+            return None
+        return _decode(data, codec, faktor, signed)
+
+    async def _async_update_data(self):
+        now = time.monotonic()
+        due = [key for key in self._properties if self._is_due(key, now)]
+        results = await self._async_read_prioritized(due)
+
+        data = dict(self.data or {})
+        errors = 0
+        for key, result in results.items():
+            if isinstance(result, Exception) or result is None:
+                errors += 1
+                _LOGGER.debug(f"Fehler beim Abrufen von Property {key[1]}: {result}")
+                data[key] = None
+                continue
+            data[key] = result
+            self._last_read[key] = now
+
+        # Fehlgeschlagene Pfade zeigen keinen Wert; unavailable wird die ganze
+        # Plattform erst, wenn auch kein nicht fälliger Pfad mehr einen hat
+        if (
+            results
+            and errors == len(results)
+            and all(value is None for value in data.values())
+        ):
+            raise UpdateFailed("Keine Property-Werte abrufbar")
+        _LOGGER.debug(
+            f"Property-Update: {len(results)} von {len(self._properties)} Pfaden "
+            f"gelesen, {errors} Fehler"
+        )
+        return data
@@ -0,0 +1,61 @@
+"""Skip entity state writes for changes inside a deadband."""
+
+import time
+
+from homeassistant.core import callback
+
+# Spätestens nach dieser Zeit (Sekunden) wird der Zustand wieder geschrieben
+DEADBAND_HEARTBEAT = 600
+
+_UNSET = object()
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def exceeds_deadband(old, new, deadband: float | None) -> bool:
+    """Return True if ``new`` differs from ``old`` by at least ``deadband``.
+
+    Without a deadband any change counts; values that are not numbers count
+    as changed whenever they differ.
+    """
+    if old == new:
+        return False
+    if deadband and _is_number(old) and _is_number(new):
+        return abs(new - old) >= deadband
+    return True
+
+
+class DeadbandMixin:
+    """Write the state only when the value left the deadband.
+
+    ``_deadband`` comes from the "deadband" field of the entity definition;
+    without it only unchanged values are skipped. Changes of availability are
+    always written, an unchanged state at the latest after DEADBAND_HEARTBEAT.
+    """
+
+    _deadband: float | None = None
+    _written_value = _UNSET
+    _written_available = None
+    _written_at = 0.0
+
+    @callback
+    def _async_write_state(self, value):
+        available = self.available
+        now = time.monotonic()
+        if (
+            self._written_value is not _UNSET
+            and available == self._written_available
+            and now - self._written_at < DEADBAND_HEARTBEAT
+            and not exceeds_deadband(self._written_value, value, self._deadband)
+        ):
+            return
+        self._written_value = value
+        self._written_available = available
+        self._written_at = now
+        self.async_write_ha_state()
+
+    def _reset_deadband(self):
+        """Write the next state in any case, e.g. after the user set a value."""
+        self._written_value = _UNSET
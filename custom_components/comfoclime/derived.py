@@ -0,0 +1,171 @@
+"""Metrics derived from values the coordinators already fetched.
+
+Thermal power of the ComfoClime from supply air flow and the supply
+temperatures before and after it, COP against the electrical power
+(telemetry 4201), energies integrated over time and the compressor runtime
+from ``heatPumpStatus``. Nothing here sends a request.
+"""
+
+import time
+
+from .history import RingBuffer
+
+# Volumetrische Wärmekapazität von Luft (1,2 kg/m³ * 1005 J/kgK) in W je m³/h und K
+AIR_HEAT_CAPACITY = 1.2 * 1005 / 3600
+# Darunter läuft der Verdichter nicht sinnvoll, keine COP-Angabe
+COP_MIN_POWER = 50
+# Größere Lücken zwischen zwei Werten (Sekunden) werden nicht integriert
+MAX_INTEGRATION_GAP = 300
+# Zeitraum der Verdichter-Einschaltdauer in Sekunden
+DUTY_CYCLE_WINDOW = 3600
+# heatPumpStatus-Bits für Heizen und Kühlen, siehe climate.py
+HEAT_PUMP_COMPRESSOR_BITS = 0x02 | 0x04
+
+# Schlüssel der abgeleiteten Werte
+METRIC_THERMAL_POWER = "thermal_power"
+METRIC_COP = "cop"
+METRIC_ELECTRICAL_ENERGY = "electrical_energy"
+METRIC_HEATING_ENERGY = "heating_energy"
+METRIC_COOLING_ENERGY = "cooling_energy"
+METRIC_COMPRESSOR_RUNTIME = "compressor_runtime"
+METRIC_COMPRESSOR_DUTY_CYCLE = "compressor_duty_cycle"
+
+# Umrechnung der Integrale (Ws bzw. s) in kWh bzw. h
+_WS_PER_KWH = 3_600_000
+_S_PER_H = 3600
+
+
+class Integrator:
+    """Time-weighted integral of a sampled value (trapezoidal rule).
+
+    A missing value or a gap above MAX_INTEGRATION_GAP starts a new segment
+    instead of guessing the value in between.
+    """
+
+    __slots__ = ("total", "_last_time", "_last_value")
+
+    def __init__(self, total: float = 0.0):
+        self.total = total
+        self._last_time = None
+        self._last_value = None
+
+    def add(self, timestamp: float, value: float | None):
+        if value is None:
+            self._last_time = None
+            return
+        if self._last_time is not None:
+            elapsed = timestamp - self._last_time
+            if 0 < elapsed <= MAX_INTEGRATION_GAP:
+                self.total += (value + self._last_value) / 2 * elapsed
+        self._last_time = timestamp
+        self._last_value = value
+
+
+def compressor_running(heat_pump_status) -> bool | None:
+    if heat_pump_status is None:
+        return None
+    return bool(heat_pump_status & HEAT_PUMP_COMPRESSOR_BITS)
+
+
+def thermal_power(air_flow, temperature_in, temperature_out) -> float | None:
+    """Heat added to the supply air in W, negative while cooling."""
+    if None in (air_flow, temperature_in, temperature_out):
+        return None
+    return AIR_HEAT_CAPACITY * air_flow * (temperature_out - temperature_in)
+
+
+class DerivedMetrics:
+    """Compute and integrate the derived metrics on every coordinator update.
+
+    ``update`` takes the latest known inputs; values of the coordinator that
+    did not refresh are simply held. Energies and runtime are totals since
+    ``restore`` (kWh and h), the duty cycle is the share of DUTY_CYCLE_WINDOW
+    the compressor ran.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self.thermal_power = None
+        self.cop = None
+        self._electrical = Integrator()
+        self._heating = Integrator()
+        self._cooling = Integrator()
+        self._runtime = Integrator()
+        # Laufzeit seit dem Start, für die Einschaltdauer über das Fenster
+        self._session_runtime = Integrator()
+        self._runtime_samples = RingBuffer(DUTY_CYCLE_WINDOW // 5)
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """Register ``listener()`` for new values and return a callable removing it."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def restore(self, metric: str, value: float):
+        """Continue a total from its last state, e.g. after a restart."""
+        if metric == METRIC_ELECTRICAL_ENERGY:
+            self._electrical.total = value * _WS_PER_KWH
+        elif metric == METRIC_HEATING_ENERGY:
+            self._heating.total = value * _WS_PER_KWH
+        elif metric == METRIC_COOLING_ENERGY:
+            self._cooling.total = value * _WS_PER_KWH
+        elif metric == METRIC_COMPRESSOR_RUNTIME:
+            self._runtime.total = value * _S_PER_H
+
+    def update(
+        self,
+        *,
+        air_flow=None,
+        temperature_in=None,
+        temperature_out=None,
+        power=None,
+        heat_pump_status=None,
+    ):
+        now = self._clock()
+        self.thermal_power = thermal_power(air_flow, temperature_in, temperature_out)
+        self.cop = None
+        if (
+            self.thermal_power is not None
+            and power is not None
+            and power >= COP_MIN_POWER
+        ):
+            self.cop = abs(self.thermal_power) / power
+
+        self._electrical.add(now, power)
+        self._heating.add(
+            now, None if self.thermal_power is None else max(self.thermal_power, 0.0)
+        )
+        self._cooling.add(
+            now, None if self.thermal_power is None else max(-self.thermal_power, 0.0)
+        )
+        running = compressor_running(heat_pump_status)
+        running = None if running is None else float(running)
+        self._runtime.add(now, running)
+        self._session_runtime.add(now, running)
+        if running is not None:
+            self._runtime_samples.append(now, self._session_runtime.total)
+
+        for listener in list(self._listeners):
+            listener()
+
+    def duty_cycle(self) -> float | None:
+        """Share of the last DUTY_CYCLE_WINDOW the compressor ran, in percent."""
+        samples = self._runtime_samples.samples(self._clock() - DUTY_CYCLE_WINDOW)
+        if len(samples) < 2:
+            return None
+        (start, runtime_start), (end, runtime_end) = samples[0], samples[-1]
+        if end <= start:
+            return None
+        return min(100.0, max(0.0, (runtime_end - runtime_start) / (end - start) * 100))
+
+    def values(self) -> dict:
+        """Return all metrics in their display units."""
+        return {
+            METRIC_THERMAL_POWER: self.thermal_power,
+            METRIC_COP: self.cop,
+            METRIC_ELECTRICAL_ENERGY: self._electrical.total / _WS_PER_KWH,
+            METRIC_HEATING_ENERGY: self._heating.total / _WS_PER_KWH,
+            METRIC_COOLING_ENERGY: self._cooling.total / _WS_PER_KWH,
+            METRIC_COMPRESSOR_RUNTIME: self._runtime.total / _S_PER_H,
+            METRIC_COMPRESSOR_DUTY_CYCLE: self.duty_cycle(),
+        }
@@ -0,0 +1,75 @@
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import DOMAIN, DOMAIN_SCHEDULER
+
+TO_REDACT = {"host"}
+
+# Schlüssel der Coordinatoren in hass.data[DOMAIN][entry_id]
+COORDINATOR_KEYS = (
+    "coordinator",
+    "tpcoordinator",
+    "telemetry_coordinator",
+    "property_coordinator",
+)
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict:
+    """Return request statistics and coordinator state for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    api = data["api"]
+    scheduler = api._scheduler
+
+    coordinators = {}
+    for key in COORDINATOR_KEYS:
+        coordinator = data[key]
+        coordinators[coordinator.name] = {
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": (
+                repr(coordinator.last_exception)
+                if coordinator.last_exception
+                else None
+            ),
+            "values": len(coordinator.data or {}),
+            "phase": coordinator.phase,
+        }
+        if coordinator.history is not None:
+            coordinators[coordinator.name]["history"] = coordinator.history.as_dict()
+        sweep = getattr(coordinator, "last_sweep_duration", None)
+        if sweep is not None:
+            coordinators[coordinator.name]["last_sweep_duration"] = sweep
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "scheduler": {
+            "max_concurrency": scheduler.max_concurrency,
+            "min_interval": scheduler.min_interval,
+            "active": scheduler.active,
+            "queued": scheduler.queued,
+            "limits": api.tuner.as_dict(),
+        },
+        "domain_scheduler": hass.data[DOMAIN][DOMAIN_SCHEDULER].as_dict(),
+        "circuit": api.circuit.as_dict(),
+        "requests": api.stats.as_dict(),
+        "coordinators": coordinators,
+        "derived": data["derived"].values() if "derived" in data else None,
+        "devices": [
+            {
+                "modelTypeId": device.get("modelTypeId"),
+                "@modelType": device.get("@modelType"),
+                "version": device.get("version"),
+            }
+            for device in data["devices"]
+        ],
+    }
@@ -1,3 +1,4 @@
+# "deadband" wie in sensor_definitions.py
 NUMBER_ENTITIES = [
     {
         "key": "heatingThermalProfileSeasonData.comfortTemperature",
@@ -73,6 +74,7 @@ NUMBER_ENTITIES = [
     },
 ]
 
+# "refresh": "static" (einmalig), "slow" (alle paar Minuten) oder "fast" (Standard)
 CONNECTED_DEVICE_NUMBER_PROPERTIES = {
     1: [
         {
@@ -85,6 +87,7 @@ CONNECTED_DEVICE_NUMBER_PROPERTIES = {
             "unit": "°C",
             "faktor": 0.1,
             "byte_count": 2,
+            "refresh": "slow",
         },
         {
             "property": "29/1/3",
@@ -96,6 +99,7 @@ CONNECTED_DEVICE_NUMBER_PROPERTIES = {
             "unit": "°C",
             "faktor": 0.1,
             "byte_count": 2,
+            "refresh": "slow",
         },
     ],
     20: [
@@ -109,6 +113,7 @@ CONNECTED_DEVICE_NUMBER_PROPERTIES = {
             "unit": "°C",
             "faktor": 0.1,
             "byte_count": 2,
+            "refresh": "slow",
         },
         {
             "property": "23/1/3",
@@ -120,6 +125,7 @@ CONNECTED_DEVICE_NUMBER_PROPERTIES = {
             "unit": "°C",
             "faktor": 0.1,
             "byte_count": 2,
+            "refresh": "slow",
         },
     ],
 }
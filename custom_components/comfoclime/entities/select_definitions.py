@@ -20,12 +20,14 @@ PROPERTY_SELECT_ENTITIES = {
             "name": "Humidity Comfort Control",
             "translation_key": "humidity_comfort_control",
             "options": {0: "off", 1: "autoonly", 2: "on"},
+            "refresh": "slow",
         },
         {
             "path": "29/1/7",  # X/Y/Z
             "name": "Humidity Protection",
             "translation_key": "humidity_protection",
             "options": {0: "off", 1: "autoonly", 2: "on"},
+            "refresh": "slow",
         },
     ]
 }
@@ -1,3 +1,5 @@
+# "deadband": Änderungen kleiner als dieser Wert schreiben keinen neuen Zustand
+# (spätestens nach DEADBAND_HEARTBEAT doch), ohne Angabe nur unveränderte Werte
 DASHBOARD_SENSORS = [
     {
         "key": "indoorTemperature",
@@ -22,6 +24,7 @@ DASHBOARD_SENSORS = [
         "unit": "m³/h",
         "state_class": "measurement",
         "device_class": "volume_flow_rate",
+        "deadband": 2,
     },
     {
         "key": "supplyAirFlow",
@@ -30,6 +33,7 @@ DASHBOARD_SENSORS = [
         "unit": "m³/h",
         "state_class": "measurement",
         "device_class": "volume_flow_rate",
+        "deadband": 2,
     },
     {
         "key": "fanSpeed",
@@ -75,6 +79,120 @@ DASHBOARD_SENSORS = [
 
 TELEMETRY_SENSORS = []
 
+# Statistik der HTTP-Anfragen an das Gerät (nur mit "enable_diagnostics"),
+# "key" ist ein Feld von EndpointStats, summiert über alle Endpunkte
+REQUEST_STATS_SENSORS = [
+    {
+        "key": "count",
+        "name": "Requests",
+        "translation_key": "requests",
+        "state_class": "total_increasing",
+    },
+    {
+        "key": "errors",
+        "name": "Request Errors",
+        "translation_key": "request_errors",
+        "state_class": "total_increasing",
+    },
+    {
+        "key": "timeouts",
+        "name": "Request Timeouts",
+        "translation_key": "request_timeouts",
+        "state_class": "total_increasing",
+    },
+    {
+        "key": "latency_mean",
+        "name": "Mean Request Latency",
+        "translation_key": "request_latency_mean",
+        "unit": "ms",
+        "faktor": 1000,
+        "device_class": "duration",
+        "state_class": "measurement",
+    },
+    {
+        "key": "wait_mean",
+        "name": "Mean Request Queue Wait",
+        "translation_key": "request_wait_mean",
+        "unit": "ms",
+        "faktor": 1000,
+        "device_class": "duration",
+        "state_class": "measurement",
+    },
+    {
+        "key": "bytes_received",
+        "name": "Bytes Received",
+        "translation_key": "bytes_received",
+        "unit": "B",
+        "device_class": "data_size",
+        "state_class": "total_increasing",
+    },
+]
+
+# Aus bereits abgefragten Werten berechnet (derived.py), "key" ist eine
+# METRIC_*-Konstante, "precision" die angezeigten Nachkommastellen
+DERIVED_SENSORS = [
+    {
+        "key": "thermal_power",
+        "name": "Thermal Power",
+        "translation_key": "thermal_power",
+        "unit": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+        "precision": 0,
+    },
+    {
+        "key": "cop",
+        "name": "Coefficient of Performance",
+        "translation_key": "cop",
+        "state_class": "measurement",
+        "precision": 2,
+    },
+    {
+        "key": "electrical_energy",
+        "name": "Heatpump Energy",
+        "translation_key": "heatpump_energy",
+        "unit": "kWh",
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "precision": 2,
+    },
+    {
+        "key": "heating_energy",
+        "name": "Heating Energy",
+        "translation_key": "heating_energy",
+        "unit": "kWh",
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "precision": 2,
+    },
+    {
+        "key": "cooling_energy",
+        "name": "Cooling Energy",
+        "translation_key": "cooling_energy",
+        "unit": "kWh",
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "precision": 2,
+    },
+    {
+        "key": "compressor_runtime",
+        "name": "Compressor Runtime",
+        "translation_key": "compressor_runtime",
+        "unit": "h",
+        "device_class": "duration",
+        "state_class": "total_increasing",
+        "precision": 2,
+    },
+    {
+        "key": "compressor_duty_cycle",
+        "name": "Compressor Duty Cycle",
+        "translation_key": "compressor_duty_cycle",
+        "unit": "%",
+        "state_class": "measurement",
+        "precision": 1,
+    },
+]
+
 CONNECTED_DEVICE_SENSORS = {
     20: [
         {
@@ -175,6 +293,7 @@ CONNECTED_DEVICE_SENSORS = {
             "unit": "W",
             "device_class": "power",
             "state_class": "measurement",
+            "deadband": 5,
         },
         {
             "telemetry_id": 4202,
@@ -240,6 +359,7 @@ CONNECTED_DEVICE_SENSORS = {
             "translation_key": "exhaust_fan_speed",
             "unit": "rpm",
             "state_class": "measurement",
+            "deadband": 10,
         },
         {
             "telemetry_id": 122,
@@ -247,6 +367,7 @@ CONNECTED_DEVICE_SENSORS = {
             "translation_key": "supply_fan_speed",
             "unit": "rpm",
             "state_class": "measurement",
+            "deadband": 10,
         },
         {
             "telemetry_id": 128,
@@ -347,6 +468,7 @@ CONNECTED_DEVICE_SENSORS = {
     ],
 }
 
+# "refresh": "static" (einmalig), "slow" (alle paar Minuten) oder "fast" (Standard)
 CONNECTED_DEVICE_PROPERTIES = {
     1: [
         {
@@ -357,6 +479,7 @@ CONNECTED_DEVICE_PROPERTIES = {
             "faktor": 0.1,
             "signed": True,
             "byte_count": 2,
+            "refresh": "slow",
         },
     ],
 }
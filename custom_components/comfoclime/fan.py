@@ -8,7 +8,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DOMAIN
-from .comfoclime_api import ComfoClimeAPI
 from .coordinator import ComfoClimeDashboardCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,17 +58,19 @@ class ComfoClimeFan(CoordinatorEntity[ComfoClimeDashboardCoordinator], FanEntity
         step = round(percentage / 33)
         step = max(0, min(step, 3))  # Clamp to 0–3
         try:
-            await self._api.async_update_dashboard(
-                self._hass,
-                fan_speed=step,
-            )
-            self._current_speed = step
-            self.async_write_ha_state()
-            self._hass.add_job(self.coordinator.async_request_refresh)
+            await self.coordinator.async_update_dashboard(fan_speed=step)
         except Exception as e:
             _LOGGER.error(f"Fehler beim Setzen von fanSpeed: {e}")
 
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._handle_coordinator_update()
+
     def _handle_coordinator_update(self):
+        if self.coordinator.data is None:
+            self.async_write_ha_state()
+            return
         try:
             data = self.coordinator.data
             speed = data.get("fanSpeed", 0)
@@ -83,11 +84,7 @@ class ComfoClimeFan(CoordinatorEntity[ComfoClimeDashboardCoordinator], FanEntity
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
-    host = entry.data["host"]
-    api = ComfoClimeAPI(f"http://{host}")
-
     try:
-        await api.async_get_uuid(hass)
         # devices = hass.data[DOMAIN][entry.entry_id]["devices"]
         main_device = hass.data[DOMAIN][entry.entry_id]["main_device"]
         if not main_device:
@@ -96,13 +93,8 @@ async def async_setup_entry(
         data = hass.data[DOMAIN][entry.entry_id]
         api = data["api"]
         coordinator = data["coordinator"]
-        try:
-            await coordinator.async_config_entry_first_refresh()
-        except Exception as e:
-            _LOGGER.warning(f"Dashboard-Daten konnten nicht geladen werden: {e}")
-
         fan_entity = ComfoClimeFan(hass, coordinator, api, main_device, entry)
-        async_add_entities([fan_entity], True)
+        async_add_entities([fan_entity])
 
     except Exception as e:
         _LOGGER.error(f"Fehler beim Setup der FanEntity: {e}")
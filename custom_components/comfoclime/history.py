@@ -0,0 +1,201 @@
+"""Short-term history of polled values in compact in-memory ring buffers.
+
+Every series keeps its samples in an ``array('f')`` of values and an
+``array('d')`` of timestamps, so an hour of 10 s samples costs about 4 KiB
+and trends (min/max/mean/slope over a window) need no recorder query.
+"""
+
+import math
+import time
+from array import array
+
+# Fenster (Minuten) der Trend-Attribute, per Option "history_windows" änderbar
+DEFAULT_HISTORY_WINDOWS = (15, 60)
+# Kürzestes Abfrageintervall (Sekunden), danach richtet sich die Puffergröße
+HISTORY_SAMPLE_INTERVAL = 10
+
+
+def parse_windows(text: str | None) -> tuple[int, ...]:
+    """Parse ``"15,60"`` into sorted window lengths in minutes.
+
+    Empty or invalid input gives DEFAULT_HISTORY_WINDOWS.
+    """
+    parts = [part for part in (text or "").split(",") if part.strip()]
+    try:
+        windows = sorted({int(part) for part in parts})
+    except ValueError:
+        return DEFAULT_HISTORY_WINDOWS
+    if not windows or windows[0] < 1:
+        return DEFAULT_HISTORY_WINDOWS
+    return tuple(windows)
+
+
+def _is_number(value) -> bool:
+    return (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and math.isfinite(value)
+    )
+
+
+class RingBuffer:
+    """Fixed-size buffer of (timestamp, value) samples, oldest overwritten."""
+
+    __slots__ = ("capacity", "_times", "_values", "_next", "_size")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("f", bytes(4 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, value: float):
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def samples(self, since: float = -math.inf) -> list[tuple[float, float]]:
+        """Return the samples not older than ``since``, oldest first."""
+        result = []
+        index = self._next
+        for _ in range(self._size):
+            index = (index - 1) % self.capacity
+            timestamp = self._times[index]
+            if timestamp < since:
+                break
+            result.append((timestamp, self._values[index]))
+        result.reverse()
+        return result
+
+    def stats(self, since: float) -> dict | None:
+        """Return count, min, max, mean and slope per hour since ``since``."""
+        samples = self.samples(since)
+        if not samples:
+            return None
+        count = len(samples)
+        values = [value for _, value in samples]
+        mean = sum(values) / count
+        # Steigung per linearer Regression, Zeit relativ zum ersten Wert
+        slope = None
+        if count > 1:
+            start = samples[0][0]
+            mean_t = sum(t - start for t, _ in samples) / count
+            var_t = sum((t - start - mean_t) ** 2 for t, _ in samples)
+            if var_t > 0:
+                cov = sum((t - start - mean_t) * (v - mean) for t, v in samples)
+                slope = round(cov / var_t * 3600, 4)
+        return {
+            "count": count,
+            "min": round(min(values), 4),
+            "max": round(max(values), 4),
+            "mean": round(mean, 4),
+            "slope_per_hour": slope,
+        }
+
+
+class ValueHistory:
+    """Ring buffers of the numeric values of one coordinator, keyed like ``data``.
+
+    The capacity covers the longest window at HISTORY_SAMPLE_INTERVAL. Values
+    that are not finite numbers (None, strings, bools) are skipped.
+    """
+
+    def __init__(
+        self,
+        windows: tuple[int, ...] = DEFAULT_HISTORY_WINDOWS,
+        sample_interval: float = HISTORY_SAMPLE_INTERVAL,
+        clock=time.time,
+    ):
+        self.windows = windows
+        self.capacity = math.ceil(max(windows) * 60 / sample_interval)
+        self._clock = clock
+        self._series: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def __contains__(self, key) -> bool:
+        return key in self._series
+
+    def record(self, values: dict, timestamp: float | None = None):
+        """Append every numeric value of ``values`` to its series."""
+        if timestamp is None:
+            timestamp = self._clock()
+        for key, value in values.items():
+            if not _is_number(value):
+                continue
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = RingBuffer(self.capacity)
+            series.append(timestamp, value)
+
+    def samples(self, key, minutes: float) -> list[tuple[float, float]]:
+        series = self._series.get(key)
+        if series is None:
+            return []
+        return series.samples(self._clock() - minutes * 60)
+
+    def stats(self, key, minutes: float) -> dict | None:
+        """Return the statistics of ``key`` over the last ``minutes``."""
+        series = self._series.get(key)
+        if series is None:
+            return None
+        return series.stats(self._clock() - minutes * 60)
+
+    def trend(self, key) -> dict:
+        """Return the statistics for every configured window, e.g. ``"15m"``."""
+        return {f"{minutes}m": self.stats(key, minutes) for minutes in self.windows}
+
+    def as_dict(self) -> dict:
+        return {
+            "series": len(self._series),
+            "capacity": self.capacity,
+            "windows": list(self.windows),
+            "bytes": len(self._series) * self.capacity * 12,
+        }
+
+
+class HistoryMixin:
+    """Show the trend of the entity value and serve it to ``get_history``.
+
+    The entity's coordinator must have a ``history``; ``_history_key`` is the
+    key of the value in ``coordinator.data``. The "trend" attribute is not
+    written to the recorder and follows the state writes, so with a deadband
+    it may lag until the next written state.
+    """
+
+    _unrecorded_attributes = frozenset({"trend"})
+    _history_key = None
+
+    @property
+    def _history(self) -> ValueHistory | None:
+        history = getattr(self.coordinator, "history", None)
+        if history is None or self._history_key not in history:
+            return None
+        return history
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        history = self._history
+        if history is None:
+            return None
+        return {"trend": history.trend(self._history_key)}
+
+    async def async_get_history(self, window: float | None = None) -> dict:
+        """Service handler: statistics and samples of the last ``window`` minutes."""
+        history = self._history
+        if history is None:
+            return {"stats": None, "samples": []}
+        minutes = window or max(history.windows)
+        return {
+            "stats": history.stats(self._history_key, minutes),
+            "samples": [
+                [round(timestamp, 3), round(value, 4)]
+                for timestamp, value in history.samples(self._history_key, minutes)
+            ],
+        }
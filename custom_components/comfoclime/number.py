@@ -2,14 +2,18 @@ import logging
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DOMAIN
-from .comfoclime_api import ComfoClimeAPI
-from .coordinator import ComfoClimeThermalprofileCoordinator
+from .coordinator import (
+    PROPERTY_REFRESH_FAST,
+    ComfoClimePropertyCoordinator,
+    ComfoClimeThermalprofileCoordinator,
+)
+from .deadband import DeadbandMixin
 from .entities.number_definitions import (
     CONNECTED_DEVICE_NUMBER_PROPERTIES,
     NUMBER_ENTITIES,
@@ -21,19 +25,13 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
-    host = entry.data["host"]
-    api = ComfoClimeAPI(f"http://{host}")
-    await api.async_get_uuid(hass)
     devices = hass.data[DOMAIN][entry.entry_id]["devices"]
     main_device = hass.data[DOMAIN][entry.entry_id]["main_device"]
 
     data = hass.data[DOMAIN][entry.entry_id]
     api = data["api"]
     tpcoordinator = data["tpcoordinator"]
-    try:
-        await tpcoordinator.async_config_entry_first_refresh()
-    except Exception as e:
-        _LOGGER.warning(f"Thermalprofile-Daten konnten nicht geladen werden: {e}")
+    property_coordinator = data["property_coordinator"]
 
     entities = [
         ComfoClimeTemperatureNumber(
@@ -42,6 +40,7 @@ async def async_setup_entry(
         for conf in NUMBER_ENTITIES
     ]
 
+    property_entities = []
     for device in devices:
         model_id = device.get("modelTypeId")
         dev_uuid = device.get("uuid")
@@ -49,10 +48,11 @@ async def async_setup_entry(
             continue
         for number_def in CONNECTED_DEVICE_NUMBER_PROPERTIES.get(model_id, []):
             if not entry.options.get("minimal_mode", False):
-                entities.extend(
+                property_entities.extend(
                     [
                         ComfoClimePropertyNumber(
                             hass=hass,
+                            coordinator=property_coordinator,
                             api=api,
                             config=number_def,
                             device=device,
@@ -61,11 +61,12 @@ async def async_setup_entry(
                     ]
                 )
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
+    async_add_entities(property_entities)
 
 
 class ComfoClimeTemperatureNumber(
-    CoordinatorEntity[ComfoClimeThermalprofileCoordinator], NumberEntity
+    DeadbandMixin, CoordinatorEntity[ComfoClimeThermalprofileCoordinator], NumberEntity
 ):
     def __init__(self, hass, coordinator, api, conf, device=None, entry=None):
         super().__init__(coordinator)
@@ -75,6 +76,7 @@ class ComfoClimeTemperatureNumber(
         self._key_path = conf["key"].split(".")
         self._name = conf["name"]
         self._value = None
+        self._deadband = conf.get("deadband")
         self._device = device
         self._entry = entry
         self._attr_mode = (
@@ -149,7 +151,15 @@ class ComfoClimeTemperatureNumber(
             sw_version=self._device.get("version", None),
         )
 
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._handle_coordinator_update()
+
     def _handle_coordinator_update(self):
+        if self.coordinator.data is None:
+            self.async_write_ha_state()
+            return
         try:
             data = self.coordinator.data
             val = data
@@ -159,9 +169,9 @@ class ComfoClimeTemperatureNumber(
         except Exception as e:
             _LOGGER.warning(f"[{self.name}] Fehler beim Update: {e}")
             self._value = None  # besser als Absturz
-        self.async_write_ha_state()
+        self._async_write_state(self._value)
 
-    def set_native_value(self, value: float):
+    async def async_set_native_value(self, value: float):
         # Check if this is a manual temperature setting
         if (
             self._key_path[0] == "temperature"
@@ -190,23 +200,22 @@ class ComfoClimeTemperatureNumber(
         update = {section: {key: value}}
 
         try:
-            self._api.update_thermal_profile(update)
-            self._value = value
-            self._hass.add_job(self.coordinator.async_request_refresh)
+            self._reset_deadband()
+            await self.coordinator.async_update_thermal_profile(update)
         except Exception as e:
             _LOGGER.error(f"Fehler beim Setzen von {self._name}: {e}")
 
 
-class ComfoClimePropertyNumber(NumberEntity):
-    _attr_should_poll = True
-
-    def __init__(self, hass, api, config, device, entry):
+class ComfoClimePropertyNumber(
+    DeadbandMixin, CoordinatorEntity[ComfoClimePropertyCoordinator], NumberEntity
+):
+    def __init__(self, hass, coordinator, api, config, device, entry):
+        super().__init__(coordinator)
         self._hass = hass
         self._api = api
         self._config = config
         self._device = device
         self._entry = entry
-        self._value = None
 
         self._property_path = config["property"]
         self._attr_translation_key = config.get("translation_key")
@@ -227,6 +236,15 @@ class ComfoClimePropertyNumber(NumberEntity):
         self._faktor = config.get("faktor", 1.0)
         self._signed = config.get("signed", True)
         self._byte_count = config.get("byte_count", 2)
+        self._deadband = config.get("deadband")
+        self._key = coordinator.register_property(
+            device["uuid"],
+            self._property_path,
+            self._faktor,
+            self._signed,
+            self._byte_count,
+            config.get("refresh", PROPERTY_REFRESH_FAST),
+        )
 
     @property
     def name(self):
@@ -234,7 +252,13 @@ class ComfoClimePropertyNumber(NumberEntity):
 
     @property
     def native_value(self):
-        return self._value
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get(self._key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_write_state(self.native_value)
 
     @property
     def device_info(self):
@@ -248,27 +272,10 @@ class ComfoClimePropertyNumber(NumberEntity):
             sw_version=self._device.get("version"),
         )
 
-    async def async_update(self):
-        try:
-            value = await self._api.async_read_property_for_device(
-                self._hass,
-                self._device["uuid"],
-                self._property_path,
-                faktor=self._faktor,
-                signed=self._signed,
-                byte_count=self._byte_count,
-            )
-            self._value = value
-        except Exception as e:
-            _LOGGER.error(
-                f"Fehler beim Abrufen von Property {self._property_path}: {e}"
-            )
-            self._value = None
-
     async def async_set_native_value(self, value):
         try:
-            await self._api.async_set_property_for_device(
-                self._hass,
+            self._reset_deadband()
+            await self.coordinator.async_set_property(
                 self._device["uuid"],
                 self._property_path,
                 value,
@@ -276,7 +283,6 @@ class ComfoClimePropertyNumber(NumberEntity):
                 faktor=self._faktor,
                 signed=self._signed,
             )
-            self._value = value
         except Exception as e:
             _LOGGER.error(
                 f"Fehler beim Schreiben von Property {self._property_path}: {e}"
@@ -0,0 +1,283 @@
+"""Request scheduling for the ComfoClime API."""
+
+import asyncio
+import collections
+import contextlib
+import itertools
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Prioritätsklassen, kleinere Werte werden zuerst bedient
+PRIORITY_WRITE = 0
+PRIORITY_CONTROL = 1  # Dashboard und Thermalprofil für Klima und Lüfter
+PRIORITY_PRIMARY = 2  # Sensoren, Zahlen und Auswahlen
+PRIORITY_DIAGNOSTIC = 3  # "diagnose"-Werte und Scanner
+PRIORITY_READ = PRIORITY_PRIMARY
+PRIORITIES = (PRIORITY_WRITE, PRIORITY_CONTROL, PRIORITY_PRIMARY, PRIORITY_DIAGNOSTIC)
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 1
+# Abstand zwischen zwei Request-Starts bei aktivem "throttle_comfonet", mit
+# automatischer Anpassung die Untergrenze
+THROTTLE_REQUEST_INTERVAL = 0.1
+
+# Gemeinsames Budget aller Config-Entries: so viele Requests gleichzeitig, egal
+# an welches Gerät
+DEFAULT_GLOBAL_MAX_CONCURRENT_REQUESTS = 4
+# Zeitraum, über den die Abfragen aller Coordinatoren verteilt werden
+STAGGER_WINDOW = 30.0
+# Goldener Schnitt: jede neue Phase fällt in die größte Lücke der bisherigen
+_GOLDEN_RATIO = (5**0.5 - 1) / 2
+
+# Automatische Anpassung (AIMD) von Abstand und Parallelität
+AIMD_INCREASE_AFTER = 10  # gute Requests bis zum nächsten Schritt nach oben
+AIMD_INTERVAL_STEP = 0.05  # Sekunden, um die der Abstand sinkt
+AIMD_MAX_INTERVAL = 1.0
+AIMD_DECREASE_HOLDOFF = 2.0  # Sekunden zwischen zwei Rücknahmen
+# Latenz ab der ein Request als Überlast zählt: Vielfaches der Basislatenz,
+# aber nie unter AIMD_LATENCY_FLOOR
+AIMD_LATENCY_FACTOR = 3.0
+AIMD_LATENCY_FLOOR = 0.25
+
+
+class RequestScheduler:
+    """Limit concurrent device requests and serve writes before reads.
+
+    Every priority class has its own FIFO queue. A free slot always goes to
+    the oldest waiter of the most urgent non-empty queue, so a write never
+    waits behind queued polls and diagnostics only get a slot while nothing
+    else is waiting. ``min_interval`` paces the requests: no two requests
+    start closer together than that many seconds.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        min_interval: float = 0.0,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self._active = 0
+        self._queues = {priority: collections.deque() for priority in PRIORITIES}
+        self._next_start = 0.0
+
+    @property
+    def active(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a slot."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_READ):
+        """Wait for a request slot of the given priority and hold it."""
+        await self._async_acquire(priority)
+        try:
+            await self._async_pace()
+            yield
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: int):
+        if self._active < self.max_concurrency and not self.queued:
+            self._active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues[priority]
+        queue.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Der Slot wurde bereits übergeben, also wieder freigeben
+                self._release()
+            else:
+                # _dispatch kann den abgebrochenen Future schon entnommen haben
+                with contextlib.suppress(ValueError):
+                    queue.remove(future)
+            raise
+
+    def set_max_concurrency(self, max_concurrency: int):
+        """Change the number of slots; waiters get new slots right away."""
+        self.max_concurrency = max(1, max_concurrency)
+        self._dispatch()
+
+    def _release(self):
+        self._active -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        for priority in sorted(self._queues):
+            queue = self._queues[priority]
+            while queue and self._active < self.max_concurrency:
+                future = queue.popleft()
+                if not future.done():
+                    self._active += 1
+                    future.set_result(None)
+            if self._active >= self.max_concurrency:
+                return
+
+    async def _async_pace(self):
+        if self.min_interval <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self._next_start)
+        self._next_start = start + self.min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class AimdTuner:
+    """Tune concurrency and pacing of a RequestScheduler from request outcomes.
+
+    Additive increase: after AIMD_INCREASE_AFTER good requests in a row the
+    interval between request starts shrinks by AIMD_INTERVAL_STEP down to
+    ``min_interval``, then one slot is added up to ``max_concurrency``.
+    Multiplicative decrease: a failed or slow request halves the slots, or
+    doubles the interval once only one slot is left; at most once per
+    AIMD_DECREASE_HOLDOFF so one congested moment counts only once.
+    "Slow" is relative to the baseline latency of the request's endpoint
+    (as in request_stats.endpoint_name), since RMI reads over the ComfoNet
+    bus normally take much longer than a ping or the dashboard.
+    """
+
+    def __init__(
+        self,
+        scheduler: RequestScheduler,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        min_interval: float = 0.0,
+        clock=time.monotonic,
+    ):
+        self._scheduler = scheduler
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self._clock = clock
+        self.baselines: dict[str | None, float] = {}
+        self.increases = 0
+        self.decreases = 0
+        self._good = 0
+        self._last_decrease = None
+
+    def _is_slow(self, latency: float, endpoint: str | None) -> bool:
+        baseline = self.baselines.get(endpoint)
+        if baseline is None:
+            self.baselines[endpoint] = latency
+            return False
+        slow = latency > max(AIMD_LATENCY_FLOOR, baseline * AIMD_LATENCY_FACTOR)
+        # Basislatenz folgt neuen Minima sofort und steigt nur langsam
+        self.baselines[endpoint] = min(latency, baseline * 1.01)
+        return slow
+
+    def record(self, latency: float, ok: bool = True, endpoint: str | None = None):
+        """Feed the outcome of one request to ``endpoint``."""
+        if ok and not self._is_slow(latency, endpoint):
+            self._good += 1
+            if self._good >= AIMD_INCREASE_AFTER:
+                self._good = 0
+                self._increase()
+            return
+        self._good = 0
+        now = self._clock()
+        if (
+            self._last_decrease is not None
+            and now - self._last_decrease < AIMD_DECREASE_HOLDOFF
+        ):
+            return
+        self._last_decrease = now
+        self._decrease()
+
+    def _increase(self):
+        scheduler = self._scheduler
+        if scheduler.min_interval > self.min_interval:
+            scheduler.min_interval = max(
+                self.min_interval, scheduler.min_interval - AIMD_INTERVAL_STEP
+            )
+        elif scheduler.max_concurrency < self.max_concurrency:
+            scheduler.set_max_concurrency(scheduler.max_concurrency + 1)
+        else:
+            return
+        self.increases += 1
+        _LOGGER.debug(
+            f"Request-Tempo erhöht: {scheduler.max_concurrency} parallel, "
+            f"{scheduler.min_interval:.2f}s Abstand"
+        )
+
+    def _decrease(self):
+        scheduler = self._scheduler
+        if scheduler.max_concurrency > 1:
+            scheduler.set_max_concurrency(scheduler.max_concurrency // 2)
+        elif scheduler.min_interval < AIMD_MAX_INTERVAL:
+            scheduler.min_interval = min(
+                AIMD_MAX_INTERVAL,
+                max(AIMD_INTERVAL_STEP, scheduler.min_interval * 2),
+            )
+        else:
+            return
+        self.decreases += 1
+        _LOGGER.debug(
+            f"Request-Tempo gesenkt: {scheduler.max_concurrency} parallel, "
+            f"{scheduler.min_interval:.2f}s Abstand"
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "min_interval": self.min_interval,
+            "baseline_latency": dict(self.baselines),
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+class DomainScheduler:
+    """Request budget and poll phases shared by all config entries.
+
+    Every request of every ComfoClimeAPI also takes a slot of ``budget``, so
+    several devices in one Home Assistant instance never have more than
+    ``max_concurrency`` requests in flight together. ``register`` hands out
+    poll phases, one per coordinator, so no two coordinators of any entry
+    refresh at the same instant.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_GLOBAL_MAX_CONCURRENT_REQUESTS,
+        window: float = STAGGER_WINDOW,
+    ):
+        self.budget = RequestScheduler(max_concurrency)
+        self.window = window
+        self._entries: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def phase(self, index: int) -> float:
+        """Phase in seconds of the given index."""
+        return (index * _GOLDEN_RATIO) % 1 * self.window
+
+    def register(self, entry_id: str, count: int = 1) -> list[float]:
+        """Reserve ``count`` phases for an entry, reusing freed indexes."""
+        if entry_id not in self._entries:
+            used = {index for indexes in self._entries.values() for index in indexes}
+            free = (index for index in itertools.count() if index not in used)
+            self._entries[entry_id] = list(itertools.islice(free, count))
+        return [self.phase(index) for index in self._entries[entry_id]]
+
+    def unregister(self, entry_id: str):
+        self._entries.pop(entry_id, None)
+
+    def as_dict(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_concurrency": self.budget.max_concurrency,
+            "active": self.budget.active,
+            "queued": self.budget.queued,
+        }
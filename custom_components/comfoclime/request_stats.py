@@ -0,0 +1,140 @@
+"""Per-endpoint request statistics for the ComfoClime API."""
+
+# Obergrenzen der Latenz-Buckets in Sekunden, der letzte Bucket ist offen
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Pfadsegmente nach diesen Namen sind Geräte-UUIDs
+_UUID_PARENTS = ("system", "device")
+
+
+def endpoint_name(method: str, path: str) -> str:
+    """Return the endpoint of a request with UUIDs and numbers as placeholders.
+
+    ``GET /device/SIT123/telemetry/4145`` becomes
+    ``GET /device/{uuid}/telemetry/{id}``.
+    """
+    parts = path.split("?", 1)[0].split("/")
+    for index, part in enumerate(parts):
+        if index and parts[index - 1] in _UUID_PARENTS and part != "reset":
+            parts[index] = "{uuid}"
+        elif part.isdigit():
+            parts[index] = "{id}"
+    return f"{method} {'/'.join(parts)}"
+
+
+class EndpointStats:
+    """Counters and a latency histogram for one endpoint."""
+
+    def __init__(self):
+        self.count = 0
+        self.shared = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.bytes_received = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(
+        self,
+        latency: float,
+        wait: float = 0.0,
+        size: int = 0,
+        error: bool = False,
+        timeout: bool = False,
+    ):
+        """Add one finished request.
+
+        ``latency`` is the time on the wire, ``wait`` the time spent waiting
+        for a scheduler slot before the request was sent.
+        """
+        self.count += 1
+        self.errors += error
+        self.timeouts += timeout
+        self.bytes_received += size
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                self.histogram[index] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def merge(self, other: "EndpointStats"):
+        self.count += other.count
+        self.shared += other.shared
+        self.errors += other.errors
+        self.timeouts += other.timeouts
+        self.bytes_received += other.bytes_received
+        self.latency_total += other.latency_total
+        self.latency_max = max(self.latency_max, other.latency_max)
+        self.wait_total += other.wait_total
+        self.wait_max = max(self.wait_max, other.wait_max)
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+
+    @property
+    def latency_mean(self) -> float | None:
+        return self.latency_total / self.count if self.count else None
+
+    @property
+    def wait_mean(self) -> float | None:
+        return self.wait_total / self.count if self.count else None
+
+    def as_dict(self) -> dict:
+        buckets = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [
+            f">{LATENCY_BUCKETS[-1]}s"
+        ]
+        return {
+            "count": self.count,
+            "shared": self.shared,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "bytes_received": self.bytes_received,
+            "latency_mean": self.latency_mean,
+            "latency_max": self.latency_max,
+            "wait_mean": self.wait_mean,
+            "wait_max": self.wait_max,
+            "latency_histogram": dict(zip(buckets, self.histogram)),
+        }
+
+
+class RequestStats:
+    """Request statistics of one API instance, grouped by endpoint."""
+
+    def __init__(self):
+        self.endpoints: dict[str, EndpointStats] = {}
+
+    def _endpoint(self, method: str, path: str) -> EndpointStats:
+        endpoint = endpoint_name(method, path)
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        return stats
+
+    def record(self, method: str, path: str, latency: float, **kwargs):
+        self._endpoint(method, path).record(latency, **kwargs)
+
+    def record_shared(self, method: str, path: str):
+        """Count a request answered by an identical one already in flight."""
+        self._endpoint(method, path).shared += 1
+
+    def totals(self) -> EndpointStats:
+        """Return the statistics summed over all endpoints."""
+        total = EndpointStats()
+        for stats in self.endpoints.values():
+            total.merge(stats)
+        return total
+
+    def as_dict(self) -> dict:
+        return {
+            "total": self.totals().as_dict(),
+            "endpoints": {
+                endpoint: stats.as_dict()
+                for endpoint, stats in sorted(self.endpoints.items())
+            },
+        }
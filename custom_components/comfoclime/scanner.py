@@ -0,0 +1,261 @@
+"""Discover telemetry IDs and RMI property paths of the connected devices.
+
+The scanner reads every candidate ID once under its own concurrency and
+pacing budget, records which ones answer with how many bytes and renders the
+hits in the dict format of ``entities/sensor_definitions.py``.
+"""
+
+import asyncio
+import json
+import logging
+import time
+
+import aiohttp
+
+from .circuit_breaker import CircuitOpenError
+from .codec import CN_INT64, CN_STRING, CN_UINT32
+from .entities.number_definitions import CONNECTED_DEVICE_NUMBER_PROPERTIES
+from .entities.select_definitions import PROPERTY_SELECT_ENTITIES
+from .entities.sensor_definitions import (
+    CONNECTED_DEVICE_PROPERTIES,
+    CONNECTED_DEVICE_SENSORS,
+)
+from .request_scheduler import PRIORITY_DIAGNOSTIC
+
+_LOGGER = logging.getLogger(__name__)
+
+# PDO-Nummern der ComfoAir Q liegen unter 1000, die der ComfoClime ab 4096
+DEFAULT_TELEMETRY_RANGES = ((1, 999), (4096, 4351))
+# RMI-Units aus ComfoClimeAPI.md: NODE, TEMPCONFIG, HEATPUMP
+DEFAULT_PROPERTY_UNITS = (1, 22, 23)
+DEFAULT_PROPERTY_SUBUNITS = (1,)
+DEFAULT_MAX_PROPERTY = 64
+DEFAULT_SCAN_CONCURRENCY = 2
+# Mindestabstand zwischen zwei Scan-Requests in Sekunden
+DEFAULT_SCAN_INTERVAL = 0.05
+
+
+def parse_ranges(text: str) -> list[tuple[int, int]]:
+    """Parse ``"1-999,4096-4351,5000"`` into inclusive ranges."""
+    ranges = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        ranges.append((int(start), int(end or start)))
+    return ranges
+
+
+def telemetry_candidates(ranges=DEFAULT_TELEMETRY_RANGES) -> list[int]:
+    return [
+        telemetry_id for start, end in ranges for telemetry_id in range(start, end + 1)
+    ]
+
+
+def property_candidates(
+    units=DEFAULT_PROPERTY_UNITS,
+    subunits=DEFAULT_PROPERTY_SUBUNITS,
+    max_property: int = DEFAULT_MAX_PROPERTY,
+) -> list[str]:
+    return [
+        f"{unit}/{subunit}/{prop}"
+        for unit in units
+        for subunit in subunits
+        for prop in range(1, max_property + 1)
+    ]
+
+
+def known_registers() -> dict:
+    """Return the telemetry IDs and property paths with an entity, per model."""
+    known = {}
+    for model_id, defs in CONNECTED_DEVICE_SENSORS.items():
+        known.setdefault(model_id, set()).update(d["telemetry_id"] for d in defs)
+    for model_id, defs in CONNECTED_DEVICE_PROPERTIES.items():
+        known.setdefault(model_id, set()).update(d["path"] for d in defs)
+    for model_id, defs in CONNECTED_DEVICE_NUMBER_PROPERTIES.items():
+        known.setdefault(model_id, set()).update(d["property"] for d in defs)
+    for model_id, defs in PROPERTY_SELECT_ENTITIES.items():
+        known.setdefault(model_id, set()).update(d["path"] for d in defs)
+    return known
+
+
+def guess_type(data: list) -> str | None:
+    """Return the PDO type for a definition, None if ``byte_count`` suffices."""
+    if len(data) in (1, 2):
+        return None
+    text = bytes(data).rstrip(b"\0")
+    if text and all(32 <= byte < 127 for byte in text):
+        return CN_STRING
+    return {4: CN_UINT32, 8: CN_INT64}.get(len(data), CN_STRING)
+
+
+class DeviceScanner:
+    """Read candidate telemetry IDs and property paths of one device."""
+
+    def __init__(
+        self,
+        api,
+        concurrency: int = DEFAULT_SCAN_CONCURRENCY,
+        interval: float = DEFAULT_SCAN_INTERVAL,
+    ):
+        self._api = api
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._interval = interval
+        self._next_start = 0.0
+        self.requests = 0
+
+    async def _async_pace(self):
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _async_read(self, read, *args):
+        async with self._semaphore:
+            await self._async_pace()
+            self.requests += 1
+            try:
+                # Der Scan darf laufende Abfragen nicht verdrängen
+                return await read(*args, PRIORITY_DIAGNOSTIC)
+            except CircuitOpenError:
+                raise
+            except (TimeoutError, aiohttp.ClientError, ValueError):
+                return None
+
+    async def async_scan(
+        self, device_uuid: str, telemetry_ids=(), property_paths=()
+    ) -> dict:
+        """Return ``{"telemetry": {id: data}, "properties": {path: data}}``.
+
+        Only IDs that answered with data are included. A device that stops
+        answering (open circuit) aborts the scan with CircuitOpenError.
+        """
+        start = time.monotonic()
+        telemetry_ids = list(telemetry_ids)
+        property_paths = list(property_paths)
+        results = await asyncio.gather(
+            *(
+                self._async_read(
+                    self._api.async_read_telemetry_raw, device_uuid, telemetry_id
+                )
+                for telemetry_id in telemetry_ids
+            ),
+            *(
+                self._async_read(
+                    self._api.async_read_property_data, device_uuid, path
+                )
+                for path in property_paths
+            ),
+        )
+        telemetry = dict(zip(telemetry_ids, results[: len(telemetry_ids)]))
+        properties = dict(zip(property_paths, results[len(telemetry_ids) :]))
+        result = {
+            "telemetry": {key: data for key, data in telemetry.items() if data},
+            "properties": {key: data for key, data in properties.items() if data},
+            "candidates": len(telemetry_ids) + len(property_paths),
+            "duration": time.monotonic() - start,
+        }
+        _LOGGER.info(
+            f"Scan von {device_uuid}: {len(result['telemetry'])} Telemetrie-IDs, "
+            f"{len(result['properties'])} Properties von {result['candidates']} "
+            f"Kandidaten in {result['duration']:.0f}s"
+        )
+        return result
+
+
+async def async_scan_devices(
+    api,
+    devices: list,
+    telemetry_ids=(),
+    property_paths=(),
+    concurrency: int = DEFAULT_SCAN_CONCURRENCY,
+    interval: float = DEFAULT_SCAN_INTERVAL,
+) -> dict:
+    """Scan the devices one after another and return the results per modelTypeId."""
+    scanner = DeviceScanner(api, concurrency, interval)
+    scans = {}
+    for device in devices:
+        if device.get("uuid") in (None, "NULL"):
+            continue
+        scan = await scanner.async_scan(device["uuid"], telemetry_ids, property_paths)
+        merged = scans.setdefault(
+            device.get("modelTypeId"), {"telemetry": {}, "properties": {}}
+        )
+        merged["telemetry"].update(scan["telemetry"])
+        merged["properties"].update(scan["properties"])
+    return scans
+
+
+def _render_entry(fields: dict, data: list) -> list[str]:
+    lines = ["        {"]
+    lines.extend(
+        f'            "{key}": {json.dumps(value, ensure_ascii=False)},'
+        if isinstance(value, str)
+        else f'            "{key}": {value!r},'
+        for key, value in fields.items()
+    )
+    lines.append(f"            # Rohdaten: {data}")
+    lines.append("        },")
+    return lines
+
+
+def render_definitions(scans: dict, known: dict | None = None) -> str:
+    """Render scan results as ``CONNECTED_DEVICE_SENSORS``/``_PROPERTIES``.
+
+    ``scans`` is the result of ``async_scan_devices``.
+    IDs and paths listed in ``known`` (modelTypeId -> set of telemetry IDs and
+    property paths) are left out. New values are marked as "diagnose" so
+    they only show up with enable_diagnostics.
+    """
+    known = known or {}
+    sensors = ["CONNECTED_DEVICE_SENSORS = {"]
+    properties = ["CONNECTED_DEVICE_PROPERTIES = {"]
+    for model_id, scan in sorted(scans.items()):
+        skip = known.get(model_id, set())
+        sensor_lines = []
+        for telemetry_id, data in sorted(scan["telemetry"].items()):
+            if telemetry_id in skip:
+                continue
+            fields = {
+                "telemetry_id": telemetry_id,
+                "name": f"Telemetry {telemetry_id}",
+                "byte_count": len(data),
+            }
+            value_type = guess_type(data)
+            if value_type:
+                fields["type"] = value_type
+            fields["diagnose"] = True
+            sensor_lines.extend(_render_entry(fields, data))
+        if sensor_lines:
+            sensors += [f"    {model_id}: ["] + sensor_lines + ["    ],"]
+
+        property_lines = []
+        for path, data in sorted(
+            scan["properties"].items(),
+            key=lambda item: tuple(map(int, item[0].split("/"))),
+        ):
+            if path in skip:
+                continue
+            fields = {
+                "path": path,
+                "name": f"Property {path}",
+                "byte_count": len(data),
+            }
+            value_type = guess_type(data)
+            if value_type:
+                fields["type"] = value_type
+            fields["refresh"] = "slow"
+            property_lines.extend(_render_entry(fields, data))
+        if property_lines:
+            properties += [f"    {model_id}: ["] + property_lines + ["    ],"]
+    sensors.append("}")
+    properties.append("}")
+    return (
+        "# Vom ComfoClime-Scanner erzeugt, Namen, Faktoren und Einheiten prüfen\n"
+        + "\n".join(sensors)
+        + "\n\n"
+        + "\n".join(properties)
+        + "\n"
+    )
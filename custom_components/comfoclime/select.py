@@ -8,8 +8,11 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DOMAIN
-from .comfoclime_api import ComfoClimeAPI
-from .coordinator import ComfoClimeThermalprofileCoordinator
+from .coordinator import (
+    PROPERTY_REFRESH_FAST,
+    ComfoClimePropertyCoordinator,
+    ComfoClimeThermalprofileCoordinator,
+)
 from .entities.select_definitions import PROPERTY_SELECT_ENTITIES, SELECT_ENTITIES
 
 _LOGGER = logging.getLogger(__name__)
@@ -18,24 +21,24 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
-    host = entry.data["host"]
-    api = ComfoClimeAPI(f"http://{host}")
-    await api.async_get_uuid(hass)
-
     devices = hass.data[DOMAIN][entry.entry_id]["devices"]
     main_device = hass.data[DOMAIN][entry.entry_id]["main_device"]
 
     data = hass.data[DOMAIN][entry.entry_id]
     api = data["api"]
+    dbcoordinator = data["coordinator"]
     tpcoordinator = data["tpcoordinator"]
-    try:
-        await tpcoordinator.async_config_entry_first_refresh()
-    except Exception as e:
-        _LOGGER.warning(f"Thermalprofile-Daten konnten nicht geladen werden: {e}")
+    property_coordinator = data["property_coordinator"]
 
     entities = [
         ComfoClimeSelect(
-            hass, tpcoordinator, api, conf, device=main_device, entry=entry
+            hass,
+            tpcoordinator,
+            api,
+            conf,
+            device=main_device,
+            entry=entry,
+            dashboard_coordinator=dbcoordinator,
         )
         for conf in SELECT_ENTITIES
     ]
@@ -47,6 +50,7 @@ async def async_setup_entry(
         _LOGGER.warning(f"Verbundene Geräte konnten nicht geladen werden: {e}")
         devices = []
 
+    property_entities = []
     for device in devices:
         model_id = device.get("modelTypeId")
         dev_uuid = device.get("uuid")
@@ -58,22 +62,38 @@ async def async_setup_entry(
             continue
 
         if not entry.options.get("minimal_mode", False):
-            entities.extend(
+            property_entities.extend(
                 ComfoClimePropertySelect(
-                    hass=hass, api=api, conf=select_def, device=device, entry=entry
+                    hass=hass,
+                    coordinator=property_coordinator,
+                    api=api,
+                    conf=select_def,
+                    device=device,
+                    entry=entry,
                 )
                 for select_def in select_defs
             )
-    async_add_entities(entities, True)
+    async_add_entities(entities)
+    async_add_entities(property_entities)
 
 
 class ComfoClimeSelect(
     CoordinatorEntity[ComfoClimeThermalprofileCoordinator], SelectEntity
 ):
-    def __init__(self, hass, coordinator, api, conf, device=None, entry=None):
+    def __init__(
+        self,
+        hass,
+        coordinator,
+        api,
+        conf,
+        device=None,
+        entry=None,
+        dashboard_coordinator=None,
+    ):
         super().__init__(coordinator)
         self._hass = hass
         self._api = api
+        self._dashboard_coordinator = dashboard_coordinator
         self._key = conf["key"]
         self._name = conf["name"]
         self._key_path = self._key.split(".")
@@ -109,7 +129,15 @@ class ComfoClimeSelect(
             sw_version=self._device.get("version", None),
         )
 
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._handle_coordinator_update()
+
     def _handle_coordinator_update(self):
+        if self.coordinator.data is None:
+            self.async_write_ha_state()
+            return
         try:
             data = self.coordinator.data
             val = data
@@ -120,7 +148,7 @@ class ComfoClimeSelect(
             _LOGGER.error(f"Fehler beim Laden von {self._name}: {e}")
         self.async_write_ha_state()
 
-    def select_option(self, option: str):
+    async def async_select_option(self, option: str):
         value = self._options_reverse.get(option)
         if value is None:
             return
@@ -128,30 +156,39 @@ class ComfoClimeSelect(
         try:
             if self._key == "temperatureProfile":
                 # Use modern API method for temperature profile (preset mode)
-                self._api.update_dashboard(temperature_profile=value)
+                await self._dashboard_coordinator.async_update_dashboard(
+                    temperature_profile=value
+                )
+                # Das Thermalprofil spiegelt das Temperaturprofil des Dashboards
+                self.coordinator.async_write_through({"temperatureProfile": value})
             else:
                 section = self._key_path[0]
                 key = self._key_path[1]
                 updates = {section: {key: value}}
-                self._api.update_thermal_profile(updates)
-
-            self._current = option
-            self._hass.add_job(self.coordinator.async_request_refresh)
+                await self.coordinator.async_update_thermal_profile(updates)
         except Exception as e:
             _LOGGER.error(f"Fehler beim Setzen von {self._name}: {e}")
 
 
-class ComfoClimePropertySelect(SelectEntity):
-    def __init__(self, hass, api, conf, device=None, entry=None):
+class ComfoClimePropertySelect(
+    CoordinatorEntity[ComfoClimePropertyCoordinator], SelectEntity
+):
+    def __init__(self, hass, coordinator, api, conf, device=None, entry=None):
+        super().__init__(coordinator)
         self._hass = hass
         self._api = api
         self._name = conf["name"]
         self._options_map = conf["options"]
         self._options_reverse = {v: k for k, v in self._options_map.items()}
-        self._current = None
         self._device = device
         self._entry = entry
         self._path = conf["path"]
+        self._key = coordinator.register_property(
+            device["uuid"],
+            self._path,
+            byte_count=1,
+            refresh=conf.get("refresh", PROPERTY_REFRESH_FAST),
+        )
         self._attr_config_entry_id = entry.entry_id
         self._attr_unique_id = (
             f"{entry.entry_id}_select_{conf['path'].replace('/', '_')}"
@@ -165,7 +202,9 @@ class ComfoClimePropertySelect(SelectEntity):
 
     @property
     def current_option(self):
-        return self._current
+        if not self.coordinator.data:
+            return None
+        return self._options_map.get(self.coordinator.data.get(self._key))
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -180,25 +219,15 @@ class ComfoClimePropertySelect(SelectEntity):
             sw_version=self._device.get("version", None),
         )
 
-    async def async_update(self):
-        try:
-            val = await self._api.async_read_property_for_device(
-                self._hass, self._device["uuid"], self._path, byte_count=1
-            )
-            self._current = self._options_map.get(val)
-        except Exception as e:
-            _LOGGER.error(f"Fehler beim Laden von {self._name}: {e}")
-
-    def select_option(self, option: str):
+    async def async_select_option(self, option: str):
         value = self._options_reverse.get(option)
         if value is None:
             return
 
         try:
-            self._api.set_property_for_device(
+            await self.coordinator.async_set_property(
                 self._device["uuid"], self._path, value, byte_count=1
             )
-            self._current = option
 
         except Exception as e:
             _LOGGER.error(f"Fehler beim Setzen von {self._name}: {e}")
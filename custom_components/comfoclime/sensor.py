@@ -1,21 +1,36 @@
 import logging
 
-from homeassistant.components.sensor import SensorEntity
+import voluptuous as vol
+
+from homeassistant.components.sensor import RestoreSensor, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DOMAIN
-from .comfoclime_api import ComfoClimeAPI
-from .coordinator import ComfoClimeDashboardCoordinator
+from .coordinator import (
+    PROPERTY_REFRESH_FAST,
+    ComfoClimeDashboardCoordinator,
+    ComfoClimePropertyCoordinator,
+    ComfoClimeTelemetryCoordinator,
+)
+from .deadband import DeadbandMixin
+from .derived import DerivedMetrics
 from .entities.sensor_definitions import (
     CONNECTED_DEVICE_PROPERTIES,
     CONNECTED_DEVICE_SENSORS,
     DASHBOARD_SENSORS,
+    DERIVED_SENSORS,
+    REQUEST_STATS_SENSORS,
     TELEMETRY_SENSORS,
 )
+from .history import HistoryMixin
+from .request_scheduler import PRIORITY_DIAGNOSTIC, PRIORITY_PRIMARY
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,27 +47,15 @@ VALUE_MAPPINGS = {
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
-    host = entry.data["host"]
-    api = ComfoClimeAPI(f"http://{host}")
-
     sensors = []
-
-    # UUID abrufen
-    try:
-        await api.async_get_uuid(hass)
-    except Exception as e:
-        _LOGGER.error(f"Fehler beim Abrufen der UUID: {e}")
-        return
+    coordinated_sensors = []
 
     # Dashboard-Daten abrufen (optional beim Start)
     data = hass.data[DOMAIN][entry.entry_id]
     api = data["api"]
     coordinator = data["coordinator"]
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as e:
-        _LOGGER.warning(f"Dashboard-Daten konnten nicht geladen werden: {e}")
-
+    telemetry_coordinator = data["telemetry_coordinator"]
+    property_coordinator = data["property_coordinator"]
     devices = hass.data[DOMAIN][entry.entry_id]["devices"]
     main_device = hass.data[DOMAIN][entry.entry_id]["main_device"]
     # Dashboard-Sensoren
@@ -67,6 +70,7 @@ async def async_setup_entry(
             unit=sensor_def.get("unit"),
             device_class=sensor_def.get("device_class"),
             state_class=sensor_def.get("state_class"),
+            deadband=sensor_def.get("deadband"),
             device=main_device,
             entry=entry,
         )
@@ -74,11 +78,26 @@ async def async_setup_entry(
     ]
     sensors.extend(sensor_list)
 
+    # Anfrage-Statistik der API als Diagnose-Sensoren
+    if entry.options.get("enable_diagnostics", False):
+        coordinated_sensors.extend(
+            ComfoClimeRequestStatsSensor(
+                hass=hass,
+                coordinator=coordinator,
+                api=api,
+                conf=sensor_def,
+                device=main_device,
+                entry=entry,
+            )
+            for sensor_def in REQUEST_STATS_SENSORS
+        )
+
     # Feste Telemetrie-Sensoren für das ComfoClime-Gerät
     if not entry.options.get("minimal_mode", False):
-        sensors.extend(
+        coordinated_sensors.extend(
             ComfoClimeTelemetrySensor(
                 hass=hass,
+                coordinator=telemetry_coordinator,
                 api=api,
                 telemetry_id=sensor_def["id"],
                 name=sensor_def["name"],
@@ -87,13 +106,31 @@ async def async_setup_entry(
                 faktor=sensor_def.get("faktor", 1.0),
                 signed=sensor_def.get("signed", True),
                 byte_count=sensor_def.get("byte_count"),
+                value_type=sensor_def.get("type"),
                 device_class=sensor_def.get("device_class"),
                 state_class=sensor_def.get("state_class"),
+                deadband=sensor_def.get("deadband"),
+                diagnose=sensor_def.get("diagnose", False),
                 entry=entry,
             )
             for sensor_def in TELEMETRY_SENSORS
         )
 
+    # Abgeleitete Werte aus bereits abgefragten Daten, ohne eigene Requests
+    if not entry.options.get("minimal_mode", False) and main_device:
+        derived = data["derived"] = DerivedMetrics()
+        entry.async_on_unload(
+            _async_track_derived(
+                derived, coordinator, telemetry_coordinator, main_device, devices
+            )
+        )
+        coordinated_sensors.extend(
+            ComfoClimeDerivedSensor(
+                derived=derived, conf=sensor_def, device=main_device, entry=entry
+            )
+            for sensor_def in DERIVED_SENSORS
+        )
+
     # Verbundene Geräte abrufen
     try:
         devices = hass.data[DOMAIN][entry.entry_id]["devices"]
@@ -116,10 +153,11 @@ async def async_setup_entry(
                 "enable_diagnostics", False
             ):
                 if not entry.options.get("minimal_mode", False):
-                    sensors.extend(
+                    coordinated_sensors.extend(
                         [
                             ComfoClimeTelemetrySensor(
                                 hass=hass,
+                                coordinator=telemetry_coordinator,
                                 api=api,
                                 telemetry_id=sensor_def["telemetry_id"],
                                 name=sensor_def["name"],
@@ -130,9 +168,12 @@ async def async_setup_entry(
                                 faktor=sensor_def.get("faktor", 1.0),
                                 signed=sensor_def.get("signed", True),
                                 byte_count=sensor_def.get("byte_count"),
+                                value_type=sensor_def.get("type"),
                                 device_class=sensor_def.get("device_class"),
                                 device=device,
                                 state_class=sensor_def.get("state_class"),
+                                deadband=sensor_def.get("deadband"),
+                                diagnose=sensor_def.get("diagnose", False),
                                 override_device_uuid=dev_uuid,
                                 entry=entry,
                             )
@@ -144,9 +185,10 @@ async def async_setup_entry(
             continue
 
         if not entry.options.get("minimal_mode", False):
-            sensors.extend(
+            coordinated_sensors.extend(
                 ComfoClimePropertySensor(
                     hass=hass,
+                    coordinator=property_coordinator,
                     api=api,
                     path=prop_def["path"],
                     name=prop_def["name"],
@@ -155,17 +197,92 @@ async def async_setup_entry(
                     faktor=prop_def.get("faktor", 1.0),
                     signed=prop_def.get("signed", True),
                     byte_count=prop_def.get("byte_count"),
+                    value_type=prop_def.get("type"),
                     mapping_key=prop_def.get("mapping_key", ""),
+                    refresh=prop_def.get("refresh", PROPERTY_REFRESH_FAST),
+                    deadband=prop_def.get("deadband"),
+                    diagnose=prop_def.get("diagnose", False),
                     device=device,
                     override_device_uuid=dev_uuid,
                     entry=entry,
                 )
                 for prop_def in property_defs
             )
-    async_add_entities(sensors, True)
 
+    # Die Daten liefern die Coordinatoren, ein Update beim Hinzufügen entfällt
+    async_add_entities(sensors)
+    async_add_entities(coordinated_sensors)
+
+    entity_platform.async_get_current_platform().async_register_entity_service(
+        "get_history",
+        {vol.Optional("window"): vol.All(vol.Coerce(float), vol.Range(min=1))},
+        _async_get_history,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+async def _async_get_history(entity, call: ServiceCall) -> dict:
+    """Serve ``get_history`` for sensors that keep a short-term history."""
+    if not isinstance(entity, HistoryMixin):
+        raise HomeAssistantError(
+            f"{entity.entity_id} hat keinen Kurzzeitverlauf, nur Dashboard- "
+            "und Telemetrie-Sensoren"
+        )
+    return await entity.async_get_history(call.data.get("window"))
+
+
+def _async_track_derived(
+    derived, coordinator, telemetry_coordinator, main_device, devices
+):
+    """Feed ``derived`` on every dashboard and telemetry update.
+
+    Only values some sensor already registered are used: the supply
+    temperature of the ComfoAir Q (278) before and of the ComfoClime (4193)
+    after the heat exchanger and the heat pump power (4201). Returns a
+    callable removing both listeners.
+    """
+    comfoair_uuid = next(
+        (device.get("uuid") for device in devices if device.get("modelTypeId") == 1),
+        None,
+    )
+    main_uuid = main_device.get("uuid")
+
+    @callback
+    def _async_update():
+        dashboard = coordinator.data if coordinator.last_update_success else None
+        telemetry = (
+            telemetry_coordinator.data
+            if telemetry_coordinator.last_update_success
+            else None
+        )
+        dashboard = dashboard or {}
+        telemetry = telemetry or {}
+        derived.update(
+            air_flow=dashboard.get("supplyAirFlow"),
+            temperature_in=telemetry.get((comfoair_uuid, 278)),
+            temperature_out=telemetry.get((main_uuid, 4193)),
+            power=telemetry.get((main_uuid, 4201)),
+            heat_pump_status=dashboard.get("heatPumpStatus"),
+        )
+
+    removers = [
+        coordinator.async_add_listener(_async_update),
+        telemetry_coordinator.async_add_listener(_async_update),
+    ]
+
+    def _remove():
+        for remove in removers:
+            remove()
+
+    return _remove
 
-class ComfoClimeSensor(CoordinatorEntity[ComfoClimeDashboardCoordinator], SensorEntity):
+
+class ComfoClimeSensor(
+    HistoryMixin,
+    DeadbandMixin,
+    CoordinatorEntity[ComfoClimeDashboardCoordinator],
+    SensorEntity,
+):
     def __init__(
         self,
         hass,
@@ -177,6 +294,7 @@ class ComfoClimeSensor(CoordinatorEntity[ComfoClimeDashboardCoordinator], Sensor
         unit=None,
         device_class=None,
         state_class=None,
+        deadband=None,
         device=None,
         entry=None,
     ):
@@ -184,8 +302,11 @@ class ComfoClimeSensor(CoordinatorEntity[ComfoClimeDashboardCoordinator], Sensor
         self._hass = hass
         self._api = api
         self._type = sensor_type
+        # Abgebildete Statuscodes haben keinen sinnvollen Verlauf
+        self._history_key = None if sensor_type in VALUE_MAPPINGS else sensor_type
         self._name = name
         self._state = None
+        self._deadband = deadband
         self._attr_native_unit_of_measurement = unit
         self._attr_device_class = device_class
         self._attr_state_class = state_class
@@ -216,7 +337,16 @@ class ComfoClimeSensor(CoordinatorEntity[ComfoClimeDashboardCoordinator], Sensor
             sw_version=self._device.get("version", None),
         )
 
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        # Zustand aus den beim Setup geladenen Coordinator-Daten übernehmen
+        if self.coordinator.data is not None:
+            self._handle_coordinator_update()
+
     def _handle_coordinator_update(self) -> None:
+        if self.coordinator.data is None:
+            self.async_write_ha_state()
+            return
         try:
             data = self.coordinator.data
 
@@ -232,13 +362,19 @@ class ComfoClimeSensor(CoordinatorEntity[ComfoClimeDashboardCoordinator], Sensor
             _LOGGER.warning(f"Fehler beim Aktualisieren der Sensorwerte: {e}")
             self._state = None
 
-        self.async_write_ha_state()
+        self._async_write_state(self._state)
 
 
-class ComfoClimeTelemetrySensor(SensorEntity):
+class ComfoClimeTelemetrySensor(
+    HistoryMixin,
+    DeadbandMixin,
+    CoordinatorEntity[ComfoClimeTelemetryCoordinator],
+    SensorEntity,
+):
     def __init__(
         self,
         hass,
+        coordinator,
         api,
         telemetry_id,
         name,
@@ -247,12 +383,16 @@ class ComfoClimeTelemetrySensor(SensorEntity):
         faktor=1.0,
         signed=True,
         byte_count=None,
+        value_type=None,
         device_class=None,
         device=None,
         state_class=None,
+        deadband=None,
+        diagnose=False,
         override_device_uuid=None,
         entry=None,
     ):
+        super().__init__(coordinator)
         self._hass = hass
         self._api = api
         self._id = telemetry_id
@@ -260,7 +400,17 @@ class ComfoClimeTelemetrySensor(SensorEntity):
         self._faktor = faktor
         self._signed = signed
         self._byte_count = byte_count
-        self._state = None
+        self._deadband = deadband
+        self._key = coordinator.register_telemetry(
+            override_device_uuid or api.uuid,
+            telemetry_id,
+            faktor,
+            signed,
+            byte_count,
+            value_type,
+            PRIORITY_DIAGNOSTIC if diagnose else PRIORITY_PRIMARY,
+        )
+        self._history_key = self._key
         self._attr_native_unit_of_measurement = unit
         self._attr_device_class = device_class
         self._attr_state_class = state_class
@@ -277,7 +427,13 @@ class ComfoClimeTelemetrySensor(SensorEntity):
 
     @property
     def state(self):
-        return self._state
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get(self._key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_write_state(self.state)
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -292,25 +448,14 @@ class ComfoClimeTelemetrySensor(SensorEntity):
             sw_version=self._device.get("version", None),
         )
 
-    async def async_update(self):
-        try:
-            self._state = await self._api.async_read_telemetry_for_device(
-                self._hass,
-                self._override_uuid or self._api.uuid,
-                self._id,
-                self._faktor,
-                self._signed,
-                self._byte_count,
-            )
-        except Exception as e:
-            _LOGGER.error(f"Fehler beim Aktualisieren von Telemetrie {self._id}: {e}")
-            self._state = None
-
 
-class ComfoClimePropertySensor(SensorEntity):
+class ComfoClimePropertySensor(
+    DeadbandMixin, CoordinatorEntity[ComfoClimePropertyCoordinator], SensorEntity
+):
     def __init__(
         self,
         hass,
+        coordinator,
         api,
         path: str,
         name: str,
@@ -320,13 +465,18 @@ class ComfoClimePropertySensor(SensorEntity):
         faktor: float = 1.0,
         signed: bool = True,
         byte_count: int | None = None,
+        value_type: str | None = None,
         device_class: str | None = None,
         state_class: str | None = None,
         mapping_key: str | None = None,
         device: dict | None = None,
         override_device_uuid: str | None = None,
+        refresh: str = PROPERTY_REFRESH_FAST,
+        deadband: float | None = None,
+        diagnose: bool = False,
         entry: ConfigEntry,
     ):
+        super().__init__(coordinator)
         self._hass = hass
         self._api = api
         self._path = path
@@ -334,13 +484,23 @@ class ComfoClimePropertySensor(SensorEntity):
         self._faktor = faktor
         self._signed = signed
         self._byte_count = byte_count
+        self._deadband = deadband
         self._attr_native_unit_of_measurement = unit
         self._attr_device_class = device_class
         self._attr_state_class = state_class
         self._mapping_key = mapping_key
         self._device = device
         self._override_uuid = override_device_uuid
-        self._state = None
+        self._key = coordinator.register_property(
+            override_device_uuid or api.uuid,
+            path,
+            faktor,
+            signed,
+            byte_count,
+            refresh,
+            value_type,
+            PRIORITY_DIAGNOSTIC if diagnose else PRIORITY_PRIMARY,
+        )
         self._attr_config_entry_id = entry.entry_id
         self._attr_unique_id = f"{entry.entry_id}_property_{path.replace('/', '_')}"
         if not translation_key:
@@ -351,7 +511,16 @@ class ComfoClimePropertySensor(SensorEntity):
 
     @property
     def native_value(self):
-        return self._state
+        if not self.coordinator.data:
+            return None
+        value = self.coordinator.data.get(self._key)
+        if self._mapping_key and self._mapping_key in VALUE_MAPPINGS:
+            return VALUE_MAPPINGS[self._mapping_key].get(value, value)
+        return value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_write_state(self.native_value)
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -365,20 +534,100 @@ class ComfoClimePropertySensor(SensorEntity):
             sw_version=self._device.get("version"),
         )
 
-    async def async_update(self):
-        try:
-            value = await self._api.async_read_property_for_device(
-                self._hass,
-                self._override_uuid or self._api.uuid,
-                self._path,
-                self._faktor,
-                self._signed,
-                self._byte_count,
-            )
-            if self._mapping_key and self._mapping_key in VALUE_MAPPINGS:
-                self._state = VALUE_MAPPINGS[self._mapping_key].get(value, value)
-            else:
-                self._state = value
-        except Exception as e:
-            _LOGGER.error(f"Fehler beim Abrufen von Property {self._path}: {e}")
-            self._state = None
+
+class ComfoClimeRequestStatsSensor(
+    CoordinatorEntity[ComfoClimeDashboardCoordinator], SensorEntity
+):
+    """Request statistics of the API, updated with every dashboard update."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, hass, coordinator, api, conf, device=None, entry=None):
+        super().__init__(coordinator)
+        self._hass = hass
+        self._api = api
+        self._key = conf["key"]
+        self._faktor = conf.get("faktor", 1)
+        self._device = device
+        self._attr_native_unit_of_measurement = conf.get("unit")
+        self._attr_device_class = conf.get("device_class")
+        self._attr_state_class = conf.get("state_class")
+        self._attr_config_entry_id = entry.entry_id
+        self._attr_unique_id = f"{entry.entry_id}_request_stats_{self._key}"
+        self._attr_translation_key = conf["translation_key"]
+        self._attr_has_entity_name = True
+
+    @property
+    def native_value(self):
+        value = getattr(self._api.stats.totals(), self._key)
+        if value is None:
+            return None
+        return round(value * self._faktor, 1) if self._faktor != 1 else value
+
+    @property
+    def extra_state_attributes(self):
+        # Aufschlüsselung nach Endpunkt, bei der Latenz mit Histogramm
+        return {
+            endpoint: stats.as_dict()
+            if self._key == "latency_mean"
+            else getattr(stats, self._key)
+            for endpoint, stats in self._api.stats.endpoints.items()
+        }
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        if not self._device:
+            return None
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._device["uuid"])},
+            name=self._device.get("displayName", "ComfoClime"),
+            manufacturer="Zehnder",
+            model=self._device.get("@modelType"),
+            sw_version=self._device.get("version"),
+        )
+
+
+class ComfoClimeDerivedSensor(RestoreSensor):
+    """Metric computed by DerivedMetrics from the coordinators' data.
+
+    Totals (energies, runtime) continue from their last state after a restart.
+    """
+
+    _attr_should_poll = False
+
+    def __init__(self, derived, conf, device=None, entry=None):
+        self._derived = derived
+        self._key = conf["key"]
+        self._device = device
+        self._attr_native_unit_of_measurement = conf.get("unit")
+        self._attr_device_class = conf.get("device_class")
+        self._attr_state_class = conf.get("state_class")
+        self._attr_suggested_display_precision = conf.get("precision")
+        self._attr_config_entry_id = entry.entry_id
+        self._attr_unique_id = f"{entry.entry_id}_derived_{self._key}"
+        self._attr_translation_key = conf["translation_key"]
+        self._attr_has_entity_name = True
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._attr_state_class == "total_increasing":
+            last = await self.async_get_last_sensor_data()
+            if last is not None and isinstance(last.native_value, (int, float)):
+                self._derived.restore(self._key, float(last.native_value))
+        self.async_on_remove(self._derived.add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self):
+        return self._derived.values()[self._key]
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        if not self._device:
+            return None
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._device["uuid"])},
+            name=self._device.get("displayName", "ComfoClime"),
+            manufacturer="Zehnder",
+            model=self._device.get("@modelType"),
+            sw_version=self._device.get("version"),
+        )
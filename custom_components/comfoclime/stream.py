@@ -0,0 +1,202 @@
+"""Continuous sampling of selected values for consumers outside the coordinators.
+
+``ComfoClimeAPI.stream`` wraps ``async_stream``: every tick reads the selected
+dashboard keys, telemetry IDs and property paths through the API (same
+scheduler, circuit breaker and session as Home Assistant) and yields one
+``Snapshot``. The next tick is only read after the consumer asked for it, so
+a slow consumer drops ticks instead of piling up snapshots.
+"""
+
+import asyncio
+import time
+
+from .codec import codec_for
+from .request_scheduler import PRIORITY_READ
+
+
+class Snapshot:
+    """Values of one tick, keyed like the coordinators' ``data``.
+
+    ``telemetry`` and ``properties`` are keyed by ``(device_uuid, id)`` and
+    ``(device_uuid, path)``, ``errors`` by the same keys (``"dashboard"`` for
+    the dashboard). ``skipped`` counts the ticks dropped before this one.
+    """
+
+    __slots__ = (
+        "sequence",
+        "timestamp",
+        "duration",
+        "skipped",
+        "dashboard",
+        "telemetry",
+        "properties",
+        "errors",
+    )
+
+    def __init__(
+        self,
+        sequence: int,
+        timestamp: float,
+        duration: float,
+        skipped: int,
+        dashboard: dict,
+        telemetry: dict,
+        properties: dict,
+        errors: dict,
+    ):
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.duration = duration
+        self.skipped = skipped
+        self.dashboard = dashboard
+        self.telemetry = telemetry
+        self.properties = properties
+        self.errors = errors
+
+    def __repr__(self):
+        return (
+            f"Snapshot(sequence={self.sequence}, timestamp={self.timestamp:.3f}, "
+            f"values={len(self.dashboard) + len(self.telemetry) + len(self.properties)}, "
+            f"errors={len(self.errors)})"
+        )
+
+    def as_dict(self) -> dict:
+        """Return the snapshot as JSON-serializable dict, devices nested by UUID."""
+
+        def nested(values):
+            result = {}
+            for (device_uuid, key), value in values.items():
+                result.setdefault(device_uuid, {})[str(key)] = value
+            return result
+
+        return {
+            "sequence": self.sequence,
+            "timestamp": self.timestamp,
+            "duration": round(self.duration, 4),
+            "skipped": self.skipped,
+            "dashboard": self.dashboard,
+            "telemetry": nested(self.telemetry),
+            "properties": nested(self.properties),
+            "errors": {
+                key if isinstance(key, str) else "/".join(map(str, key)): error
+                for key, error in self.errors.items()
+            },
+        }
+
+
+def _spec(item, id_keys: tuple[str, ...], default_uuid: str) -> tuple:
+    """Normalize an ID/path or a definition dict to ``(key, codec arguments)``."""
+    if not isinstance(item, dict):
+        item = {id_keys[0]: item}
+    value_id = next(item[key] for key in id_keys if key in item)
+    return (
+        (item.get("device_uuid", default_uuid), value_id),
+        (
+            item.get("byte_count"),
+            item.get("signed", True),
+            item.get("faktor", 1.0),
+            item.get("type"),
+        ),
+    )
+
+
+def _decode_all(specs: list, results: list, errors: dict) -> dict:
+    values = {}
+    for (key, (byte_count, signed, faktor, value_type)), result in zip(
+        specs, results
+    ):
+        try:
+            if isinstance(result, Exception):
+                raise result
+            codec = codec_for(byte_count or len(result), signed, faktor, value_type)
+            values[key] = codec.decode(result)
+        except Exception as e:
+            errors[key] = str(e) or type(e).__name__
+    return values
+
+
+async def async_stream(
+    api,
+    interval: float,
+    dashboard=False,
+    telemetry=(),
+    properties=(),
+    priority: int = PRIORITY_READ,
+    count: int | None = None,
+):
+    """Yield a Snapshot every ``interval`` seconds.
+
+    ``dashboard`` is True for all dashboard keys or an iterable of keys.
+    ``telemetry`` and ``properties`` take telemetry IDs / property paths of
+    the ComfoClime or definition dicts as in ``entities/sensor_definitions.py``
+    (``telemetry_id`` or ``id``, ``path``, ``faktor``, ``signed``,
+    ``byte_count``, ``type`` and an optional ``device_uuid``). Failed reads
+    end up in ``Snapshot.errors``; the stream ends after ``count`` snapshots
+    or when the consumer stops iterating.
+    """
+    if interval <= 0:
+        raise ValueError("interval must be positive")
+    default_uuid = await api._async_ensure_uuid() if telemetry or properties else None
+    telemetry_specs = [
+        _spec(item, ("telemetry_id", "id"), default_uuid) for item in telemetry
+    ]
+    property_specs = [_spec(item, ("path",), default_uuid) for item in properties]
+    dashboard_keys = (
+        None if dashboard is True or not dashboard else frozenset(dashboard)
+    )
+
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    sequence = 0
+    skipped = 0
+    while count is None or sequence < count:
+        delay = next_tick - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        timestamp = time.time()
+        started = loop.time()
+        reads = [
+            api.async_read_telemetry_raw(*key, priority) for key, _ in telemetry_specs
+        ] + [
+            api.async_read_property_data(*key, priority) for key, _ in property_specs
+        ]
+        if dashboard:
+            reads.append(api.async_get_dashboard_data())
+        results = await asyncio.gather(*reads, return_exceptions=True)
+
+        errors = {}
+        dashboard_values = {}
+        if dashboard:
+            result = results.pop()
+            if isinstance(result, Exception):
+                errors["dashboard"] = str(result) or type(result).__name__
+            else:
+                dashboard_values = {
+                    key: value
+                    for key, value in result.items()
+                    if dashboard_keys is None or key in dashboard_keys
+                }
+
+        telemetry_values = _decode_all(telemetry_specs, results, errors)
+        property_values = _decode_all(
+            property_specs, results[len(telemetry_specs) :], errors
+        )
+
+        yield Snapshot(
+            sequence,
+            timestamp,
+            loop.time() - started,
+            skipped,
+            dashboard_values,
+            telemetry_values,
+            property_values,
+            errors,
+        )
+        sequence += 1
+
+        # Komplett verpasste Takte (langsamer Verbraucher oder Gerät) werden
+        # ausgelassen statt nachgeholt
+        next_tick += interval
+        skipped = max(0, int((loop.time() - next_tick) // interval))
+        next_tick += skipped * interval
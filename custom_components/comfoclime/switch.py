@@ -8,7 +8,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DOMAIN
-from .comfoclime_api import ComfoClimeAPI
 from .coordinator import ComfoClimeThermalprofileCoordinator
 from .coordinator import ComfoClimeDashboardCoordinator
 from .entities.switch_definitions import SWITCHES
@@ -19,15 +18,7 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
-    host = entry.data["host"]
-    api = ComfoClimeAPI(f"http://{host}")
-
     switches = []
-    try:
-        await api.async_get_uuid(hass)
-    except Exception as e:
-        _LOGGER.error(f"UUID konnte nicht geladen werden: {e}")
-        return
     devices = hass.data[DOMAIN][entry.entry_id]["devices"]
     main_device = hass.data[DOMAIN][entry.entry_id]["main_device"]
 
@@ -35,10 +26,6 @@ async def async_setup_entry(
     api = data["api"]
     tpcoordinator = data["tpcoordinator"]
     dbcoordinator = data["coordinator"]
-    try:
-        await tpcoordinator.async_config_entry_first_refresh()
-    except Exception as e:
-        _LOGGER.warning(f"Thermalprofile-Daten konnten nicht geladen werden: {e}")
 
     switches.extend(
         ComfoClimeModeSwitch(
@@ -64,7 +51,7 @@ async def async_setup_entry(
         )
     )
 
-    async_add_entities(switches, True)
+    async_add_entities(switches)
 
 
 class ComfoClimeModeSwitch(
@@ -112,7 +99,15 @@ class ComfoClimeModeSwitch(
             sw_version=self._device.get("version", None),
         )
 
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._handle_coordinator_update()
+
     def _handle_coordinator_update(self):
+        if self.coordinator.data is None:
+            self.async_write_ha_state()
+            return
         data = self.coordinator.data
         try:
             # Zugriff auf verschachtelte Keys wie ["season"]["status"]
@@ -125,13 +120,13 @@ class ComfoClimeModeSwitch(
             self._state = None
         self.async_write_ha_state()
 
-    def turn_on(self, **kwargs):
-        self._set_status(1)
+    async def async_turn_on(self, **kwargs):
+        await self._async_set_status(1)
 
-    def turn_off(self, **kwargs):
-        self._set_status(0)
+    async def async_turn_off(self, **kwargs):
+        await self._async_set_status(0)
 
-    def _set_status(self, value):
+    async def _async_set_status(self, value):
         # Leeres Grundobjekt mit null
         updates = {"season": {"status": None}, "temperature": {"status": None}}
 
@@ -141,9 +136,7 @@ class ComfoClimeModeSwitch(
         updates[section][key] = value
 
         try:
-            self._api.update_thermal_profile(updates)
-            self._state = value == 1
-            self.hass.create_task(self.coordinator.async_request_refresh())
+            await self.coordinator.async_update_thermal_profile(updates)
 
         except Exception as e:
             _LOGGER.error(f"Fehler beim Setzen von {self._name}: {e}")
@@ -191,7 +184,15 @@ class ComfoClimeStandbySwitch(
             sw_version=self._device.get("version", None),
         )
 
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._handle_coordinator_update()
+
     def _handle_coordinator_update(self):
+        if self.coordinator.data is None:
+            self.async_write_ha_state()
+            return
         data = self.coordinator.data
         try:
             # Zugriff auf verschachtelte Keys wie ["season"]["status"]
@@ -206,20 +207,18 @@ class ComfoClimeStandbySwitch(
             self._state = None
         self.async_write_ha_state()
 
-    def turn_on(self, **kwargs):
-        self._set_status(1)
+    async def async_turn_on(self, **kwargs):
+        await self._async_set_status(1)
 
-    def turn_off(self, **kwargs):
-        self._set_status(0)
+    async def async_turn_off(self, **kwargs):
+        await self._async_set_status(0)
 
-    def _set_status(self, value):
+    async def _async_set_status(self, value):
         try:
             if value == 0:
-                self._api.update_dashboard(hp_standby=True)
+                await self.coordinator.async_update_dashboard(hp_standby=True)
             if value == 1:
-                self._api.update_dashboard(hp_standby=False)
-            self._state = value == 1
-            self.hass.create_task(self.coordinator.async_request_refresh())
+                await self.coordinator.async_update_dashboard(hp_standby=False)
 
         except Exception as e:
             _LOGGER.error(f"Fehler beim Setzen von {self._name}: {e}")
@@ -1,18 +1,29 @@
-from custom_components.comfoclime.comfoclime_api import ComfoClimeAPI
 import asyncio
+import os
+import sys
+
+from custom_components.comfoclime.comfoclime_api import ComfoClimeAPI
+
+# Host aus der Kommandozeile oder COMFOCLIME_HOST, z. B. tools/simulator.py
+HOST = sys.argv[1] if len(sys.argv) > 1 else os.environ.get(
+    "COMFOCLIME_HOST", "127.0.0.1:8080"
+)
+
 
 async def test_set_property():
-    api = ComfoClimeAPI("http://10.0.10.95")  # deine IP
-    await api.async_get_uuid(None)  # nur wenn du die uuid brauchst
+    api = ComfoClimeAPI(f"http://{HOST}")
+    try:
+        uuid = await api.async_get_uuid()
 
-    await api.async_set_property_for_device(
-        hass=None,  # Wenn du es im echten HA testest: echten Hass übergeben
-        device_uuid="MBE4022d8393df5",  # deine echte UUID
-        property_path="29/1/10",
-        value=1,
-        byte_count=1,
-        signed=False,
-        faktor=1.0,
-    )
+        await api.async_set_property_for_device(
+            device_uuid=uuid,
+            property_path="29/1/10",
+            value=1,
+            byte_count=1,
+            signed=False,
+            faktor=1.0,
+        )
+    finally:
+        await api.async_close()
 
-asyncio.run(test_set_property())
\ No newline at end of file
+asyncio.run(test_set_property())
@@ -0,0 +1,56 @@
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Felder der Geräteliste, deren Änderung ein Neuladen des Eintrags erfordert
+TOPOLOGY_DEVICE_FIELDS = ("uuid", "modelTypeId", "@modelType", "displayName", "version")
+
+
+def find_main_device(devices: list) -> dict | None:
+    """Return the ComfoClime unit (modelTypeId 20) from the device list."""
+    return next((d for d in devices if d.get("modelTypeId") == 20), None)
+
+
+def topology_signature(uuid: str, devices: list) -> tuple:
+    """Reduce UUID and device list to the fields the entities are built from."""
+    return (
+        uuid,
+        tuple(
+            tuple(device.get(field) for field in TOPOLOGY_DEVICE_FIELDS)
+            for device in devices
+        ),
+    )
+
+
+class TopologyCache:
+    """Persist the device UUID and the connected devices of a config entry.
+
+    With a cached topology the entry is set up without waiting for
+    ``/monitoring/ping`` and ``/system/{uuid}/devices``; the topology is then
+    revalidated in the background.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store = Store(hass, STORAGE_VERSION, f"comfoclime.topology.{entry_id}")
+
+    async def async_load(self) -> dict | None:
+        """Return ``{"uuid": ..., "devices": [...]}`` or None if nothing is cached."""
+        try:
+            data = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.warning(f"Gespeicherte Topologie nicht lesbar: {e}")
+            return None
+        if not data or not data.get("uuid") or not isinstance(data.get("devices"), list):
+            return None
+        return data
+
+    async def async_save(self, uuid: str, devices: list):
+        await self._store.async_save({"uuid": uuid, "devices": devices})
+
+    async def async_remove(self):
+        await self._store.async_remove()
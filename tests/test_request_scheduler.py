@@ -0,0 +1,37 @@
+"""Regression tests for the RequestScheduler (no Home Assistant needed)."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from integration import import_module  # noqa: E402
+
+request_scheduler = import_module("request_scheduler")
+
+
+def test_waiter_cancelled_while_slot_is_released():
+    async def scenario():
+        scheduler = request_scheduler.RequestScheduler(1)
+        holder = scheduler.slot()
+        await holder.__aenter__()
+        waiter = asyncio.create_task(scheduler._async_acquire(0))
+        await asyncio.sleep(0)
+        assert scheduler.queued == 1
+
+        # Abbruch und Freigabe im selben Durchlauf: _dispatch entnimmt den
+        # bereits abgebrochenen Future, bevor der Waiter weiterläuft
+        waiter.cancel()
+        await holder.__aexit__(None, None, None)
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert scheduler.active == 0
+        assert scheduler.queued == 0
+        async with scheduler.slot():
+            assert scheduler.active == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,288 @@
+"""Benchmark full poll cycles of the integration against the simulator.
+
+Sets up the integration in a throw-away Home Assistant instance (the
+``homeassistant`` package must be installed) against tools/simulator.py, once
+per mode: ``minimal`` (minimal_mode), ``default`` and ``diagnostics``
+(enable_diagnostics). For each mode it reports
+
+* setup: wall time and requests of async_setup_entry including the first
+  refresh of all coordinators,
+* cycles: wall time and requests of a full refresh of all coordinators,
+* per-request latency (p50/p95/p99) as seen by ComfoClimeAPI, including the
+  wait for a request slot,
+* executor usage: jobs submitted to the executor and peak thread count.
+
+    python tools/benchmark.py --cycles 5 --latency 0.03 --serial -o benchmark.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import simulator
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DOMAIN = "comfoclime"
+
+MODES = {
+    "minimal": {"minimal_mode": True},
+    "default": {},
+    "diagnostics": {"enable_diagnostics": True},
+}
+
+# Schlüssel der Coordinatoren in hass.data[DOMAIN][entry_id]
+COORDINATOR_KEYS = (
+    "coordinator",
+    "tpcoordinator",
+    "telemetry_coordinator",
+    "property_coordinator",
+)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile, None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(values):
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean": statistics.fmean(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values),
+    }
+
+
+class ExecutorProbe:
+    """Count executor jobs and sample the peak number of live threads."""
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._run_in_executor = loop.run_in_executor
+        self.jobs = 0
+        self.peak_threads = threading.active_count()
+        self._sampler = None
+
+    def _counting_run_in_executor(self, executor, func, *args):
+        self.jobs += 1
+        return self._run_in_executor(executor, func, *args)
+
+    async def _async_sample(self):
+        while True:
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+            await asyncio.sleep(0.01)
+
+    def start(self):
+        self._loop.run_in_executor = self._counting_run_in_executor
+        self._sampler = self._loop.create_task(self._async_sample())
+
+    def reset(self):
+        self.jobs = 0
+        self.peak_threads = threading.active_count()
+
+    def stop(self):
+        self._loop.run_in_executor = self._run_in_executor
+        if self._sampler is not None:
+            self._sampler.cancel()
+
+
+def instrument_api(api, latencies):
+    """Record the duration of every request made by ``api`` in ``latencies``."""
+    request = api._async_request
+
+    async def timed_request(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await request(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    api._async_request = timed_request
+
+
+async def async_start_hass(config_dir):
+    from homeassistant import bootstrap, config_entries, core, loader
+    from homeassistant.setup import async_setup_component
+
+    hass = core.HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    hass.config.set_time_zone("Europe/Berlin")
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    await async_setup_component(hass, "homeassistant", {})
+    hass.set_state(core.CoreState.running)
+    return hass
+
+
+async def async_run_mode(mode, options, args):
+    from homeassistant import config_entries
+
+    sim = simulator.simulator_from_args(args)
+    address = await sim.async_start("127.0.0.1", 0)
+    latencies = []
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        probe = ExecutorProbe(hass.loop)
+        probe.start()
+        entry = config_entries.ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title="ComfoClime benchmark",
+            data={"host": address},
+            source="user",
+            options=options,
+        )
+
+        # Die API-Instanz entsteht erst im Setup, daher hier einklinken
+        from custom_components.comfoclime import comfoclime_api
+
+        original_init = comfoclime_api.ComfoClimeAPI.__init__
+
+        def init_and_instrument(api, *init_args, **init_kwargs):
+            original_init(api, *init_args, **init_kwargs)
+            instrument_api(api, latencies)
+
+        comfoclime_api.ComfoClimeAPI.__init__ = init_and_instrument
+        try:
+            start = time.perf_counter()
+            await hass.config_entries.async_add(entry)
+            await hass.async_block_till_done()
+            setup = {
+                "wall_time": time.perf_counter() - start,
+                "requests": sim.stats["requests"],
+                "executor_jobs": probe.jobs,
+                "peak_threads": probe.peak_threads,
+                "entities": len(hass.states.async_all()),
+            }
+        finally:
+            comfoclime_api.ComfoClimeAPI.__init__ = original_init
+        if entry.state is not config_entries.ConfigEntryState.LOADED:
+            raise RuntimeError(f"{mode}: setup failed ({entry.state})")
+
+        data = hass.data[DOMAIN][entry.entry_id]
+        coordinators = [data[key] for key in COORDINATOR_KEYS]
+        latencies.clear()
+        cycles = []
+        for _ in range(args.cycles):
+            sim.reset_stats()
+            probe.reset()
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(coordinator.async_refresh() for coordinator in coordinators)
+            )
+            await hass.async_block_till_done()
+            cycles.append(
+                {
+                    "wall_time": time.perf_counter() - start,
+                    "requests": sim.stats["requests"],
+                    "executor_jobs": probe.jobs,
+                    "peak_threads": probe.peak_threads,
+                }
+            )
+
+        api_stats = data["api"].stats.as_dict()
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        probe.stop()
+        await hass.async_stop(force=True)
+    await sim.async_stop()
+
+    return {
+        "options": options,
+        "setup": setup,
+        "cycles": cycles,
+        "cycle_wall_time": summarize([cycle["wall_time"] for cycle in cycles]),
+        "requests_per_cycle": statistics.fmean(cycle["requests"] for cycle in cycles)
+        if cycles
+        else 0,
+        "request_latency": summarize(latencies),
+        "api_stats": api_stats,
+    }
+
+
+def print_report(results):
+    print(
+        f"{'mode':<12} {'setup s':>8} {'setup req':>9} {'cycle s':>8} "
+        f"{'req/cycle':>9} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} "
+        f"{'jobs':>5} {'threads':>7}"
+    )
+    for mode, result in results.items():
+        latency = result["request_latency"]
+
+        def ms(key):
+            value = latency.get(key)
+            return f"{value * 1000:7.1f}" if value is not None else "      -"
+
+        cycles = result["cycles"]
+        print(
+            f"{mode:<12} {result['setup']['wall_time']:8.2f} "
+            f"{result['setup']['requests']:9d} "
+            f"{result['cycle_wall_time'].get('mean', 0):8.2f} "
+            f"{result['requests_per_cycle']:9.1f} {ms('p50')} {ms('p95')} {ms('p99')} "
+            f"{max((cycle['executor_jobs'] for cycle in cycles), default=0):5d} "
+            f"{max((cycle['peak_threads'] for cycle in cycles), default=0):7d}"
+        )
+
+
+async def _async_main(args):
+    results = {}
+    for mode in args.modes:
+        results[mode] = await async_run_mode(mode, MODES[mode], args)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=list(MODES),
+        default=list(MODES),
+        help="modes to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--cycles", type=int, default=5, help="poll cycles per mode after setup"
+    )
+    parser.add_argument("-o", "--output", help="write the results as JSON")
+    simulator.add_arguments(parser)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    # Die Integration aus diesem Repository laden
+    sys.path.insert(0, str(REPO_ROOT))
+    results = asyncio.run(_async_main(args))
+    report = {
+        "simulator": {
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "error_rate": args.error_rate,
+            "timeout_rate": args.timeout_rate,
+            "serial": args.serial,
+        },
+        "modes": results,
+    }
+    print_report(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
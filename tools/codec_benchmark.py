@@ -0,0 +1,122 @@
+"""Compare the per-value decode cost of codec.py with the former static methods.
+
+The baseline is a copy of ``ComfoClimeAPI.bytes_to_signed_int`` and the
+scaling done in ``async_read_telemetry_for_device`` before codec.py existed.
+codec.py has no dependencies and is loaded directly from the integration, so
+this runs without Home Assistant:
+
+    python tools/codec_benchmark.py --number 200000
+"""
+
+import argparse
+import importlib.util
+import timeit
+from pathlib import Path
+
+CODEC_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "comfoclime"
+    / "codec.py"
+)
+
+
+def load_codec():
+    spec = importlib.util.spec_from_file_location("comfoclime_codec", CODEC_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_bytes_to_signed_int(data, byte_count=None, signed=True):
+    if not isinstance(data, list):
+        raise ValueError("'data' is not a list")
+
+    if byte_count is None:
+        byte_count = len(data)
+
+    if byte_count not in (1, 2):
+        raise ValueError(f"Unsupported byte count: {byte_count}")
+
+    return int.from_bytes(data[:byte_count], byteorder="little", signed=signed)
+
+
+def legacy_signed_int_to_bytes(data, byte_count=2, signed=False):
+    return list(data.to_bytes(byte_count, byteorder="little", signed=signed))
+
+
+def legacy_fix_signed_temperature(api_value):
+    raw_value = int(api_value * 10)
+    unsigned_value = raw_value & 0xFFFF
+    bytes_data = legacy_signed_int_to_bytes(unsigned_value, 2)
+    signed_value = legacy_bytes_to_signed_int(bytes_data)
+    return signed_value / 10.0
+
+
+# (Name, Daten, byte_count, signed, faktor)
+CASES = (
+    ("INT16 x0.1", [0xDB, 0x00], 2, True, 0.1),
+    ("INT16 negative", [0x9C, 0xFF], 2, True, 0.1),
+    ("UINT16", [0x2C, 0x01], 2, False, 1.0),
+    ("INT8", [0xFE], 1, True, 1.0),
+    ("UINT8", [0x03], 1, False, 1.0),
+)
+
+
+def run(number, repeat):
+    codec = load_codec()
+    results = []
+
+    def best(stmt):
+        return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number
+
+    for name, data, byte_count, signed, faktor in CASES:
+        value_codec = codec.codec_for(byte_count, signed, faktor)
+        expected = legacy_bytes_to_signed_int(data, byte_count, signed) * faktor
+        if value_codec.decode(data) != expected:
+            raise AssertionError(f"{name}: {value_codec.decode(data)} != {expected}")
+        legacy = best(
+            lambda: legacy_bytes_to_signed_int(data, byte_count, signed) * faktor
+        )
+        # Wie in den Coordinatoren: Codec einmal bei der Registrierung erzeugt
+        compiled = best(lambda: value_codec.decode(data))
+        # Wie in der API: Codec bei jedem Aufruf aus dem Cache geholt
+        cached = best(lambda: codec.codec_for(byte_count, signed, faktor).decode(data))
+        results.append((name, legacy, compiled, cached))
+
+    for value in (21.9, 6552.6):
+        if codec.fix_signed_temperature(value) != legacy_fix_signed_temperature(value):
+            raise AssertionError(f"fix_signed_temperature({value})")
+    results.append(
+        (
+            "fix_signed_temperature",
+            best(lambda: legacy_fix_signed_temperature(6552.6)),
+            best(lambda: codec.fix_signed_temperature(6552.6)),
+            None,
+        )
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--number", type=int, default=100000, help="decodes per measurement"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per case")
+    args = parser.parse_args()
+
+    print(
+        f"{'case':<24} {'legacy ns':>10} {'codec ns':>10} {'speedup':>8} "
+        f"{'codec_for ns':>13}"
+    )
+    for name, legacy, compiled, cached in run(args.number, args.repeat):
+        cached_text = f"{cached * 1e9:13.0f}" if cached is not None else " " * 12 + "-"
+        print(
+            f"{name:<24} {legacy * 1e9:10.0f} {compiled * 1e9:10.0f} "
+            f"{legacy / compiled:7.2f}x {cached_text}"
+        )
+
+
+if __name__ == "__main__":
+    main()
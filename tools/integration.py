@@ -0,0 +1,25 @@
+"""Import the modules of the integration that do not need Home Assistant.
+
+The package ``__init__`` imports Home Assistant, so the integration directory
+is registered as a bare ``comfoclime`` package instead. Only modules without
+Home Assistant imports (comfoclime_api, scanner, codec, ...) can be loaded.
+"""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+PACKAGE = "comfoclime"
+PACKAGE_DIR = (
+    Path(__file__).resolve().parent.parent / "custom_components" / "comfoclime"
+)
+
+
+def import_module(name: str):
+    """Return ``comfoclime.<name>`` without running the package ``__init__``."""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(PACKAGE_DIR)]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{name}")
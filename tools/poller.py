@@ -0,0 +1,208 @@
+"""Sample ComfoClime values at a fixed rate and write them as JSON Lines.
+
+Runs without Home Assistant (needs only ``aiohttp``) on top of
+``ComfoClimeAPI.stream``. Values are selected as ``[UUID:]ID`` for telemetry
+and ``[UUID:]UNIT/SUBUNIT/PROPERTY`` for properties, without UUID on the
+ComfoClime itself; factor, sign and size come from the definitions in
+entities/ when the value has one. ``--defined`` adds every telemetry and
+property definition of the connected devices. One line per sample:
+
+    python tools/poller.py 192.168.1.100 --interval 1 --telemetry 4193 4201 \\
+        --telemetry SIT123:278 --dashboard -o session.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import signal
+import sys
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from integration import import_module
+
+comfoclime_api = import_module("comfoclime_api")
+sensor_definitions = import_module("entities.sensor_definitions")
+
+# Angaben einer Definition, die für das Dekodieren gebraucht werden
+_CODEC_KEYS = ("faktor", "signed", "byte_count", "type")
+
+
+def parse_selection(text: str) -> tuple[str | None, str]:
+    """Split ``[UUID:]ID`` into UUID (None for the ComfoClime) and ID."""
+    device_uuid, _, value_id = text.rpartition(":")
+    return device_uuid or None, value_id
+
+
+def definitions(model_id) -> tuple[dict, dict]:
+    """Return the telemetry and property definitions of a model by ID/path."""
+    telemetry = {
+        d["telemetry_id"]: d
+        for d in sensor_definitions.CONNECTED_DEVICE_SENSORS.get(model_id, [])
+    }
+    properties = {
+        d["path"]: d
+        for d in sensor_definitions.CONNECTED_DEVICE_PROPERTIES.get(model_id, [])
+    }
+    return telemetry, properties
+
+
+def build_selection(args, api_uuid: str, devices: list) -> tuple[list, list]:
+    """Turn the command line into definition dicts for ``api.stream``."""
+    models = {device.get("uuid"): device.get("modelTypeId") for device in devices}
+    telemetry = {}
+    properties = {}
+
+    def add(target, key, definition):
+        target[key] = {
+            **{k: v for k, v in definition.items() if k in _CODEC_KEYS},
+            "device_uuid": key[0],
+        }
+
+    if args.defined:
+        for device_uuid, model_id in models.items():
+            if device_uuid in (None, "NULL"):
+                continue
+            telemetry_defs, property_defs = definitions(model_id)
+            for telemetry_id, definition in telemetry_defs.items():
+                add(telemetry, (device_uuid, telemetry_id), definition)
+            for path, definition in property_defs.items():
+                add(properties, (device_uuid, path), definition)
+
+    for text in args.telemetry:
+        device_uuid, value_id = parse_selection(text)
+        device_uuid = device_uuid or api_uuid
+        telemetry_id = int(value_id)
+        definition = definitions(models.get(device_uuid))[0].get(telemetry_id, {})
+        add(telemetry, (device_uuid, telemetry_id), definition)
+    for text in args.property:
+        device_uuid, path = parse_selection(text)
+        device_uuid = device_uuid or api_uuid
+        definition = definitions(models.get(device_uuid))[1].get(path, {})
+        add(properties, (device_uuid, path), definition)
+
+    return (
+        [{"telemetry_id": key[1], **d} for key, d in telemetry.items()],
+        [{"path": key[1], **d} for key, d in properties.items()],
+    )
+
+
+async def _async_main(args, output) -> dict:
+    time_zone = ZoneInfo(args.time_zone) if args.time_zone else None
+    api = comfoclime_api.ComfoClimeAPI(
+        f"http://{args.host}",
+        max_concurrent_requests=args.concurrency,
+        time_zone=args.time_zone,
+    )
+    summary = {"snapshots": 0, "skipped": 0, "errors": 0}
+    # Ctrl+C und SIGTERM beenden die Aufzeichnung, die Zusammenfassung folgt
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, task.cancel)
+        except NotImplementedError:
+            pass
+
+    try:
+        api_uuid = await api.async_get_uuid()
+        devices = await api.async_get_connected_devices()
+        telemetry, properties = build_selection(args, api_uuid, devices)
+        if not (telemetry or properties or args.dashboard):
+            raise SystemExit("nothing selected, see --help")
+        logging.info(
+            f"{len(telemetry)} telemetry values, {len(properties)} properties"
+            f"{', dashboard' if args.dashboard else ''} every {args.interval}s"
+        )
+
+        deadline = time.monotonic() + args.duration if args.duration else None
+        try:
+            async for snapshot in api.stream(
+                args.interval,
+                dashboard=args.dashboard,
+                telemetry=telemetry,
+                properties=properties,
+                count=args.count,
+            ):
+                line = snapshot.as_dict()
+                line["time"] = (
+                    datetime.fromtimestamp(snapshot.timestamp)
+                    .astimezone(time_zone)
+                    .isoformat(timespec="milliseconds")
+                )
+                output.write(json.dumps(line, separators=(",", ":")) + "\n")
+                output.flush()
+                summary["snapshots"] += 1
+                summary["skipped"] += snapshot.skipped
+                summary["errors"] += len(snapshot.errors)
+                if deadline and time.monotonic() >= deadline:
+                    break
+        except asyncio.CancelledError:
+            pass
+    finally:
+        await api.async_close()
+    summary["requests"] = api.stats.totals().count
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("host", help="host[:port] of the ComfoClime")
+    parser.add_argument(
+        "--telemetry",
+        nargs="+",
+        action="extend",
+        default=[],
+        metavar="[UUID:]ID",
+        help="telemetry IDs to sample (repeatable)",
+    )
+    parser.add_argument(
+        "--property",
+        nargs="+",
+        action="extend",
+        default=[],
+        metavar="[UUID:]PATH",
+        help="property paths like 22/1/9 to sample (repeatable)",
+    )
+    parser.add_argument(
+        "--defined",
+        action="store_true",
+        help="add all telemetry and property definitions of the connected devices",
+    )
+    parser.add_argument(
+        "--dashboard", action="store_true", help="add the dashboard values"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="seconds between two samples"
+    )
+    parser.add_argument("--count", type=int, help="stop after this many samples")
+    parser.add_argument("--duration", type=float, help="stop after this many seconds")
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="parallel requests (default: 1)"
+    )
+    parser.add_argument(
+        "--time-zone",
+        help="IANA time zone for the 'time' field, e.g. Europe/Berlin (default: local)",
+    )
+    parser.add_argument("-o", "--output", help="append the lines to this file")
+    args = parser.parse_args()
+    if args.interval <= 0:
+        parser.error("--interval must be positive")
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+
+    output = open(args.output, "a", encoding="utf-8") if args.output else sys.stdout
+    try:
+        summary = asyncio.run(_async_main(args, output))
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    logging.info(
+        f"{summary['snapshots']} samples, {summary['skipped']} skipped, "
+        f"{summary['errors']} errors, {summary['requests']} requests"
+    )
+
+
+if __name__ == "__main__":
+    main()
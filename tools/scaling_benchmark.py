@@ -0,0 +1,262 @@
+"""Benchmark many ComfoClime config entries in one Home Assistant instance.
+
+For every entry count (default 1, 2, 5, 10 and 20) it starts one
+tools/simulator.py device per entry, sets up one config entry per device in
+a throw-away Home Assistant instance (the ``homeassistant`` package must be
+installed) and reports
+
+* setup: wall time until all entries are loaded,
+* burst cycles: wall time of refreshing every coordinator of every entry at
+  once, the worst case without staggering,
+* observe: with ``--observe SECONDS`` the regular schedule runs for that long
+  and the refreshes that started are counted,
+* event loop lag (p50/p99/max) and the peak number of requests in flight or
+  waiting for the shared request budget, for burst and observe separately.
+
+    python tools/scaling_benchmark.py --entries 1 5 20 --latency 0.03 --serial
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import simulator
+from benchmark import COORDINATOR_KEYS, DOMAIN, async_start_hass, summarize
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class LoopProbe:
+    """Sample the event loop lag and the load of the shared request budget."""
+
+    def __init__(self, budget, interval: float = 0.01):
+        self._budget = budget
+        self._interval = interval
+        self._task = None
+        self.reset()
+
+    def reset(self):
+        self.lags = []
+        self.peak_active = 0
+        self.peak_queued = 0
+
+    async def _async_sample(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            self.lags.append(max(0.0, loop.time() - expected))
+            self.peak_active = max(self.peak_active, self._budget.active)
+            self.peak_queued = max(self.peak_queued, self._budget.queued)
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._async_sample())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    def report(self) -> dict:
+        return {
+            "loop_lag": summarize(self.lags),
+            "budget_peak_active": self.peak_active,
+            "budget_peak_queued": self.peak_queued,
+        }
+
+
+def count_refreshes(coordinators, counter):
+    """Count every refresh of the given coordinators in ``counter``."""
+    for coordinator in coordinators:
+        refresh = coordinator._async_update_data
+
+        async def counted(refresh=refresh):
+            counter[0] += 1
+            return await refresh()
+
+        coordinator._async_update_data = counted
+
+
+async def async_run_entries(count, args):
+    from homeassistant import config_entries
+
+    from custom_components.comfoclime.request_scheduler import DomainScheduler
+
+    sims = [simulator.simulator_from_args(args) for _ in range(count)]
+    addresses = [await sim.async_start("127.0.0.1", 0) for sim in sims]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        domain_scheduler = DomainScheduler(args.budget)
+        hass.data.setdefault(DOMAIN, {})["domain_scheduler"] = domain_scheduler
+        probe = LoopProbe(domain_scheduler.budget)
+        probe.start()
+
+        entries = [
+            config_entries.ConfigEntry(
+                version=1,
+                minor_version=1,
+                domain=DOMAIN,
+                title=f"ComfoClime {index}",
+                data={"host": address},
+                source="user",
+                options={},
+            )
+            for index, address in enumerate(addresses)
+        ]
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(hass.config_entries.async_add(entry) for entry in entries)
+        )
+        await hass.async_block_till_done()
+        setup = {"wall_time": time.perf_counter() - start, **probe.report()}
+        failed = [
+            entry.title
+            for entry in entries
+            if entry.state is not config_entries.ConfigEntryState.LOADED
+        ]
+        if failed:
+            raise RuntimeError(f"{count} entries: setup failed for {failed}")
+
+        coordinators = [
+            hass.data[DOMAIN][entry.entry_id][key]
+            for entry in entries
+            for key in COORDINATOR_KEYS
+        ]
+        cycles = []
+        for _ in range(args.cycles):
+            for sim in sims:
+                sim.reset_stats()
+            probe.reset()
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(coordinator.async_refresh() for coordinator in coordinators)
+            )
+            await hass.async_block_till_done()
+            cycles.append(
+                {
+                    "wall_time": time.perf_counter() - start,
+                    "requests": sum(sim.stats["requests"] for sim in sims),
+                    **probe.report(),
+                }
+            )
+
+        observe = None
+        if args.observe:
+            refreshes = [0]
+            count_refreshes(coordinators, refreshes)
+            for sim in sims:
+                sim.reset_stats()
+            probe.reset()
+            await asyncio.sleep(args.observe)
+            observe = {
+                "seconds": args.observe,
+                "refreshes": refreshes[0],
+                "requests": sum(sim.stats["requests"] for sim in sims),
+                **probe.report(),
+            }
+
+        for entry in entries:
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        probe.stop()
+        await hass.async_stop(force=True)
+    for sim in sims:
+        await sim.async_stop()
+
+    return {
+        "entries": count,
+        "setup": setup,
+        "cycles": cycles,
+        "cycle_wall_time": summarize([cycle["wall_time"] for cycle in cycles]),
+        "observe": observe,
+    }
+
+
+def print_report(results):
+    def ms(summary, key):
+        value = summary.get(key)
+        return f"{value * 1000:7.1f}" if value is not None else "      -"
+
+    print(
+        f"{'entries':>7} {'setup s':>8} {'cycle s':>8} {'req/cycle':>9} "
+        f"{'lag p50':>7} {'lag p99':>7} {'lag max':>7} {'active':>6} {'queued':>6}"
+    )
+    for result in results:
+        cycles = result["cycles"]
+        lag_max = {
+            "max": max((c["loop_lag"].get("max", 0) for c in cycles), default=0)
+        }
+        last = cycles[-1] if cycles else {"loop_lag": {}, "requests": 0}
+        print(
+            f"{result['entries']:7d} {result['setup']['wall_time']:8.2f} "
+            f"{result['cycle_wall_time'].get('mean', 0):8.2f} "
+            f"{last['requests']:9d} {ms(last['loop_lag'], 'p50')} "
+            f"{ms(last['loop_lag'], 'p99')} {ms(lag_max, 'max')} "
+            f"{max((c['budget_peak_active'] for c in cycles), default=0):6d} "
+            f"{max((c['budget_peak_queued'] for c in cycles), default=0):6d}"
+        )
+        if observe := result["observe"]:
+            print(
+                f"{'':>7} observe {observe['seconds']:.0f}s: "
+                f"{observe['refreshes']} refreshes, {observe['requests']} requests, "
+                f"lag p99 {ms(observe['loop_lag'], 'p99')} ms, "
+                f"peak queued {observe['budget_peak_queued']}"
+            )
+
+
+async def _async_main(args):
+    return [await async_run_entries(count, args) for count in args.entries]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--entries",
+        nargs="+",
+        type=int,
+        default=[1, 2, 5, 10, 20],
+        help="entry counts to benchmark (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cycles", type=int, default=3, help="burst cycles per entry count"
+    )
+    parser.add_argument(
+        "--observe",
+        type=float,
+        default=0.0,
+        help="seconds to watch the regular schedule per entry count",
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="requests in flight across all entries (default: integration default)",
+    )
+    parser.add_argument("-o", "--output", help="write the results as JSON")
+    simulator.add_arguments(parser)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    # Die Integration aus diesem Repository laden
+    sys.path.insert(0, str(REPO_ROOT))
+    if args.budget is None:
+        from custom_components.comfoclime.request_scheduler import (
+            DEFAULT_GLOBAL_MAX_CONCURRENT_REQUESTS,
+        )
+
+        args.budget = DEFAULT_GLOBAL_MAX_CONCURRENT_REQUESTS
+    results = asyncio.run(_async_main(args))
+    print_report(results)
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps({"budget": args.budget, "results": results}, indent=2)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Scan a ComfoClime for telemetry IDs and RMI properties without entities.
+
+Reads the candidate IDs of every connected device (or only ``--device``) and
+prints the ones that answer as definitions in the format of
+entities/sensor_definitions.py. Needs only ``aiohttp``:
+
+    python tools/scan.py 192.168.1.100 --telemetry 1-999,4096-4351 -o scan.py
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+from integration import import_module
+
+comfoclime_api = import_module("comfoclime_api")
+scanner = import_module("scanner")
+
+
+async def _async_main(args):
+    api = comfoclime_api.ComfoClimeAPI(
+        f"http://{args.host}", max_concurrent_requests=args.concurrency
+    )
+    try:
+        await api.async_get_uuid()
+        devices = await api.async_get_connected_devices()
+        if args.device:
+            devices = [d for d in devices if d.get("uuid") in args.device]
+        for device in devices:
+            print(
+                f"{device.get('uuid')}: {device.get('@modelType')} "
+                f"(modelTypeId {device.get('modelTypeId')})",
+                file=sys.stderr,
+            )
+        scans = await scanner.async_scan_devices(
+            api,
+            devices,
+            scanner.telemetry_candidates(scanner.parse_ranges(args.telemetry)),
+            scanner.property_candidates(
+                [int(unit) for unit in args.units.split(",")],
+                [int(subunit) for subunit in args.subunits.split(",")],
+                args.max_property,
+            ),
+            concurrency=args.concurrency,
+            interval=args.interval,
+        )
+    finally:
+        await api.async_close()
+    return scans
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("host", help="host[:port] of the ComfoClime")
+    parser.add_argument(
+        "--device", action="append", help="UUID of a device to scan (repeatable)"
+    )
+    parser.add_argument(
+        "--telemetry",
+        default=",".join(f"{a}-{b}" for a, b in scanner.DEFAULT_TELEMETRY_RANGES),
+        help="telemetry ID ranges (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--units",
+        default=",".join(map(str, scanner.DEFAULT_PROPERTY_UNITS)),
+        help="RMI units (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--subunits",
+        default=",".join(map(str, scanner.DEFAULT_PROPERTY_SUBUNITS)),
+        help="RMI subunits (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-property",
+        type=int,
+        default=scanner.DEFAULT_MAX_PROPERTY,
+        help="highest property number per unit (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=scanner.DEFAULT_SCAN_CONCURRENCY,
+        help="parallel requests (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=scanner.DEFAULT_SCAN_INTERVAL,
+        help="minimum seconds between two requests (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="include values that already have an entity",
+    )
+    parser.add_argument("-o", "--output", help="write the definitions to a file")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    scans = asyncio.run(_async_main(args))
+    text = scanner.render_definitions(
+        scans, None if args.all else scanner.known_registers()
+    )
+    if args.output:
+        Path(args.output).write_text(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,511 @@
+"""Offline stand-in for a ComfoClime device.
+
+Serves the HTTP endpoints documented in ComfoClimeAPI.md from an in-memory
+device state, so the integration can be exercised and benchmarked without
+hardware. Latency, jitter, error and timeout rates are configurable, and
+``--serial`` handles one request at a time like the real device.
+
+    python tools/simulator.py --port 8080 --latency 0.05 --jitter 0.02 --serial
+
+Telemetry and property sizes are taken from the entity definitions, so every
+value the integration polls exists. Unknown telemetry ids and property paths
+answer with 404. Writes are applied to the state and show up in later reads.
+
+Besides the device API the simulator serves ``GET /simulator/stats`` (request
+counters) and ``DELETE /simulator/stats`` (reset counters).
+"""
+
+import argparse
+import asyncio
+import collections
+import copy
+import logging
+import random
+import runpy
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+ENTITIES_DIR = (
+    Path(__file__).resolve().parent.parent / "custom_components" / "comfoclime" / "entities"
+)
+
+MAIN_UUID = "MBE0000000000001"
+DEVICES = [
+    {
+        "uuid": MAIN_UUID,
+        "modelTypeId": 20,
+        "@modelType": "ComfoClime 36",
+        "name": "ComfoClime 36",
+        "displayName": "ComfoClime 36",
+        "version": "R1.5.5",
+    },
+    {
+        "uuid": "SIT0000000000001",
+        "modelTypeId": 1,
+        "@modelType": "ComfoAirQ 350",
+        "name": "ComfoAirQ 350",
+        "displayName": "ComfoAirQ 350",
+        "version": "R1.11.0",
+    },
+    {
+        "uuid": "ENG0000000000001",
+        "modelTypeId": 222,
+        "@modelType": "ComfoHub",
+        "name": "ComfoHub",
+        "displayName": "ComfoHub",
+        "version": "R1.4.2",
+    },
+]
+
+DASHBOARD = {
+    "indoorTemperature": 22.4,
+    "outdoorTemperature": 8.7,
+    "exhaustAirFlow": 180,
+    "supplyAirFlow": 178,
+    "fanSpeed": 2,
+    "seasonProfile": 0,
+    "temperatureProfile": 0,
+    "season": 1,
+    "schedule": 0,
+    "status": 1,
+    "heatPumpStatus": 3,
+    "hpStandby": False,
+    "freeCoolingEnabled": False,
+    "caqFreeCoolingAvailable": True,
+}
+
+THERMAL_PROFILE = {
+    "season": {
+        "status": 1,
+        "season": 1,
+        "heatingThresholdTemperature": 14.0,
+        "coolingThresholdTemperature": 17.0,
+    },
+    "temperature": {"status": 1, "manualTemperature": 22.0},
+    "temperatureProfile": 0,
+    "heatingThermalProfileSeasonData": {
+        "comfortTemperature": 21.5,
+        "kneePointTemperature": 12.5,
+        "reductionDeltaTemperature": 1.5,
+    },
+    "coolingThermalProfileSeasonData": {
+        "comfortTemperature": 24.0,
+        "kneePointTemperature": 18.0,
+        "temperatureLimit": 26.0,
+    },
+}
+
+# Felder des Dashboard-PUT, die der Simulator übernimmt
+DASHBOARD_WRITABLE = (
+    "status",
+    "setPointTemperature",
+    "temperatureProfile",
+    "seasonProfile",
+    "fanSpeed",
+    "season",
+    "schedule",
+    "hpStandby",
+)
+
+
+# Register aus ComfoClimeAPI.md ohne Entity, z. B. als Fund für tools/scan.py
+EXTRA_TELEMETRY = {
+    20: {4148: 2, 4154: 2},
+    1: {119: 2, 120: 2},
+}
+EXTRA_PROPERTIES = {
+    20: {"1/1/2": 1, "1/1/4": 16, "22/1/9": 2, "23/1/3": 2, "23/1/4": 2},
+    1: {"1/1/4": 16},
+}
+
+
+def load_registers(entities_dir: Path = ENTITIES_DIR):
+    """Collect telemetry ids and property paths with their byte counts.
+
+    Returns ``(telemetry, properties)``, both mapping modelTypeId to a dict
+    of telemetry id / property path -> byte count.
+    """
+    sensors = runpy.run_path(str(entities_dir / "sensor_definitions.py"))
+    numbers = runpy.run_path(str(entities_dir / "number_definitions.py"))
+    selects = runpy.run_path(str(entities_dir / "select_definitions.py"))
+
+    telemetry = collections.defaultdict(dict)
+    for model_id, defs in sensors["CONNECTED_DEVICE_SENSORS"].items():
+        for conf in defs:
+            telemetry[model_id][conf["telemetry_id"]] = conf.get("byte_count", 2)
+
+    properties = collections.defaultdict(dict)
+    for model_id, defs in sensors["CONNECTED_DEVICE_PROPERTIES"].items():
+        for conf in defs:
+            properties[model_id][conf["path"]] = conf.get("byte_count", 2)
+    for model_id, defs in numbers["CONNECTED_DEVICE_NUMBER_PROPERTIES"].items():
+        for conf in defs:
+            properties[model_id][conf["property"]] = conf.get("byte_count", 2)
+    for model_id, defs in selects["PROPERTY_SELECT_ENTITIES"].items():
+        for conf in defs:
+            properties[model_id][conf["path"]] = 1
+
+    for model_id, registers in EXTRA_TELEMETRY.items():
+        for telemetry_id, byte_count in registers.items():
+            telemetry[model_id].setdefault(telemetry_id, byte_count)
+    for model_id, registers in EXTRA_PROPERTIES.items():
+        for path, byte_count in registers.items():
+            properties[model_id].setdefault(path, byte_count)
+    return telemetry, properties
+
+
+class SimulatedDevice:
+    """In-memory state of a ComfoClime and the devices on its ComfoNet bus."""
+
+    def __init__(self, seed: int | None = None):
+        self._random = random.Random(seed)
+        self._telemetry_sizes, self._property_sizes = load_registers()
+        self.reset()
+
+    def reset(self):
+        self.started = time.monotonic()
+        self.devices = copy.deepcopy(DEVICES)
+        self.dashboard = copy.deepcopy(DASHBOARD)
+        self.thermal_profile = copy.deepcopy(THERMAL_PROFILE)
+        self._models = {device["uuid"]: device["modelTypeId"] for device in self.devices}
+        # (uuid, telemetry_id) -> raw int; (uuid, path) -> list of bytes
+        self._telemetry = {}
+        self._properties = {}
+
+    def _model(self, device_uuid):
+        model_id = self._models.get(device_uuid)
+        if model_id is None:
+            raise web.HTTPNotFound(text=f"unknown device {device_uuid}")
+        return model_id
+
+    def ping(self):
+        return {
+            "uuid": MAIN_UUID,
+            "uptime": int(time.monotonic() - self.started),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+
+    def read_dashboard(self):
+        # Messwerte schwanken leicht wie bei einem echten Gerät
+        if self._random.random() < 0.3:
+            self.dashboard["indoorTemperature"] = round(
+                self.dashboard["indoorTemperature"] + self._random.choice((-0.1, 0.1)),
+                1,
+            )
+        if self._random.random() < 0.3:
+            self.dashboard["outdoorTemperature"] = round(
+                self.dashboard["outdoorTemperature"] + self._random.choice((-0.1, 0.1)),
+                1,
+            )
+        return self.dashboard
+
+    def write_dashboard(self, payload: dict):
+        for key in DASHBOARD_WRITABLE:
+            if payload.get(key) is not None:
+                self.dashboard[key] = payload[key]
+        if payload.get("status") is not None:
+            self.thermal_profile["temperature"]["status"] = payload["status"]
+        if payload.get("status") == 1:
+            self.dashboard.pop("setPointTemperature", None)
+        if payload.get("setPointTemperature") is not None:
+            # Der Sollwert im Dashboard ist die manuelle Temperatur im Thermalprofil
+            self.thermal_profile["temperature"]["manualTemperature"] = payload[
+                "setPointTemperature"
+            ]
+        if payload.get("temperatureProfile") is not None:
+            self.thermal_profile["temperatureProfile"] = payload["temperatureProfile"]
+
+    def write_thermal_profile(self, payload: dict):
+        def merge(target, updates):
+            for key, value in updates.items():
+                if isinstance(value, dict) and isinstance(target.get(key), dict):
+                    merge(target[key], value)
+                elif value is not None and key in target:
+                    target[key] = value
+
+        merge(self.thermal_profile, payload)
+        self.dashboard["season"] = self.thermal_profile["season"]["season"]
+        self.dashboard["temperatureProfile"] = self.thermal_profile["temperatureProfile"]
+
+    def read_telemetry(self, device_uuid: str, telemetry_id: int) -> list:
+        model_id = self._model(device_uuid)
+        byte_count = self._telemetry_sizes.get(model_id, {}).get(telemetry_id)
+        if byte_count is None:
+            raise web.HTTPNotFound(text=f"unknown telemetry {telemetry_id}")
+        key = (device_uuid, telemetry_id)
+        limit = 0x80 if byte_count == 1 else 0x8000
+        value = self._telemetry.get(key)
+        if value is None:
+            # Plausible Startwerte: 1 Byte 0..100, 2 Byte z. B. 15.0..30.0 °C
+            value = self._random.randint(0, 100 if byte_count == 1 else 300)
+        elif self._random.random() < 0.2:
+            value = max(0, min(limit - 1, value + self._random.choice((-1, 1))))
+        self._telemetry[key] = value
+        return list(value.to_bytes(byte_count, "little", signed=True))
+
+    def read_property(self, device_uuid: str, path: str) -> list:
+        model_id = self._model(device_uuid)
+        key = (device_uuid, path)
+        if key not in self._properties:
+            byte_count = self._property_sizes.get(model_id, {}).get(path)
+            if byte_count is None:
+                raise web.HTTPNotFound(text=f"unknown property {path}")
+            if byte_count > 2:
+                text = f"SIM{self._random.randrange(10**8):08d}"
+                self._properties[key] = list(text.encode().ljust(byte_count, b"\0"))
+            else:
+                self._properties[key] = [self._random.randint(0, 2)] + [0] * (
+                    byte_count - 1
+                )
+        return self._properties[key]
+
+    def write_property(self, device_uuid: str, unit: int, subunit: int, data: list):
+        self._model(device_uuid)
+        if not isinstance(data, list) or len(data) < 2:
+            raise web.HTTPBadRequest(text="expected data: [property, bytes...]")
+        path = f"{unit}/{subunit}/{data[0]}"
+        self._properties[(device_uuid, path)] = list(data[1:])
+
+
+class ComfoClimeSimulator:
+    """aiohttp application serving a SimulatedDevice with injected faults."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        timeout_delay: float = 10.0,
+        serial: bool = False,
+        seed: int | None = None,
+    ):
+        self.device = SimulatedDevice(seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.timeout_delay = timeout_delay
+        self.serial = serial
+        self._random = random.Random(seed)
+        self._lock = asyncio.Lock()
+        self._runner = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = {
+            "requests": 0,
+            "errors_injected": 0,
+            "timeouts_injected": 0,
+            "max_concurrency": 0,
+            "endpoints": collections.Counter(),
+        }
+        self._in_flight = 0
+
+    @staticmethod
+    def _endpoint(request: web.Request) -> str:
+        route = request.match_info.route.resource
+        name = route.canonical if route is not None else request.path
+        return f"{request.method} {name}"
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        if request.path.startswith("/simulator/"):
+            return await handler(request)
+
+        self.stats["requests"] += 1
+        self.stats["endpoints"][self._endpoint(request)] += 1
+        if self.serial:
+            # Das echte Gerät bearbeitet nur eine Anfrage gleichzeitig
+            async with self._lock:
+                return await self._handle(request, handler)
+        return await self._handle(request, handler)
+
+    async def _handle(self, request: web.Request, handler):
+        self._in_flight += 1
+        self.stats["max_concurrency"] = max(
+            self.stats["max_concurrency"], self._in_flight
+        )
+        try:
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            roll = self._random.random()
+            if roll < self.timeout_rate:
+                self.stats["timeouts_injected"] += 1
+                await asyncio.sleep(self.timeout_delay)
+            elif roll < self.timeout_rate + self.error_rate:
+                self.stats["errors_injected"] += 1
+                raise web.HTTPInternalServerError(text="injected error")
+            return await handler(request)
+        finally:
+            self._in_flight -= 1
+
+    def make_app(self) -> web.Application:
+        device = self.device
+        app = web.Application(middlewares=[self._middleware])
+
+        async def ping(request):
+            return web.json_response(device.ping())
+
+        def check_uuid(request):
+            if request.match_info["uuid"] != MAIN_UUID:
+                raise web.HTTPNotFound(text="unknown system uuid")
+
+        async def get_dashboard(request):
+            check_uuid(request)
+            return web.json_response(device.read_dashboard())
+
+        async def put_dashboard(request):
+            check_uuid(request)
+            device.write_dashboard(await request.json())
+            return web.json_response(device.dashboard)
+
+        async def get_devices(request):
+            check_uuid(request)
+            return web.json_response({"devices": device.devices})
+
+        async def get_thermal_profile(request):
+            check_uuid(request)
+            return web.json_response(device.thermal_profile)
+
+        async def put_thermal_profile(request):
+            check_uuid(request)
+            device.write_thermal_profile(await request.json())
+            return web.Response()
+
+        async def get_telemetry(request):
+            data = device.read_telemetry(
+                request.match_info["device"], int(request.match_info["id"])
+            )
+            return web.json_response({"data": data})
+
+        async def get_property(request):
+            info = request.match_info
+            path = f"{info['unit']}/{info['subunit']}/{info['prop']}"
+            data = device.read_property(info["device"], path)
+            return web.json_response({"data": data})
+
+        async def put_method(request):
+            info = request.match_info
+            payload = await request.json()
+            device.write_property(
+                info["device"],
+                int(info["unit"]),
+                int(info["subunit"]),
+                payload.get("data"),
+            )
+            return web.Response()
+
+        async def put_reset(request):
+            device.reset()
+            return web.Response()
+
+        async def get_stats(request):
+            return web.json_response(self.stats)
+
+        async def delete_stats(request):
+            self.reset_stats()
+            return web.Response()
+
+        app.router.add_get("/monitoring/ping", ping)
+        app.router.add_get("/system/{uuid}/dashboard", get_dashboard)
+        app.router.add_put("/system/{uuid}/dashboard", put_dashboard)
+        app.router.add_get("/system/{uuid}/devices", get_devices)
+        app.router.add_get("/system/{uuid}/thermalprofile", get_thermal_profile)
+        app.router.add_put("/system/{uuid}/thermalprofile", put_thermal_profile)
+        app.router.add_get("/device/{device}/telemetry/{id:\\d+}", get_telemetry)
+        app.router.add_get(
+            "/device/{device}/property/{unit:\\d+}/{subunit:\\d+}/{prop:\\d+}",
+            get_property,
+        )
+        app.router.add_put(
+            "/device/{device}/method/{unit:\\d+}/{subunit:\\d+}/3", put_method
+        )
+        app.router.add_put("/system/reset", put_reset)
+        app.router.add_get("/simulator/stats", get_stats)
+        app.router.add_delete("/simulator/stats", delete_stats)
+        return app
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 8080) -> str:
+        """Serve in the running event loop and return the ``host:port`` address."""
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        # Bei Port 0 wählt das Betriebssystem einen freien Port
+        return f"{host}:{self._runner.addresses[0][1]}"
+
+    async def async_stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Add the fault-injection options, shared with the benchmark tool."""
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="base response delay in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="random +/- delay in seconds"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="share of HTTP 500 responses"
+    )
+    parser.add_argument(
+        "--timeout-rate",
+        type=float,
+        default=0.0,
+        help="share of requests that hang for --timeout-delay seconds",
+    )
+    parser.add_argument("--timeout-delay", type=float, default=10.0)
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="handle one request at a time like the real device",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def simulator_from_args(args) -> ComfoClimeSimulator:
+    return ComfoClimeSimulator(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        timeout_delay=args.timeout_delay,
+        serial=args.serial,
+        seed=args.seed,
+    )
+
+
+async def _async_main(args):
+    simulator = simulator_from_args(args)
+    address = await simulator.async_start(args.host, args.port)
+    print(f"ComfoClime simulator listening on http://{address} (uuid {MAIN_UUID})")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.async_stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    add_arguments(parser)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()